@@ -11,6 +11,8 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
 import os
+import sys
+import tempfile
 from pathlib import Path
 
 import environ
@@ -55,6 +57,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "api.middleware.replica_pinning_middleware",
 ]
 
 ROOT_URLCONF = "ArticleScraper.urls"
@@ -91,6 +94,25 @@ DATABASES = {
     }
 }
 
+# Read replica
+# API list/detail/export reads go to DATABASE_REPLICA_ALIAS (a streaming replica at
+# DB_REPLICA_HOST) unless the client wrote within REPLICA_STICKY_SECONDS, or the
+# replica is unreachable or more than REPLICA_MAX_LAG_SECONDS behind (checked every
+# REPLICA_CHECK_SECONDS). Without DB_REPLICA_HOST everything uses the primary.
+
+DATABASE_REPLICA_ALIAS = env("DATABASE_REPLICA_ALIAS", default="replica")
+if env("DB_REPLICA_HOST", default=""):
+    DATABASES[DATABASE_REPLICA_ALIAS] = {
+        **DATABASES["default"],
+        "HOST": env("DB_REPLICA_HOST"),
+        "PORT": env("DB_REPLICA_PORT", default=env("DB_PORT")),
+        "TEST": {"MIRROR": "default"},
+    }
+DATABASE_ROUTERS = ["api.routers.ReplicaRouter"]
+REPLICA_MAX_LAG_SECONDS = env.float("REPLICA_MAX_LAG_SECONDS", default=10)
+REPLICA_STICKY_SECONDS = env.int("REPLICA_STICKY_SECONDS", default=15)
+REPLICA_CHECK_SECONDS = env.float("REPLICA_CHECK_SECONDS", default=5)
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -128,6 +150,94 @@ USE_TZ = False
 
 STATIC_URL = "static/"
 
+# Logging
+# https://docs.djangoproject.com/en/5.2/topics/logging/
+# Scraper logs (the "articles" loggers) are JSON lines in SCRAPER_LOG_FILE. Records
+# are queued in memory and written by one listener thread per process, with
+# size ("size") or daily ("time") rotation. The file is only opened on the
+# first record, so processes that never scrape don't create it. The test runner
+# logs to a temporary file instead of the project's log.
+
+TESTING = sys.argv[1:2] == ["test"]
+
+SCRAPER_LOG_FILE = env("SCRAPER_LOG_FILE", default=str(BASE_DIR / "scraper.log"))
+if TESTING:
+    SCRAPER_LOG_FILE = os.path.join(tempfile.gettempdir(), "scraper-test.log")
+SCRAPER_LOG_ROTATION = env("SCRAPER_LOG_ROTATION", default="size")
+SCRAPER_LOG_MAX_BYTES = env.int("SCRAPER_LOG_MAX_BYTES", default=10 * 1024 * 1024)
+SCRAPER_LOG_BACKUP_COUNT = env.int("SCRAPER_LOG_BACKUP_COUNT", default=5)
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {
+        "json": {
+            "()": "articles.log.JsonFormatter",
+        },
+    },
+    "handlers": {
+        "scraper_file": {
+            "class": "articles.log.QueueListenerHandler",
+            "filename": SCRAPER_LOG_FILE,
+            "rotation": SCRAPER_LOG_ROTATION,
+            "max_bytes": SCRAPER_LOG_MAX_BYTES,
+            "backup_count": SCRAPER_LOG_BACKUP_COUNT,
+            "formatter": "json",
+        },
+    },
+    "loggers": {
+        "articles": {
+            "handlers": ["scraper_file"],
+            "level": "INFO",
+            "propagate": False,
+        },
+    },
+}
+
+
+# Scraper memory limits
+# Rendered HTML over SCRAPER_MAX_HTML_SIZE characters is truncated or rejected
+# (SCRAPER_OVERSIZE_ACTION: "truncate" / "reject"). A browser reused across
+# scrapes is restarted when its process tree RSS exceeds
+# SCRAPER_BROWSER_MAX_RSS_MB or after SCRAPER_BROWSER_MAX_PAGES pages.
+
+SCRAPER_MAX_HTML_SIZE = env.int("SCRAPER_MAX_HTML_SIZE", default=5_000_000)
+SCRAPER_OVERSIZE_ACTION = env("SCRAPER_OVERSIZE_ACTION", default="truncate")
+SCRAPER_BROWSER_MAX_RSS_MB = env.int("SCRAPER_BROWSER_MAX_RSS_MB", default=1536)
+SCRAPER_BROWSER_MAX_PAGES = env.int("SCRAPER_BROWSER_MAX_PAGES", default=200)
+
+
+# Recrawl policy
+# With scrape_articles --recrawl, stored articles are scraped again once they are
+# older than SCRAPER_RECRAWL_AFTER_HOURS (0: never), or their domain's
+# ExtractionProfile.recrawl_hours.
+
+SCRAPER_RECRAWL_AFTER_HOURS = env.int("SCRAPER_RECRAWL_AFTER_HOURS", default=168)
+
+
+# Page cache (scrape_articles --cache)
+# Rendered pages are kept in SCRAPER_CACHE_DIR for SCRAPER_CACHE_TTL_HOURS; the
+# least recently used ones are evicted over SCRAPER_CACHE_MAX_MB (compressed).
+
+SCRAPER_CACHE_DIR = env("SCRAPER_CACHE_DIR", default=str(BASE_DIR / ".page_cache"))
+SCRAPER_CACHE_TTL_HOURS = env.float("SCRAPER_CACHE_TTL_HOURS", default=24)
+SCRAPER_CACHE_MAX_MB = env.int("SCRAPER_CACHE_MAX_MB", default=1024)
+
+
+# Pagination (admin and the API's ?page= listing)
+# Unfiltered listings use PostgreSQL's row estimate instead of COUNT(*) once the
+# table has more than ESTIMATED_COUNT_THRESHOLD rows; API_PAGE_SIZE rows per page.
+
+ESTIMATED_COUNT_THRESHOLD = env.int("ESTIMATED_COUNT_THRESHOLD", default=100_000)
+API_PAGE_SIZE = env.int("API_PAGE_SIZE", default=100)
+
+
+# Article partitions (PostgreSQL)
+# articles_article is partitioned by published_at month; partition_articles creates
+# the partitions up to ARTICLE_PARTITION_MONTHS_AHEAD months ahead.
+
+ARTICLE_PARTITION_MONTHS_AHEAD = env.int("ARTICLE_PARTITION_MONTHS_AHEAD", default=3)
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
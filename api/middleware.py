@@ -0,0 +1,51 @@
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.utils.decorators import sync_and_async_middleware
+
+from .routers import read_state
+
+# Set after a write; while present the client's reads go to the primary
+PIN_COOKIE = "replica_pin"
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+def start_request(request):
+    return read_state(pinned=PIN_COOKIE in request.COOKIES)
+
+
+def finish_request(request, response, state):
+    if state.wrote or request.method not in SAFE_METHODS:
+        response.set_cookie(
+            PIN_COOKIE,
+            "1",
+            max_age=settings.REPLICA_STICKY_SECONDS,
+            httponly=True,
+            samesite="Lax",
+        )
+    return response
+
+
+@sync_and_async_middleware
+def replica_pinning_middleware(get_response):
+    """
+    Read-your-writes for the read replica.
+
+    Each request gets its own read routing state (api.routers). A client that
+    wrote, or sent a non-safe request, reads from the primary for the next
+    REPLICA_STICKY_SECONDS, until the replica has caught up with its write.
+    """
+    if iscoroutinefunction(get_response):
+
+        async def middleware(request):
+            with start_request(request) as state:
+                response = await get_response(request)
+            return finish_request(request, response, state)
+
+    else:
+
+        def middleware(request):
+            with start_request(request) as state:
+                response = get_response(request)
+            return finish_request(request, response, state)
+
+    return middleware
@@ -0,0 +1,24 @@
+from django.conf import settings
+from rest_framework.pagination import PageNumberPagination
+
+from articles.pagination import EstimatedCountPaginator
+
+
+class EstimatedCountPagination(PageNumberPagination):
+    """
+    Page number pagination with EstimatedCountPaginator, applied only to
+    requests with ?page=, so plain list requests keep returning a JSON array.
+    """
+
+    django_paginator_class = EstimatedCountPaginator
+    page_size = settings.API_PAGE_SIZE
+    page_size_query_param = "page_size"
+    max_page_size = 1000
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.page_query_param not in request.query_params:
+            return None
+        if not queryset.ordered:
+            # Stable pages: without ORDER BY rows may move between pages
+            queryset = queryset.order_by("pk")
+        return super().paginate_queryset(queryset, request, view)
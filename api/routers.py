@@ -0,0 +1,213 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.db import DatabaseError, connections, router
+
+logger = logging.getLogger(__name__)
+
+# Seconds of replication delay reported by a PostgreSQL standby; 0 when it has
+# replayed everything it received, or when the server is not a standby
+LAG_SQL = """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+    END
+"""
+
+
+@dataclass
+class ReadState:
+    """
+    Read routing state of the current request (or other context).
+
+    replica_allowed is set by views whose reads may be served by the replica;
+    pinned (a write happened, or the client wrote recently) keeps reads on the
+    primary; used_replica records that a query was routed to the replica.
+    """
+
+    replica_allowed: bool = False
+    pinned: bool = False
+    wrote: bool = False
+    used_replica: bool = False
+
+
+_state = ContextVar("read_state", default=None)
+
+
+@contextmanager
+def read_state(pinned=False):
+    """
+    Binds a fresh ReadState to the current context (one per request).
+    """
+    state = ReadState(pinned=pinned)
+    token = _state.set(state)
+    try:
+        yield state
+    finally:
+        _state.reset(token)
+
+
+@contextmanager
+def replica_reads():
+    """
+    Lets reads in the block go to the read replica (when one is usable).
+    """
+    state = _state.get()
+    if state is None:
+        with read_state(), replica_reads() as state:
+            yield state
+        return
+    previous = state.replica_allowed
+    state.replica_allowed = True
+    try:
+        yield state
+    finally:
+        state.replica_allowed = previous
+
+
+def replica_database(model):
+    """
+    Returns the alias to read model from, as the router decides in replica_reads().
+
+    For querysets evaluated after the current context is gone (streamed
+    responses), which have to be bound with .using() up front.
+    """
+    with replica_reads():
+        return router.db_for_read(model)
+
+
+def replica_lag(alias):
+    """
+    Returns the replication lag of database alias in seconds, None when unknown.
+
+    Databases other than PostgreSQL only get a connectivity check (lag 0).
+
+    Raises:
+        DatabaseError: The database is unreachable.
+    """
+    connection = connections[alias]
+    with connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            cursor.execute(LAG_SQL)
+            lag = cursor.fetchone()[0]
+            return None if lag is None else float(lag)
+        cursor.execute("SELECT 1")
+        return 0.0
+
+
+class ReplicaMonitor:
+    """
+    Checks a replica every REPLICA_CHECK_SECONDS in a background thread, so the
+    router never waits on the replica.
+
+    The replica is available while reachable and at most REPLICA_MAX_LAG_SECONDS
+    behind; until the first check completes it is considered unavailable.
+    """
+
+    def __init__(self, alias):
+        self.alias = alias
+        self.available = False
+        self.lag = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def check(self):
+        try:
+            lag = replica_lag(self.alias)
+        except DatabaseError as e:
+            # Reconnect on the next check
+            connections[self.alias].close()
+            self._set_available(False, f"unavailable ({e})")
+            return
+        self.lag = lag
+        if lag is None or lag > settings.REPLICA_MAX_LAG_SECONDS:
+            self._set_available(False, f"lagging ({lag}s behind)")
+        else:
+            self._set_available(True, f"available ({lag:.1f}s behind)")
+
+    def mark_unavailable(self):
+        """
+        Stops routing to the replica until the next successful check.
+        """
+        self._set_available(False, "failed a query")
+
+    def _set_available(self, available, reason):
+        if available != self.available:
+            log = logger.info if available else logger.warning
+            log(f"Read replica {self.alias} {reason}")
+        self.available = available
+
+    def start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self.run, name=f"replica-monitor-{self.alias}", daemon=True
+                )
+                self._thread.start()
+
+    def run(self):
+        while True:
+            self.check()
+            time.sleep(settings.REPLICA_CHECK_SECONDS)
+
+
+_monitors = {}
+_monitors_lock = threading.Lock()
+
+
+def get_monitor(alias):
+    """
+    Returns the (started) monitor of replica alias in this process.
+    """
+    with _monitors_lock:
+        monitor = _monitors.get(alias)
+        if monitor is None:
+            monitor = _monitors[alias] = ReplicaMonitor(alias)
+    monitor.start()
+    return monitor
+
+
+class ReplicaRouter:
+    """
+    Sends reads inside replica_reads() to settings.DATABASE_REPLICA_ALIAS.
+
+    Everything else, reads of pinned requests (read-your-writes, see
+    api.middleware) and reads while the replica is unavailable or
+    lagging go to the primary. No migrations run on the replica.
+    """
+
+    def db_for_read(self, model, **hints):
+        state = _state.get()
+        if state is None or not state.replica_allowed or state.pinned:
+            return None
+        alias = settings.DATABASE_REPLICA_ALIAS
+        if alias not in settings.DATABASES or not get_monitor(alias).available:
+            return None
+        state.used_replica = True
+        return alias
+
+    def db_for_write(self, model, **hints):
+        state = _state.get()
+        if state is not None:
+            # Later reads of this request must see the write
+            state.pinned = True
+            state.wrote = True
+        return None
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # The replica holds the same data as the primary
+        pool = {"default", settings.DATABASE_REPLICA_ALIAS}
+        if obj1._state.db in pool and obj2._state.db in pool:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db == settings.DATABASE_REPLICA_ALIAS and db != "default":
+            return False
+        return None
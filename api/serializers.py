@@ -7,3 +7,20 @@ class ArticleSerializer(serializers.ModelSerializer):
     class Meta:
         model = Article
         fields = "__all__"
+
+
+class ArticleMetadataSerializer(serializers.ModelSerializer):
+    """
+    Article without its page content, for the change feed.
+    """
+
+    class Meta:
+        model = Article
+        fields = [
+            "id",
+            "title",
+            "source_url",
+            "source_domain",
+            "published_at",
+            "last_scraped_at",
+        ]
@@ -82,6 +82,22 @@ class ArticleListAPITest(APITestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.data), 2)
 
+    def test_should_paginate_when_page_is_requested(self):
+        response = self.client.get("/api/articles/?page=2&page_size=1")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["count"], 2)
+        self.assertIsNone(response.data["next"])
+        self.assertEqual(
+            [article["id"] for article in response.data["results"]],
+            [self.article2.id],
+        )
+
+    def test_should_return_404_past_last_page(self):
+        response = self.client.get("/api/articles/?page=3&page_size=1")
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
     def test_should_not_allow_post_put_delete(self):
         self.assertEqual(
             self.client.post("/api/articles/", {}).status_code,
@@ -0,0 +1,92 @@
+import json
+from datetime import datetime
+
+from django.test import TestCase
+
+from articles.models import Article
+
+
+async def read_json(response):
+    if response.streaming:
+        content = b"".join([chunk async for chunk in response.streaming_content])
+    else:
+        content = response.content
+    return json.loads(content)
+
+
+class AsyncArticleAPITest(TestCase):
+    def setUp(self):
+        self.article1 = Article.objects.create(
+            title="Ford C-Max engines",
+            html_content="<p>HTML 1</p>",
+            plain_text_content="Text 1",
+            source_url="https://site1.com/article1",
+            published_at=datetime(2025, 1, 15),
+            source_domain="site1.com",
+        )
+        self.article2 = Article.objects.create(
+            title="BMW E9 history",
+            html_content="<p>HTML 2</p>",
+            plain_text_content="Text 2",
+            source_url="https://site2.com/article2",
+            published_at=datetime(2025, 2, 20),
+            source_domain="site2.com",
+        )
+
+    async def test_should_stream_all_articles(self):
+        response = await self.async_client.get("/api/async/articles/")
+
+        self.assertEqual(response.status_code, 200)
+        data = await read_json(response)
+        self.assertEqual([a["id"] for a in data], [self.article1.id, self.article2.id])
+        self.assertEqual(data[0]["published_at"], "2025-01-15T00:00:00")
+
+    async def test_should_match_sync_list_output(self):
+        sync_response = await self.async_client.get("/api/articles/")
+        async_response = await self.async_client.get("/api/async/articles/")
+
+        self.assertEqual(await read_json(async_response), sync_response.json())
+
+    async def test_should_filter_by_source_domain(self):
+        response = await self.async_client.get("/api/async/articles/?source=site2.com")
+
+        data = await read_json(response)
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0]["source_domain"], "site2.com")
+
+    async def test_should_return_empty_list_when_no_articles(self):
+        await Article.objects.all().adelete()
+
+        response = await self.async_client.get("/api/async/articles/")
+
+        self.assertEqual(await read_json(response), [])
+
+    async def test_should_search_by_title(self):
+        response = await self.async_client.get("/api/async/articles/search/?q=bmw")
+
+        data = await read_json(response)
+        self.assertEqual([a["id"] for a in data], [self.article2.id])
+
+    async def test_should_require_search_query(self):
+        response = await self.async_client.get("/api/async/articles/search/")
+
+        self.assertEqual(response.status_code, 400)
+
+    async def test_should_return_article_details(self):
+        response = await self.async_client.get(
+            f"/api/async/articles/{self.article1.id}/"
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["title"], "Ford C-Max engines")
+
+    async def test_should_return_404_for_nonexistent_article(self):
+        response = await self.async_client.get("/api/async/articles/99999/")
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json(), {"detail": "Not found."})
+
+    async def test_should_not_allow_post(self):
+        response = await self.async_client.post("/api/async/articles/", {})
+
+        self.assertEqual(response.status_code, 405)
@@ -0,0 +1,203 @@
+import asyncio
+from datetime import datetime
+from unittest.mock import patch
+
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from articles.feed import broadcaster
+from articles.models import Article
+
+
+def create_article(name, domain="site1.com", pk=None):
+    return Article.objects.create(
+        pk=pk,
+        title=f"Article {name}",
+        html_content="<p>HTML</p>",
+        plain_text_content="Text",
+        source_url=f"https://{domain}/{name}",
+        published_at=datetime(2025, 1, 15),
+        source_domain=domain,
+    )
+
+
+class ArticleChangesAPITest(APITestCase):
+    def setUp(self):
+        self.articles = [create_article(i) for i in range(3)]
+
+    def test_should_return_articles_after_since_id_without_content(self):
+        response = self.client.get(
+            f"/api/articles/changes/?since_id={self.articles[0].id}"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.data["results"]
+        self.assertEqual([a["id"] for a in results], [a.id for a in self.articles[1:]])
+        self.assertNotIn("html_content", results[0])
+        self.assertEqual(response.data["next_since_id"], self.articles[2].id)
+
+    def test_should_page_with_limit_and_keep_cursor_when_empty(self):
+        first = self.client.get("/api/articles/changes/?limit=2").data
+        second = self.client.get(
+            f"/api/articles/changes/?since_id={first['next_since_id']}"
+        ).data
+        third = self.client.get(
+            f"/api/articles/changes/?since_id={second['next_since_id']}"
+        ).data
+
+        self.assertEqual(len(first["results"]), 2)
+        self.assertEqual(len(second["results"]), 1)
+        self.assertEqual(third["results"], [])
+        self.assertEqual(third["next_since_id"], self.articles[2].id)
+
+    def test_should_return_rows_committed_out_of_id_order(self):
+        last = self.articles[2].id
+        # last + 1 is inserted first but commits after last + 2
+        create_article("later", pk=last + 2)
+
+        first = self.client.get(f"/api/articles/changes/?since_id={last}").data
+        create_article("earlier", pk=last + 1)
+        pending = ",".join(map(str, first["pending_ids"]))
+        second = self.client.get(
+            f"/api/articles/changes/?since_id={first['next_since_id']}"
+            f"&pending={pending}"
+        ).data
+
+        self.assertEqual([a["id"] for a in first["results"]], [last + 2])
+        self.assertEqual(first["pending_ids"], [last + 1])
+        self.assertEqual([a["id"] for a in second["results"]], [last + 1])
+        self.assertEqual(second["next_since_id"], last + 2)
+        self.assertEqual(second["pending_ids"], [])
+
+    def test_should_filter_by_source_without_losing_pending_rows(self):
+        last = self.articles[2].id
+        create_article("other", domain="other.com", pk=last + 2)
+
+        response = self.client.get(
+            f"/api/articles/changes/?since_id={last}&source=site1.com"
+        )
+
+        self.assertEqual(response.data["results"], [])
+        self.assertEqual(response.data["next_since_id"], last + 2)
+        self.assertEqual(response.data["pending_ids"], [last + 1])
+
+    def test_should_reject_invalid_since_id(self):
+        response = self.client.get("/api/articles/changes/?since_id=abc")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class ArticleSavedSignalTest(TestCase):
+    @patch("articles.feed.notify_article_saved")
+    def test_should_announce_new_articles_after_commit(self, mock_notify):
+        with self.captureOnCommitCallbacks(execute=True):
+            article = create_article("new")
+            mock_notify.assert_not_called()
+        article.save()
+
+        mock_notify.assert_called_once_with(article.id, "default")
+
+
+class ArticleFeedTest(TestCase):
+    def setUp(self):
+        self.existing = create_article("existing")
+        # Tests publish themselves; the PostgreSQL listener would outlive the test
+        # database with its own connection
+        patcher = patch("articles.feed.start_listener")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def next_chunk(self, stream):
+        return await asyncio.wait_for(anext(stream), timeout=5)
+
+    async def disconnect(self, stream):
+        # Like a client disconnect: the ASGI handler cancels the response task
+        pending = asyncio.ensure_future(self.next_chunk(stream))
+        await asyncio.sleep(0.05)
+        pending.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await pending
+
+    async def test_should_replay_since_id_then_push_new_articles(self):
+        response = await self.async_client.get(
+            "/api/async/articles/feed/", {"since_id": 0}
+        )
+        stream = response.streaming_content
+
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        self.assertEqual(await self.next_chunk(stream), b": connected\n\n")
+        replayed = await self.next_chunk(stream)
+        self.assertIn(f"id: {self.existing.id}\n".encode(), replayed)
+
+        pending = asyncio.ensure_future(self.next_chunk(stream))
+        await asyncio.sleep(0.05)
+        new = await Article.objects.acreate(
+            title="Pushed",
+            html_content="<p>HTML</p>",
+            plain_text_content="Text",
+            source_url="https://site1.com/pushed",
+            published_at=datetime(2025, 1, 16),
+            source_domain="site1.com",
+        )
+        broadcaster.publish(new.id)
+
+        pushed = await pending
+        self.assertIn(f"id: {new.id}\nevent: article\n".encode(), pushed)
+        self.assertIn(b'"title":"Pushed"', pushed)
+        self.assertNotIn(b"html_content", pushed)
+
+        await self.disconnect(stream)
+        self.assertEqual(broadcaster.subscriber_count, 0)
+
+    async def test_should_push_rows_committed_out_of_id_order(self):
+        response = await self.async_client.get("/api/async/articles/feed/")
+        stream = response.streaming_content
+        self.assertEqual(await self.next_chunk(stream), b": connected\n\n")
+        last = self.existing.id
+
+        later = await Article.objects.acreate(
+            pk=last + 2,
+            title="Later",
+            html_content="<p>HTML</p>",
+            plain_text_content="Text",
+            source_url="https://site1.com/later",
+            published_at=datetime(2025, 1, 16),
+            source_domain="site1.com",
+        )
+        broadcaster.publish(later.id)
+        self.assertIn(f"id: {later.id}\n".encode(), await self.next_chunk(stream))
+        # Committed after a higher id was sent; announcing it doesn't raise
+        # the highest announced id
+        earlier = await Article.objects.acreate(
+            pk=last + 1,
+            title="Earlier",
+            html_content="<p>HTML</p>",
+            plain_text_content="Text",
+            source_url="https://site1.com/earlier",
+            published_at=datetime(2025, 1, 16),
+            source_domain="site1.com",
+        )
+        broadcaster.publish(earlier.id)
+
+        self.assertIn(f"id: {earlier.id}\n".encode(), await self.next_chunk(stream))
+        await self.disconnect(stream)
+
+    async def test_should_resume_after_last_event_id(self):
+        response = await self.async_client.get(
+            "/api/async/articles/feed/",
+            headers={"Last-Event-ID": str(self.existing.id)},
+        )
+        stream = response.streaming_content
+
+        with patch("api.views.FEED_HEARTBEAT_SECONDS", 0.01):
+            self.assertEqual(await self.next_chunk(stream), b": connected\n\n")
+            self.assertEqual(await self.next_chunk(stream), b": keep-alive\n\n")
+        await self.disconnect(stream)
+
+    async def test_should_reject_invalid_since_id(self):
+        response = await self.async_client.get(
+            "/api/async/articles/feed/", {"since_id": "-1"}
+        )
+
+        self.assertEqual(response.status_code, 400)
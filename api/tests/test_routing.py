@@ -0,0 +1,168 @@
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from django.db import OperationalError
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.test import APITestCase
+
+from api.middleware import PIN_COOKIE, replica_pinning_middleware
+from api.routers import ReplicaMonitor, ReplicaRouter, replica_reads
+from articles.models import Article
+
+
+def create_article():
+    return Article.objects.create(
+        title="Article",
+        html_content="<p>HTML</p>",
+        plain_text_content="Text",
+        source_url="https://site1.com/article",
+        published_at=datetime(2025, 1, 15),
+        source_domain="site1.com",
+    )
+
+
+# The replica alias points at the test database, so queries routed to it work
+@override_settings(DATABASE_REPLICA_ALIAS="default")
+class ReplicaRouterTest(TestCase):
+    def setUp(self):
+        self.router = ReplicaRouter()
+        self.monitor = MagicMock(available=True)
+        patcher = patch("api.routers.get_monitor", return_value=self.monitor)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_should_read_from_replica_only_inside_replica_reads(self):
+        self.assertIsNone(self.router.db_for_read(Article))
+
+        with replica_reads() as state:
+            self.assertEqual(self.router.db_for_read(Article), "default")
+
+        self.assertTrue(state.used_replica)
+
+    def test_should_read_from_primary_after_a_write(self):
+        with replica_reads():
+            self.router.db_for_write(Article)
+
+            self.assertIsNone(self.router.db_for_read(Article))
+
+    def test_should_fall_back_to_primary_when_replica_unavailable(self):
+        self.monitor.available = False
+
+        with replica_reads():
+            self.assertIsNone(self.router.db_for_read(Article))
+
+    def test_should_not_migrate_replica(self):
+        with override_settings(DATABASE_REPLICA_ALIAS="replica"):
+            self.assertFalse(self.router.allow_migrate("replica", "articles"))
+            self.assertIsNone(self.router.allow_migrate("default", "articles"))
+
+
+class ReplicaMonitorTest(TestCase):
+    def test_should_be_available_when_reachable(self):
+        monitor = ReplicaMonitor("default")
+
+        monitor.check()
+
+        self.assertTrue(monitor.available)
+        self.assertEqual(monitor.lag, 0.0)
+
+    @override_settings(REPLICA_MAX_LAG_SECONDS=10)
+    @patch("api.routers.replica_lag", return_value=30.0)
+    def test_should_be_unavailable_when_lagging(self, mock_lag):
+        monitor = ReplicaMonitor("default")
+        monitor.available = True
+
+        with self.assertLogs("api.routers", "WARNING"):
+            monitor.check()
+
+        self.assertFalse(monitor.available)
+
+    @patch("api.routers.connections")
+    @patch("api.routers.replica_lag", side_effect=OperationalError("refused"))
+    def test_should_be_unavailable_when_unreachable(self, mock_lag, mock_connections):
+        monitor = ReplicaMonitor("default")
+        monitor.available = True
+
+        with self.assertLogs("api.routers", "WARNING"):
+            monitor.check()
+
+        self.assertFalse(monitor.available)
+        mock_connections.__getitem__.return_value.close.assert_called_once()
+
+
+@override_settings(DATABASE_REPLICA_ALIAS="default", REPLICA_STICKY_SECONDS=15)
+class ReplicaPinningMiddlewareTest(TestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.reads = []
+        patcher = patch("api.routers.get_monitor")
+        patcher.start().return_value.available = True
+        self.addCleanup(patcher.stop)
+
+    def read_view(self, request):
+        with replica_reads():
+            self.reads.append(ReplicaRouter().db_for_read(Article))
+        return HttpResponse()
+
+    def write_view(self, request):
+        create_article()
+        return HttpResponse()
+
+    def test_should_pin_client_after_write(self):
+        middleware = replica_pinning_middleware(self.write_view)
+
+        response = middleware(self.factory.get("/"))
+
+        self.assertEqual(response.cookies[PIN_COOKIE]["max-age"], 15)
+
+    def test_should_read_primary_for_pinned_client(self):
+        middleware = replica_pinning_middleware(self.read_view)
+
+        response = middleware(self.factory.get("/"))
+        request = self.factory.get("/")
+        request.COOKIES[PIN_COOKIE] = "1"
+        middleware(request)
+
+        self.assertEqual(self.reads, ["default", None])
+        self.assertNotIn(PIN_COOKIE, response.cookies)
+
+
+@override_settings(DATABASE_REPLICA_ALIAS="default")
+class ReplicaViewTest(APITestCase):
+    def setUp(self):
+        create_article()
+        self.monitor = MagicMock(available=True)
+        for target in ["api.routers.get_monitor", "api.views.get_monitor"]:
+            patcher = patch(target, return_value=self.monitor)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_should_route_list_reads_to_replica(self):
+        with patch.object(
+            ReplicaRouter, "db_for_read", autospec=True, return_value="default"
+        ) as mock_read:
+            response = self.client.get("/api/articles/")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 1)
+        mock_read.assert_called()
+
+    def test_should_retry_on_primary_when_replica_query_fails(self):
+        calls = []
+
+        def list_articles(view, request, *args, **kwargs):
+            calls.append(Article.objects.all().db)
+            if len(calls) == 1:
+                raise OperationalError("replica connection lost")
+            return Response([])
+
+        with patch("api.views.ArticleListView.list", list_articles):
+            with self.assertLogs("api.views", "WARNING"):
+                response = self.client.get("/api/articles/")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(calls), 2)
+        self.monitor.mark_unavailable.assert_called_once()
@@ -1,8 +1,21 @@
 from django.urls import path
 
-from .views import ArticleDetailView, ArticleListView
+from .views import (
+    ArticleChangesView,
+    ArticleDetailView,
+    ArticleListView,
+    article_detail_async,
+    article_feed_async,
+    article_list_async,
+    article_search_async,
+)
 
 urlpatterns = [
     path("articles/", ArticleListView.as_view(), name="article-list"),
     path("articles/<int:pk>/", ArticleDetailView.as_view(), name="article-detail"),
+    path("articles/changes/", ArticleChangesView.as_view(), name="article-changes"),
+    path("async/articles/", article_list_async, name="async-article-list"),
+    path("async/articles/search/", article_search_async, name="async-article-search"),
+    path("async/articles/<int:pk>/", article_detail_async, name="async-article-detail"),
+    path("async/articles/feed/", article_feed_async, name="async-article-feed"),
 ]
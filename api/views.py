@@ -1,12 +1,56 @@
+import logging
+
+from django.conf import settings
+from django.db import OperationalError
+from django.db.models import Q
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import require_safe
 from rest_framework import generics
+from rest_framework.exceptions import ValidationError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
 
+from articles.feed import broadcaster
 from articles.models import Article
 
-from .serializers import ArticleSerializer
+from .pagination import EstimatedCountPagination
+from .routers import get_monitor, replica_database, replica_reads
+from .serializers import ArticleMetadataSerializer, ArticleSerializer
+
+logger = logging.getLogger(__name__)
+
+# Rows fetched per database round trip by the streaming async views
+STREAM_CHUNK_SIZE = 200
+# Change feed: rows per query, and idle seconds before a keep-alive comment
+FEED_BATCH_SIZE = 500
+FEED_HEARTBEAT_SECONDS = 15
+MAX_CHANGES_LIMIT = 1000
+# Ids below the feed cursor that were missing (not committed yet) are re-checked
+# until the cursor is this many ids past them
+FEED_GAP_WINDOW = 1000
+
+
+class ReplicaReadMixin:
+    """
+    Serves the view's reads from the read replica when it is usable (see
+    api.routers); a request whose replica query fails is retried on the primary.
+    """
+
+    def dispatch(self, request, *args, **kwargs):
+        with replica_reads() as state:
+            try:
+                return super().dispatch(request, *args, **kwargs)
+            except OperationalError:
+                if not state.used_replica:
+                    raise
+        logger.warning(f"Read replica query failed, retrying {request.path} on primary")
+        get_monitor(settings.DATABASE_REPLICA_ALIAS).mark_unavailable()
+        return super().dispatch(request, *args, **kwargs)
 
 
-class ArticleListView(generics.ListAPIView):
+class ArticleListView(ReplicaReadMixin, generics.ListAPIView):
     serializer_class = ArticleSerializer
+    pagination_class = EstimatedCountPagination
 
     def get_queryset(self):
         queryset = Article.objects.all()
@@ -16,6 +60,259 @@ class ArticleListView(generics.ListAPIView):
         return queryset
 
 
-class ArticleDetailView(generics.RetrieveAPIView):
+def parse_since_id(value, default=None):
+    """
+    Parses a since_id / Last-Event-ID cursor.
+
+    Raises:
+        ValueError: value is not a non-negative integer.
+    """
+    if value in (None, ""):
+        return default
+    since_id = int(value)
+    if since_id < 0:
+        raise ValueError(value)
+    return since_id
+
+
+def parse_pending(value):
+    """
+    Parses the comma-separated pending ids of a change feed cursor.
+
+    Raises:
+        ValueError: An id is not a non-negative integer, or there are too many.
+    """
+    if not value:
+        return []
+    pending = [parse_since_id(pk) for pk in value.split(",")]
+    if len(pending) > FEED_GAP_WINDOW:
+        raise ValueError(value)
+    return pending
+
+
+class FeedCursor:
+    """
+    Position in the change feed: the highest id read, and the ids below it that
+    were missing when read.
+
+    Ids are assigned on INSERT but rows become visible on COMMIT, so with
+    concurrent writers (scrape workers, ingest processes, the daemon) a row can
+    appear after rows with higher ids were read. Missing ids are re-checked on
+    every read until the cursor is FEED_GAP_WINDOW ids past them; rows that
+    commit later than that, and ids that were rolled back, are given up.
+    """
+
+    def __init__(self, last_id, pending=(), source=None):
+        self.last_id = last_id
+        self.pending = set(pending)
+        self.source = source
+
+    def queryset(self, limit):
+        condition = Q(pk__gt=self.last_id)
+        if self.pending:
+            condition |= Q(pk__in=self.pending)
+        # Not filtered by source: missing ids have to be told apart from rows
+        # of other domains
+        queryset = Article.objects.filter(condition).order_by("pk")
+        return queryset.only(*ArticleMetadataSerializer.Meta.fields)[:limit]
+
+    def advance(self, articles):
+        """
+        Moves past articles (one queryset() result) and returns those to send.
+        """
+        seen = {article.pk for article in articles}
+        high = max(seen | {self.last_id})
+        low = max(self.last_id, high - FEED_GAP_WINDOW)
+        missing = set(range(low + 1, high + 1)) - seen
+        self.pending = {
+            pk for pk in (self.pending - seen) | missing if pk > high - FEED_GAP_WINDOW
+        }
+        self.last_id = high
+        if self.source is None:
+            return list(articles)
+        return [a for a in articles if a.source_domain == self.source]
+
+
+class ArticleChangesView(generics.GenericAPIView):
+    """
+    Articles added after ?since_id= (oldest first), at most ?limit= per call.
+
+    Clients pass the returned next_since_id and pending_ids (as ?pending=1,2)
+    back to fetch the following rows; pending_ids are rows that were not
+    committed yet when read (see FeedCursor). With ?source= a call can return
+    fewer than limit rows while the cursor still advances.
+    """
+
+    serializer_class = ArticleMetadataSerializer
+
+    def get(self, request):
+        try:
+            since_id = parse_since_id(request.query_params.get("since_id"), 0)
+            pending = parse_pending(request.query_params.get("pending"))
+            limit = int(request.query_params.get("limit", FEED_BATCH_SIZE))
+        except ValueError:
+            raise ValidationError(
+                "since_id, pending and limit must be non-negative integers."
+            )
+        limit = max(1, min(limit, MAX_CHANGES_LIMIT))
+        cursor = FeedCursor(since_id, pending, request.query_params.get("source"))
+        articles = cursor.advance(list(cursor.queryset(limit)))
+        return Response(
+            {
+                "results": self.get_serializer(articles, many=True).data,
+                "next_since_id": cursor.last_id,
+                "pending_ids": sorted(cursor.pending),
+            }
+        )
+
+
+class ArticleDetailView(ReplicaReadMixin, generics.RetrieveAPIView):
     queryset = Article.objects.all()
     serializer_class = ArticleSerializer
+
+
+def render_article(article):
+    return JSONRenderer().render(ArticleSerializer(article).data)
+
+
+def stream_articles(queryset):
+    """
+    Streams queryset as a JSON array, fetching rows in chunks with the async ORM.
+
+    The worker is released while waiting for each chunk from the database, and
+    the response never holds the whole result set in memory.
+    """
+
+    async def chunks():
+        yield b"["
+        separator = b""
+        async for article in queryset.aiterator(chunk_size=STREAM_CHUNK_SIZE):
+            yield separator + render_article(article)
+            separator = b","
+        yield b"]"
+
+    return StreamingHttpResponse(chunks(), content_type="application/json")
+
+
+@require_safe
+async def article_list_async(request):
+    """
+    Async counterpart of ArticleListView (same ?source= filter and output).
+    """
+    # Bound now: the rows are read while streaming, after the view returned
+    queryset = Article.objects.using(replica_database(Article))
+    source = request.GET.get("source")
+    if source is not None:
+        queryset = queryset.filter(source_domain=source)
+    return stream_articles(queryset)
+
+
+@require_safe
+async def article_search_async(request):
+    """
+    Searches articles by title (?q=), optionally limited to a domain (?source=).
+    """
+    query = request.GET.get("q", "").strip()
+    if not query:
+        return JsonResponse({"detail": "Query parameter 'q' is required."}, status=400)
+    queryset = Article.objects.using(replica_database(Article)).filter(
+        title__icontains=query
+    )
+    source = request.GET.get("source")
+    if source is not None:
+        queryset = queryset.filter(source_domain=source)
+    return stream_articles(queryset)
+
+
+@require_safe
+async def article_detail_async(request, pk):
+    """
+    Async counterpart of ArticleDetailView.
+    """
+    try:
+        article = await Article.objects.using(replica_database(Article)).aget(pk=pk)
+    except Article.DoesNotExist:
+        return JsonResponse({"detail": "Not found."}, status=404)
+    return HttpResponse(render_article(article), content_type="application/json")
+
+
+def feed_event(article):
+    data = JSONRenderer().render(ArticleMetadataSerializer(article).data)
+    return b"id: %d\nevent: article\ndata: %s\n\n" % (article.pk, data)
+
+
+async def start_cursor(since_id, source=None):
+    """
+    Returns the FeedCursor of a stream starting after since_id (None: after the
+    newest article), with the ids missing below it pending.
+    """
+    queryset = Article.objects.order_by("-pk").values_list("pk", flat=True)
+    if since_id is not None:
+        queryset = queryset.filter(pk__lte=since_id)
+    # One query, so a row committing meanwhile is either read or left pending
+    ids = [pk async for pk in queryset[:FEED_GAP_WINDOW]]
+    last_id = since_id if since_id is not None else max(ids, default=0)
+    low = max(last_id - FEED_GAP_WINDOW, 0)
+    pending = set(range(low + 1, last_id + 1)) - set(ids)
+    return FeedCursor(last_id, pending, source)
+
+
+async def feed_events(since_id, source=None):
+    """
+    Yields Server-Sent Events for articles after since_id (None: only new ones).
+
+    The subscription starts before the first query, so rows saved meanwhile
+    are not missed; after that the database is only read when an insert was
+    announced, and idle connections get a keep-alive comment. Rows committed
+    out of id order are sent when they appear (see FeedCursor); after a
+    reconnect with Last-Event-ID only the ids missing at that point are
+    re-checked.
+    """
+    subscription = broadcaster.subscribe()
+    try:
+        cursor = await start_cursor(since_id, source)
+        yield b": connected\n\n"
+        while True:
+            announced = subscription.latest_id
+            while True:
+                articles = [a async for a in cursor.queryset(FEED_BATCH_SIZE)]
+                for article in cursor.advance(articles):
+                    yield feed_event(article)
+                if len(articles) < FEED_BATCH_SIZE:
+                    break
+            # Sleep until an article saved after the query is announced, or
+            # until any announcement while earlier ids are pending
+            while subscription.latest_id <= announced:
+                if not await subscription.wait(FEED_HEARTBEAT_SECONDS):
+                    yield b": keep-alive\n\n"
+                elif cursor.pending:
+                    break
+    finally:
+        subscription.close()
+
+
+@require_safe
+async def article_feed_async(request):
+    """
+    Pushes metadata of newly saved articles as Server-Sent Events.
+
+    Starts after ?since_id= (or the Last-Event-ID header of a reconnecting
+    EventSource); without either, only articles saved from now on are sent.
+    Optionally limited to a domain (?source=).
+    """
+    try:
+        since_id = parse_since_id(
+            request.headers.get("Last-Event-ID") or request.GET.get("since_id")
+        )
+    except ValueError:
+        return JsonResponse(
+            {"detail": "since_id must be a non-negative integer."}, status=400
+        )
+    response = StreamingHttpResponse(
+        feed_events(since_id, request.GET.get("source")),
+        content_type="text/event-stream",
+    )
+    response["Cache-Control"] = "no-cache"
+    # Don't let nginx buffer the stream
+    response["X-Accel-Buffering"] = "no"
+    return response
@@ -1,3 +1,67 @@
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
 
-# Register your models here.
+from .models import Article, ExtractionProfile
+from .pagination import EstimatedCountPaginator
+
+# Large columns never needed by the change list
+DEFERRED_FIELDS = ("html_content", "plain_text_content")
+
+
+class ArticleChangeList(ChangeList):
+    def get_queryset(self, request, exclude_parameters=None):
+        queryset = super().get_queryset(request, exclude_parameters)
+        return queryset.defer(*DEFERRED_FIELDS)
+
+
+class SourceDomainFilter(admin.SimpleListFilter):
+    """
+    Filters by the domains that have an extraction profile, instead of the
+    SELECT DISTINCT over the whole articles table the default filter runs.
+    """
+
+    title = "source domain"
+    parameter_name = "source_domain"
+
+    def lookups(self, request, model_admin):
+        domains = list(
+            ExtractionProfile.objects.order_by("source_domain").values_list(
+                "source_domain", flat=True
+            )
+        )
+        # Keep a domain given in the URL selectable
+        if self.value() and self.value() not in domains:
+            domains.append(self.value())
+        return [(domain, domain) for domain in domains]
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(source_domain=self.value())
+        return queryset
+
+
+@admin.register(Article)
+class ArticleAdmin(admin.ModelAdmin):
+    list_display = ("title", "source_domain", "published_at", "last_scraped_at")
+    list_filter = (SourceDomainFilter, "published_at")
+    ordering = ("-pk",)
+    paginator = EstimatedCountPaginator
+    # The unfiltered total would be a second COUNT(*) over the whole table
+    show_full_result_count = False
+    readonly_fields = ("content_hash", "etag", "last_modified", "last_scraped_at")
+
+    def get_changelist(self, request, **kwargs):
+        return ArticleChangeList
+
+
+@admin.register(ExtractionProfile)
+class ExtractionProfileAdmin(admin.ModelAdmin):
+    list_display = (
+        "source_domain",
+        "hits",
+        "misses",
+        "wait_selector",
+        "recrawl_hours",
+    )
+    search_fields = ("source_domain",)
+    readonly_fields = ("hits", "misses")
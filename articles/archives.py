@@ -0,0 +1,190 @@
+import gzip
+import os
+import re
+import tarfile
+import zlib
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import PurePosixPath
+from urllib.parse import urljoin
+
+HTML_SUFFIXES = (".html", ".htm")
+TAR_SUFFIXES = (".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tbz2", ".tar.xz", ".txz")
+WARC_SUFFIXES = (".warc", ".warc.gz")
+CHARSET_RE = re.compile(r"charset=[\"']?([\w.:-]+)", re.IGNORECASE)
+
+
+@dataclass
+class Document:
+    """
+    A pre-fetched page read from a directory, tarball or WARC file.
+    """
+
+    url: str
+    html: str
+    # HTTP status and fetch date, when the archive records them (WARC)
+    status: int = None
+    fetched_at: datetime = None
+
+
+def decode_html(body, content_type=""):
+    match = CHARSET_RE.search(content_type or "")
+    encoding = match.group(1) if match else "utf-8"
+    try:
+        return body.decode(encoding, errors="replace")
+    except LookupError:
+        return body.decode("utf-8", errors="replace")
+
+
+def iter_directory(path, base_url):
+    """
+    Yields .html/.htm files below path; URLs are base_url + the relative path.
+    """
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for name in sorted(files):
+            if not name.lower().endswith(HTML_SUFFIXES):
+                continue
+            full_path = os.path.join(root, name)
+            relative = PurePosixPath(*os.path.relpath(full_path, path).split(os.sep))
+            with open(full_path, "rb") as f:
+                html = decode_html(f.read())
+            yield Document(url=urljoin(base_url, str(relative)), html=html)
+
+
+def iter_tarball(path, base_url):
+    """
+    Yields .html/.htm members of a (compressed) tarball, reading it as a stream.
+    """
+    with tarfile.open(path, "r|*") as tar:
+        for member in tar:
+            if not member.isfile() or not member.name.lower().endswith(HTML_SUFFIXES):
+                continue
+            html = decode_html(tar.extractfile(member).read())
+            relative = str(PurePosixPath(member.name)).lstrip("/")
+            yield Document(url=urljoin(base_url, relative), html=html)
+
+
+def _read_headers(f):
+    headers = {}
+    for line in iter(f.readline, b""):
+        line = line.decode("utf-8", errors="replace").strip()
+        if not line:
+            break
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    return headers
+
+
+def _dechunk(body):
+    chunks = []
+    while body:
+        size_line, _, body = body.partition(b"\r\n")
+        size = int(size_line.split(b";")[0].strip() or b"0", 16)
+        if size == 0:
+            break
+        chunks.append(body[:size])
+        body = body[size + 2 :]
+    return b"".join(chunks)
+
+
+def parse_http_response(block):
+    """
+    Splits a raw HTTP response into (status, headers, decoded body bytes).
+    """
+    head, _, body = block.partition(b"\r\n\r\n")
+    lines = head.decode("iso-8859-1").split("\r\n")
+    status = int(lines[0].split()[1])
+    headers = {}
+    for line in lines[1:]:
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    if "chunked" in headers.get("transfer-encoding", "").lower():
+        body = _dechunk(body)
+    encoding = headers.get("content-encoding", "").lower()
+    if encoding in ("gzip", "x-gzip", "deflate"):
+        try:
+            # wbits=47 accepts both gzip and zlib headers
+            body = zlib.decompress(body, 47 if encoding != "deflate" else 15)
+        except zlib.error:
+            pass
+    return status, headers, body
+
+
+def parse_warc_date(value):
+    try:
+        return datetime.strptime(value[:10], "%Y-%m-%d")
+    except (TypeError, ValueError):
+        return None
+
+
+def iter_warc(path):
+    """
+    Yields HTML response and resource records of a WARC file (optionally gzipped).
+
+    Minimal streaming reader: one record is held in memory at a time, request,
+    metadata and non-HTML records are skipped.
+    """
+    opener = gzip.open if path.lower().endswith(".gz") else open
+    with opener(path, "rb") as f:
+        for line in iter(f.readline, b""):
+            if not line.strip():
+                continue
+            if not line.startswith(b"WARC/"):
+                raise ValueError(f"Invalid WARC record header {line[:50]!r} in {path}")
+            headers = _read_headers(f)
+            block = f.read(int(headers.get("content-length", 0)))
+            url = headers.get("warc-target-uri", "").strip("<>")
+            record_type = headers.get("warc-type")
+            content_type = headers.get("content-type", "")
+            is_http = content_type.startswith("application/http")
+
+            if record_type == "response" and is_http:
+                try:
+                    status, http_headers, body = parse_http_response(block)
+                except (ValueError, IndexError):
+                    continue
+                content_type = http_headers.get("content-type", "")
+            elif record_type == "resource":
+                status, body = None, block
+            else:
+                continue
+            if not url or "html" not in content_type.lower():
+                continue
+            yield Document(
+                url=url,
+                html=decode_html(body, content_type),
+                status=status,
+                fetched_at=parse_warc_date(headers.get("warc-date")),
+            )
+
+
+def iter_documents(path, base_url=None):
+    """
+    Yields Documents from a directory, tarball or WARC file.
+
+    Args:
+        path (str): Directory, .tar[.gz|.bz2|.xz] or .warc[.gz] file.
+        base_url (str): URL prefix for directory/tarball files (WARC records
+            carry their own URLs).
+
+    Raises:
+        ValueError: Missing or unsupported source, or missing base_url.
+    """
+    if not os.path.exists(path):
+        raise ValueError(f"Source {path} does not exist.")
+    name = str(path).lower()
+    if name.endswith(WARC_SUFFIXES):
+        return iter_warc(str(path))
+    if not (os.path.isdir(path) or name.endswith(TAR_SUFFIXES)):
+        raise ValueError(
+            f"Unsupported source {path}: expected a directory, tarball or WARC file."
+        )
+    if not base_url:
+        raise ValueError("A base URL is required for directories and tarballs.")
+    if not base_url.endswith("/"):
+        base_url += "/"
+    if os.path.isdir(path):
+        return iter_directory(path, base_url)
+    return iter_tarball(path, base_url)
@@ -0,0 +1,282 @@
+import json
+import logging
+import os
+import time
+
+# Selenium is imported inside the functions: only processes that actually
+# drive a browser pay for importing it.
+
+logger = logging.getLogger(__name__)
+
+
+def get_selenium_driver(page_load_strategy=None):
+    """
+    Creates webdriver Selenium in local or remote mode.
+    Mode chosen by environment variable REMOTE_SELENIUM.
+
+    Args:
+        page_load_strategy (str or None): "normal" (Selenium default), "eager" or
+            "none" (driver.get() returns without waiting, used for tabs).
+    """
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+
+    remote = os.environ.get("REMOTE_SELENIUM", "false").lower() == "true"
+    options = Options()
+    options.add_argument("--headless")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--window-size=1920,1080")
+    # Network events let us read the real HTTP status of the main document.
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    if page_load_strategy:
+        options.page_load_strategy = page_load_strategy
+    chrome_bin = os.environ.get("CHROME_BINARY")
+    if chrome_bin:
+        options.binary_location = chrome_bin
+
+    if remote:
+        selenium_url = os.environ.get("SELENIUM_URL", "http://selenium:4444/wd/hub")
+        return webdriver.Remote(command_executor=selenium_url, options=options)
+    else:
+        try:
+            from webdriver_manager.chrome import ChromeDriverManager
+        except ImportError:
+            raise RuntimeError("webdriver_manager must be installed locally!")
+        return webdriver.Chrome(
+            service=Service(ChromeDriverManager().install()), options=options
+        )
+
+
+def read_document_responses(driver):
+    """
+    Returns the main document responses logged since the last call, oldest first.
+
+    Only ``Network.responseReceived`` events of type ``Document`` are considered.
+    Returns an empty list when the log is unavailable (e.g. non-Chrome driver).
+    Note: reading the log clears it.
+
+    Returns:
+        list: DevTools Network.Response dicts (url, status, headers, ...).
+    """
+    try:
+        entries = driver.get_log("performance")
+    except Exception:
+        return []
+
+    responses = []
+    for entry in entries:
+        try:
+            message = json.loads(entry["message"])["message"]
+        except (KeyError, TypeError, ValueError):
+            continue
+        if message.get("method") != "Network.responseReceived":
+            continue
+        params = message.get("params", {})
+        if params.get("type") != "Document":
+            continue
+        response = params.get("response", {})
+        if isinstance(response.get("status"), int):
+            responses.append(response)
+    return responses
+
+
+def get_document_response(driver):
+    """
+    Returns the main document's response from Chrome's performance log.
+
+    When there are several document responses (iframes), the one matching
+    ``driver.current_url`` wins, otherwise the first one. Returns None when the
+    log is unavailable or holds no document response.
+
+    Note: reading the log clears it, so call this once per page load.
+
+    Returns:
+        dict or None: DevTools Network.Response (url, status, headers, ...).
+    """
+    responses = read_document_responses(driver)
+    if not responses:
+        return None
+    current_url = getattr(driver, "current_url", None)
+    for response in responses:
+        if response.get("url") == current_url:
+            return response
+    return responses[0]
+
+
+def get_response_header(response, name):
+    """
+    Case-insensitive header lookup in a get_document_response() result.
+    """
+    if not response:
+        return None
+    for key, value in (response.get("headers") or {}).items():
+        if key.lower() == name.lower():
+            return value
+    return None
+
+
+def get_document_status(driver):
+    """
+    Returns the HTTP status of the main document, or None when unknown.
+    """
+    response = get_document_response(driver)
+    return response["status"] if response else None
+
+
+def wait_for_page(driver, profile=None, timeout=10):
+    """
+    Waits for the page to render: for the profile's wait_selector when set,
+    otherwise a fixed 3 second delay.
+    """
+    if profile is None or not profile.wait_selector:
+        time.sleep(3)
+        return
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    try:
+        WebDriverWait(driver, timeout).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, profile.wait_selector))
+        )
+    except Exception:
+        logger.warning(
+            f"Wait condition {profile.wait_selector!r} not met for {driver.current_url}"
+        )
+
+
+def get_page_source(driver, max_size=None, oversize_action="truncate"):
+    """
+    Returns the rendered HTML, enforcing a size limit (in characters).
+
+    The size is checked in the browser first, so oversized pages are never
+    transferred whole: with oversize_action "reject" None is returned, with
+    "truncate" only the first max_size characters are fetched.
+
+    Returns:
+        tuple: (html or None, original size or None when not measured)
+    """
+    if not max_size:
+        return driver.page_source, None
+    size = driver.execute_script("return document.documentElement.outerHTML.length")
+    if not isinstance(size, int) or size <= max_size:
+        return driver.page_source, size if isinstance(size, int) else None
+    if oversize_action == "reject":
+        return None, size
+    html = driver.execute_script(
+        "return document.documentElement.outerHTML.slice(0, arguments[0])", max_size
+    )
+    return html, size
+
+
+def _process_tree_pids(pid):
+    pids = [pid]
+    for task in os.listdir(f"/proc/{pid}/task"):
+        try:
+            with open(f"/proc/{pid}/task/{task}/children") as f:
+                children = [int(child) for child in f.read().split()]
+        except OSError:
+            continue
+        for child in children:
+            pids.extend(_process_tree_pids(child))
+    return pids
+
+
+def get_browser_rss(driver):
+    """
+    Returns resident memory (bytes) of a local driver's process tree
+    (chromedriver plus the Chrome processes it started), read from /proc.
+
+    Returns None for remote drivers or where /proc is not available.
+    """
+    try:
+        root_pid = driver.service.process.pid
+    except AttributeError:
+        return None
+    if not isinstance(root_pid, int):
+        return None
+
+    rss = 0
+    try:
+        pids = _process_tree_pids(root_pid)
+    except OSError:
+        return None
+    for pid in pids:
+        try:
+            with open(f"/proc/{pid}/status") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        rss += int(line.split()[1]) * 1024
+                        break
+        except OSError:
+            continue
+    return rss
+
+
+class BrowserSession:
+    """
+    Keeps one browser alive across scrapes and recycles it when its memory
+    (RSS of the process tree) exceeds max_rss_bytes, or after max_pages pages.
+
+    Usage:
+        session = BrowserSession(max_rss_bytes=1024 * 1024 * 1024)
+        try:
+            for url in urls:
+                scrape_article_selenium(url, session=session)
+        finally:
+            session.quit()
+    """
+
+    def __init__(self, max_rss_bytes=None, max_pages=None, driver_factory=None):
+        self.max_rss_bytes = max_rss_bytes
+        self.max_pages = max_pages
+        self.driver_factory = driver_factory or get_selenium_driver
+        self.driver = None
+        self.pages = 0
+        self.recycles = 0
+        self.last_rss = None
+
+    def get_driver(self):
+        if self.driver is None:
+            self.driver = self.driver_factory()
+            self.pages = 0
+        return self.driver
+
+    def over_limits(self):
+        """
+        Measures the browser and returns why it should be recycled, or None.
+        """
+        if self.driver is None:
+            return None
+        self.last_rss = get_browser_rss(self.driver)
+        if self.max_rss_bytes and self.last_rss and self.last_rss > self.max_rss_bytes:
+            return f"RSS {self.last_rss // (1024 * 1024)} MB"
+        if self.max_pages and self.pages >= self.max_pages:
+            return f"{self.pages} pages"
+        return None
+
+    def recycle(self, reason):
+        logger.info(f"Recycling browser after {reason}")
+        self.recycles += 1
+        self.quit()
+
+    def page_done(self):
+        """
+        Called after each page; recycles the browser over the limits.
+        """
+        if self.driver is None:
+            return
+        self.pages += 1
+        reason = self.over_limits()
+        if reason:
+            self.recycle(reason)
+
+    def quit(self):
+        if self.driver is not None:
+            try:
+                self.driver.quit()
+            except Exception:
+                logger.exception("Error while quitting browser")
+            self.driver = None
@@ -0,0 +1,298 @@
+import base64
+import gzip
+
+from .extraction import (
+    BLOCK_TAGS,
+    BOILERPLATE_TAGS,
+    MAX_LINK_DENSITY,
+    MIN_BLOCK_LENGTH,
+    MIN_CONTENT_LENGTH,
+    NEGATIVE_HINTS_RE,
+    POSITIVE_HINTS_RE,
+)
+from .head import DATE_META_NAMES, DATE_META_PROPERTIES, JSON_LD_TYPE
+
+# Raw HTML capture modes of extract_in_browser()
+CAPTURE_MODES = ["none", "plain", "gzip"]
+
+# Runs the extraction steps of extract_article_fields() in the page and returns
+# only their results. The main content scoring mirrors articles/extraction.py
+# (same tags, hint patterns and thresholds, passed in as arguments) and works on
+# a detached copy of <body>, so the live page is left untouched.
+EXTRACT_SCRIPT = r"""
+const options = arguments[0];
+const done = arguments[arguments.length - 1];
+const negative = new RegExp(options.negativeHints, "i");
+const positive = new RegExp(options.positiveHints, "i");
+
+// Like BeautifulSoup's get_text(), leave out code; <noscript> holds raw markup
+// when scripts run
+const NON_TEXT_TAGS = "script, style, noscript, template";
+const textFilter = {
+    acceptNode: (node) =>
+        node.parentElement && node.parentElement.closest(NON_TEXT_TAGS)
+            ? NodeFilter.FILTER_REJECT
+            : NodeFilter.FILTER_ACCEPT,
+};
+
+function text(node, separator) {
+    const parts = [];
+    const walker = document.createTreeWalker(node, NodeFilter.SHOW_TEXT, textFilter);
+    while (walker.nextNode()) {
+        const value = walker.currentNode.nodeValue.trim();
+        if (value) parts.push(value);
+    }
+    return parts.join(separator);
+}
+
+function hints(el) {
+    return (el.id || "") + " " + (el.getAttribute("class") || "");
+}
+
+function linkDensity(el) {
+    const length = text(el, "").length;
+    if (!length) return 0;
+    let links = 0;
+    for (const a of el.querySelectorAll("a")) links += text(a, "").length;
+    return links / length;
+}
+
+function tagBonus(el) {
+    let bonus = ["ARTICLE", "MAIN"].includes(el.tagName) ? 25 : 0;
+    if (positive.test(hints(el))) bonus += 25;
+    if (negative.test(hints(el))) bonus -= 25;
+    return bonus;
+}
+
+function removeBoilerplate(root) {
+    for (const el of root.querySelectorAll(options.boilerplateTags)) el.remove();
+    for (const el of root.querySelectorAll("*")) {
+        if (!root.contains(el) || ["ARTICLE", "MAIN"].includes(el.tagName)) continue;
+        const value = hints(el);
+        if (value.trim() && negative.test(value) && !positive.test(value)) {
+            el.remove();
+        }
+    }
+}
+
+function findMainContent(root) {
+    const scores = new Map();
+    for (const block of root.querySelectorAll(options.blockTags)) {
+        const value = text(block, " ");
+        if (value.length < options.minBlockLength) continue;
+        const commas = (value.match(/,/g) || []).length;
+        const score = 1 + commas + Math.min(value.length / 100, 3);
+        let ancestor = block.parentElement;
+        for (const weight of [1, 0.5]) {
+            if (!ancestor) break;
+            if (!scores.has(ancestor)) scores.set(ancestor, tagBonus(ancestor));
+            scores.set(ancestor, scores.get(ancestor) + score * weight);
+            ancestor = ancestor.parentElement;
+        }
+    }
+    let best = null;
+    let bestScore = 0;
+    for (const [el, score] of scores) {
+        const scaled = score * (1 - linkDensity(el));
+        if (scaled > bestScore) {
+            best = el;
+            bestScore = scaled;
+        }
+    }
+    if (best && !["ARTICLE", "MAIN"].includes(best.tagName)) {
+        const container = best.closest("article, main");
+        if (container && linkDensity(container) < options.maxLinkDensity) {
+            return container;
+        }
+    }
+    return best;
+}
+
+function mainText() {
+    if (options.fullText) return text(document.documentElement, "\n");
+    if (!document.body) return "";
+    const root = document.body.cloneNode(true);
+    removeBoilerplate(root);
+    const main = findMainContent(root);
+    if (main) {
+        const value = text(main, "\n");
+        if (
+            value.length >= options.minContentLength &&
+            linkDensity(main) < options.maxLinkDensity
+        ) {
+            return value;
+        }
+    }
+    return text(root, "\n");
+}
+
+function select(selector, all) {
+    if (!selector) return all ? [] : null;
+    try {
+        return all
+            ? Array.from(document.querySelectorAll(selector))
+            : document.querySelector(selector);
+    } catch (e) {
+        return all ? [] : null;
+    }
+}
+
+function profileResult() {
+    const result = {title: null, body: null, date_text: null};
+    const title = select(options.titleSelector, false);
+    if (title) result.title = text(title, " ") || null;
+    const body = select(options.bodySelector, true)
+        .map((el) => text(el, "\n"))
+        .filter((value) => value);
+    if (body.length) result.body = body.join("\n");
+    const date = select(options.dateSelector, false);
+    if (date) {
+        result.date_text =
+            (options.dateAttribute
+                ? date.getAttribute(options.dateAttribute)
+                : text(date, "")) || null;
+    }
+    return result;
+}
+
+function metaDate() {
+    for (const meta of document.querySelectorAll("meta")) {
+        const content = meta.getAttribute("content");
+        if (
+            content &&
+            (options.dateMetaProperties.includes(meta.getAttribute("property")) ||
+                options.dateMetaNames.includes(meta.getAttribute("name")))
+        ) {
+            return content;
+        }
+    }
+    return null;
+}
+
+function timeValue() {
+    for (const time of document.querySelectorAll("time")) {
+        const value = text(time, "") || time.getAttribute("datetime");
+        if (value) return value;
+    }
+    return null;
+}
+
+async function compress(html) {
+    const stream = new Blob([html]).stream().pipeThrough(new CompressionStream("gzip"));
+    const bytes = new Uint8Array(await new Response(stream).arrayBuffer());
+    let binary = "";
+    for (let i = 0; i < bytes.length; i += 0x8000) {
+        binary += String.fromCharCode.apply(null, bytes.subarray(i, i + 0x8000));
+    }
+    return btoa(binary);
+}
+
+async function extract() {
+    const titleTag = document.querySelector("title");
+    const navigation = performance.getEntriesByType("navigation")[0];
+    const result = {
+        title: titleTag ? titleTag.textContent.trim() || null : null,
+        headings: Array.from(document.querySelectorAll("h1, h2")).map((h) =>
+            text(h, " ")
+        ),
+        meta_date: metaDate(),
+        json_ld: Array.from(
+            document.querySelectorAll(`script[type="${options.jsonLdType}"]`)
+        ).map((script) => script.textContent),
+        time: timeValue(),
+        profile: profileResult(),
+        text: mainText(),
+        page_length: options.fullText
+            ? null
+            : text(document.documentElement, "\n").length,
+        status: (navigation && navigation.responseStatus) || null,
+        html: null,
+        html_gzip: null,
+        size: null,
+    };
+    if (options.capture !== "none") {
+        let html = document.documentElement.outerHTML;
+        result.size = html.length;
+        if (options.maxSize && html.length > options.maxSize) {
+            html =
+                options.oversizeAction === "reject"
+                    ? null
+                    : html.slice(0, options.maxSize);
+        }
+        if (html !== null && options.capture === "gzip") {
+            result.html_gzip = await compress(html);
+        } else {
+            result.html = html;
+        }
+    }
+    return result;
+}
+
+extract().then(done, (error) => done({error: String(error)}));
+"""
+
+
+def extract_in_browser(
+    driver,
+    profile=None,
+    full_text=False,
+    capture_html="gzip",
+    max_size=None,
+    oversize_action="truncate",
+):
+    """
+    Runs the extraction in the rendered page and returns its compact result.
+
+    Instead of the whole serialized DOM (driver.page_source) only the title,
+    headings, date candidates (meta tags, JSON-LD scripts, first <time>), the
+    profile selector matches and the article text are transferred, so remote
+    browsers send a fraction of the data and Python parses no HTML at all.
+
+    Args:
+        driver: Selenium webdriver with the page loaded.
+        profile (CompiledProfile or None): Selectors to run in the page.
+        full_text (bool): Return the text of the whole page.
+        capture_html (str): Raw HTML to bring along: "none", "plain", or "gzip"
+            (compressed in the browser with CompressionStream, base64 encoded).
+        max_size (int or None): Truncate or reject (oversize_action) captured
+            HTML longer than this many characters.
+
+    Returns:
+        dict: title, headings, meta_date, json_ld (script texts), time,
+        profile (title/body/date_text), text, page_length (length of the whole
+        page text, None with full_text), status (navigation timing, None when
+        unknown), html (None when not captured or rejected) and size (HTML
+        length in the browser, None when not captured).
+
+    Raises:
+        RuntimeError: The script failed in the page.
+    """
+    options = {
+        "capture": capture_html,
+        "fullText": full_text,
+        "maxSize": max_size,
+        "oversizeAction": oversize_action,
+        "titleSelector": getattr(profile, "title_selector", ""),
+        "bodySelector": getattr(profile, "body_selector", ""),
+        "dateSelector": getattr(profile, "date_selector", ""),
+        "dateAttribute": getattr(profile, "date_attribute", ""),
+        "boilerplateTags": ", ".join(BOILERPLATE_TAGS),
+        "blockTags": ", ".join(BLOCK_TAGS),
+        "negativeHints": NEGATIVE_HINTS_RE.pattern,
+        "positiveHints": POSITIVE_HINTS_RE.pattern,
+        "minBlockLength": MIN_BLOCK_LENGTH,
+        "minContentLength": MIN_CONTENT_LENGTH,
+        "maxLinkDensity": MAX_LINK_DENSITY,
+        "dateMetaProperties": DATE_META_PROPERTIES,
+        "dateMetaNames": DATE_META_NAMES,
+        "jsonLdType": JSON_LD_TYPE,
+    }
+    result = driver.execute_async_script(EXTRACT_SCRIPT, options)
+    if not isinstance(result, dict) or "error" in result:
+        error = result.get("error") if isinstance(result, dict) else result
+        raise RuntimeError(f"In-browser extraction failed: {error}")
+
+    html_gzip = result.pop("html_gzip", None)
+    if html_gzip:
+        result["html"] = gzip.decompress(base64.b64decode(html_gzip)).decode("utf-8")
+    return result
@@ -0,0 +1,142 @@
+import re
+
+# Elements that never carry article text
+BOILERPLATE_TAGS = [
+    "script",
+    "style",
+    "noscript",
+    "template",
+    "svg",
+    "iframe",
+    "form",
+    "button",
+    "nav",
+    "header",
+    "footer",
+    "aside",
+]
+# Hint words only count at the start of a class/id name part ("site-header",
+# "nav_main", "comments"), so "subheader" or "canvas" don't match. The pattern
+# is also used by the in-browser extraction (JavaScript RegExp).
+NEGATIVE_HINTS_RE = re.compile(
+    r"(?<![a-z])(?:cookie|consent|banner|breadcrumb|comment|footer|header|menu|nav"
+    r"|newsletter|popup|promo|related|share|sidebar|social|sponsor|advert"
+    r"|ads?(?![a-z])|polecane)",
+    re.IGNORECASE,
+)
+POSITIVE_HINTS_RE = re.compile(
+    r"article|content|entry|main|post|story|text|body|tresc", re.IGNORECASE
+)
+BLOCK_TAGS = ["p", "pre", "blockquote", "li", "h2", "h3", "td"]
+
+MIN_BLOCK_LENGTH = 25
+MIN_CONTENT_LENGTH = 140
+MAX_LINK_DENSITY = 0.5
+
+
+def _hints(tag):
+    return " ".join([tag.get("id") or "", " ".join(tag.get("class") or [])])
+
+
+def remove_boilerplate(soup):
+    """
+    Removes navigation, banners, scripts and similar boilerplate from soup (in place).
+    """
+    for tag in soup.find_all(BOILERPLATE_TAGS):
+        tag.decompose()
+    for tag in soup.find_all(True):
+        if tag.decomposed or tag.name in ("html", "body", "article", "main"):
+            continue
+        hints = _hints(tag)
+        if (
+            hints.strip()
+            and NEGATIVE_HINTS_RE.search(hints)
+            and not POSITIVE_HINTS_RE.search(hints)
+        ):
+            tag.decompose()
+
+
+def link_density(tag, text_length=None):
+    if text_length is None:
+        text_length = len(tag.get_text(strip=True))
+    if not text_length:
+        return 0.0
+    link_length = sum(len(a.get_text(strip=True)) for a in tag.find_all("a"))
+    return link_length / text_length
+
+
+def _tag_bonus(tag):
+    bonus = 0.0
+    if tag.name in ("article", "main"):
+        bonus += 25
+    hints = _hints(tag)
+    if POSITIVE_HINTS_RE.search(hints):
+        bonus += 25
+    if NEGATIVE_HINTS_RE.search(hints):
+        bonus -= 25
+    return bonus
+
+
+def find_main_content(soup):
+    """
+    Returns the element most likely to hold the article body, or None.
+
+    Text blocks (paragraphs, list items, ...) are scored by length and comma
+    count; each score is added to the block's parent and half of it to the
+    grandparent. Containers get a bonus for <article>/<main> tags and
+    content-like class/id names, and the final score is scaled down by the
+    container's link density, so menus and "related articles" lists lose.
+    """
+    scores = {}
+    for block in soup.find_all(BLOCK_TAGS):
+        text = block.get_text(" ", strip=True)
+        if len(text) < MIN_BLOCK_LENGTH:
+            continue
+        score = 1 + text.count(",") + min(len(text) / 100, 3)
+        for ancestor, weight in zip(block.parents, (1, 0.5)):
+            if ancestor.name in (None, "[document]"):
+                break
+            if id(ancestor) not in scores:
+                scores[id(ancestor)] = [ancestor, _tag_bonus(ancestor)]
+            scores[id(ancestor)][1] += score * weight
+
+    best, best_score = None, 0.0
+    for tag, score in scores.values():
+        score *= 1 - link_density(tag)
+        if score > best_score:
+            best, best_score = tag, score
+
+    # Body split into several sections: take the enclosing <article>/<main>
+    if best is not None and best.name not in ("article", "main"):
+        container = best.find_parent(["article", "main"])
+        if container is not None and link_density(container) < MAX_LINK_DENSITY:
+            return container
+    return best
+
+
+def extract_main_text(soup, full_text=False):
+    """
+    Extracts plain text of the article body, skipping page boilerplate.
+
+    Note: boilerplate is removed from soup in place, so call this after any
+    extraction step that needs the whole document (title, date).
+
+    Args:
+        soup (BeautifulSoup): Parsed page.
+        full_text (bool): Return the text of the whole page instead.
+
+    Returns:
+        str: Newline separated plain text.
+    """
+    if full_text:
+        return soup.get_text(separator="\n", strip=True)
+
+    remove_boilerplate(soup)
+    main = find_main_content(soup)
+    if main is not None:
+        text = main.get_text(separator="\n", strip=True)
+        if len(text) >= MIN_CONTENT_LENGTH and link_density(main) < MAX_LINK_DENSITY:
+            return text
+
+    # No clear content block: use what's left of the page after boilerplate removal
+    return (soup.body or soup).get_text(separator="\n", strip=True)
@@ -0,0 +1,179 @@
+import asyncio
+import logging
+import select
+import threading
+import time
+
+from django.db import connection, connections, transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .models import Article
+
+logger = logging.getLogger(__name__)
+
+# PostgreSQL NOTIFY channel; the payload is the new article's id
+CHANNEL = "article_feed"
+# Seconds the listener blocks in select(), and waits before reconnecting
+LISTEN_TIMEOUT = 5.0
+
+
+class Subscription:
+    """
+    Wake-up signal of one feed consumer, bound to its event loop.
+
+    Notifications are coalesced: the consumer is woken once per burst and then
+    reads the rows after its last id from the database, so nothing is lost when
+    it falls behind. latest_id is the highest id announced so far.
+    """
+
+    def __init__(self, broadcaster, loop):
+        self.broadcaster = broadcaster
+        self.loop = loop
+        self.latest_id = 0
+        self._event = asyncio.Event()
+
+    def notify(self, article_id):
+        # Runs in the subscriber's event loop
+        self.latest_id = max(self.latest_id, article_id)
+        self._event.set()
+
+    async def wait(self, timeout):
+        """
+        Waits up to timeout seconds for a notification; True when one arrived.
+        """
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout)
+        except TimeoutError:
+            return False
+        self._event.clear()
+        return True
+
+    def close(self):
+        self.broadcaster.unsubscribe(self)
+
+
+class Broadcaster:
+    """
+    In-process fan-out of "article saved" notifications to feed subscribers.
+
+    publish() is thread-safe and may be called from any thread (the ORM signal
+    handler, the PostgreSQL listener thread).
+    """
+
+    def __init__(self):
+        self._subscribers = set()
+        self._lock = threading.Lock()
+
+    def subscribe(self):
+        """
+        Registers a subscriber for the running event loop.
+        """
+        subscription = Subscription(self, asyncio.get_running_loop())
+        with self._lock:
+            self._subscribers.add(subscription)
+        if connection.vendor == "postgresql":
+            start_listener()
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def publish(self, article_id):
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.notify, article_id)
+            except RuntimeError:
+                # Event loop closed without unsubscribing
+                self.unsubscribe(subscription)
+
+    @property
+    def subscriber_count(self):
+        with self._lock:
+            return len(self._subscribers)
+
+
+broadcaster = Broadcaster()
+
+
+def notify_article_saved(article_id, using="default"):
+    """
+    Announces a newly committed article to feed subscribers.
+
+    On PostgreSQL a NOTIFY reaches every process listening (API workers), as
+    the article is usually saved by a scraper process; elsewhere only
+    subscribers in this process are notified.
+    """
+    db = connections[using]
+    if db.vendor == "postgresql":
+        with db.cursor() as cursor:
+            cursor.execute("SELECT pg_notify(%s, %s)", [CHANNEL, str(article_id)])
+    else:
+        broadcaster.publish(article_id)
+
+
+@receiver(post_save, sender=Article)
+def article_saved(sender, instance, created, using, **kwargs):
+    if created:
+        # Subscribers read the row, so only announce it once it is visible
+        transaction.on_commit(
+            lambda: notify_article_saved(instance.pk, using), using=using
+        )
+
+
+class _Listener(threading.Thread):
+    """
+    Listens on CHANNEL over a dedicated PostgreSQL connection and publishes
+    notifications to the broadcaster.
+    """
+
+    def __init__(self):
+        super().__init__(name="article-feed-listener", daemon=True)
+
+    def run(self):
+        while True:
+            try:
+                self.listen()
+            except Exception:
+                logger.exception("Article feed listener failed, reconnecting")
+            # Reconnect after errors, without hammering a database that is down
+            time.sleep(LISTEN_TIMEOUT)
+
+    def listen(self):
+        db = connections["default"]
+        raw = db.get_new_connection(db.get_connection_params())
+        try:
+            raw.autocommit = True
+            with raw.cursor() as cursor:
+                cursor.execute(f"LISTEN {CHANNEL}")
+            logger.info(f"Listening for new articles on channel {CHANNEL}")
+            while True:
+                if select.select([raw], [], [], LISTEN_TIMEOUT) == ([], [], []):
+                    continue
+                raw.poll()
+                while raw.notifies:
+                    notification = raw.notifies.pop(0)
+                    try:
+                        broadcaster.publish(int(notification.payload))
+                    except ValueError:
+                        continue
+        finally:
+            raw.close()
+
+
+_listener = None
+_listener_lock = threading.Lock()
+
+
+def start_listener():
+    """
+    Starts the PostgreSQL listener thread of this process (once).
+    """
+    global _listener
+    with _listener_lock:
+        if _listener is None:
+            _listener = _Listener()
+            _listener.start()
@@ -0,0 +1,137 @@
+import json
+from dataclasses import dataclass
+from html.parser import HTMLParser
+
+# Meta tags carrying the publication date (checked by extract_date_text() too)
+DATE_META_PROPERTIES = ["article:published_time", "og:published_time", "datePublished"]
+DATE_META_NAMES = ["date", "publishdate", "pubdate"]
+JSON_LD_TYPE = "application/ld+json"
+
+# Elements allowed in <head>; any other start tag means body content began
+HEAD_TAGS = {
+    "html",
+    "head",
+    "title",
+    "meta",
+    "link",
+    "base",
+    "script",
+    "style",
+    "noscript",
+    "template",
+}
+CHUNK_SIZE = 16 * 1024
+
+
+@dataclass
+class HeadMetadata:
+    """
+    Metadata read from the <head> of a page; values are None when not found.
+    """
+
+    title: str = None
+    canonical_url: str = None
+    # First publication date meta tag / JSON-LD datePublished, unparsed
+    meta_date: str = None
+    json_ld_date: str = None
+
+    @property
+    def date_text(self):
+        return self.meta_date or self.json_ld_date
+
+
+def json_ld_date(text):
+    """
+    Returns the first datePublished of a JSON-LD script, or None.
+
+    Handles top-level lists and @graph containers; invalid JSON is ignored.
+    """
+    try:
+        data = json.loads(text, strict=False)
+    except ValueError:
+        return None
+
+    pending = [data]
+    while pending:
+        item = pending.pop(0)
+        if isinstance(item, list):
+            pending.extend(item)
+        elif isinstance(item, dict):
+            value = item.get("datePublished")
+            if isinstance(value, str) and value.strip():
+                return value.strip()
+            if "@graph" in item:
+                pending.append(item["@graph"])
+    return None
+
+
+class _HeadDone(Exception):
+    pass
+
+
+class _HeadParser(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.metadata = HeadMetadata()
+        self._title = None
+        self._json_ld = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag not in HEAD_TAGS:
+            raise _HeadDone
+        attrs = dict(attrs)
+        metadata = self.metadata
+        if tag == "title" and metadata.title is None:
+            self._title = []
+        elif tag == "meta" and metadata.meta_date is None:
+            content = attrs.get("content")
+            if content and (
+                attrs.get("property") in DATE_META_PROPERTIES
+                or attrs.get("name") in DATE_META_NAMES
+            ):
+                metadata.meta_date = content
+        elif tag == "link" and metadata.canonical_url is None:
+            rel = (attrs.get("rel") or "").lower().split()
+            if "canonical" in rel and attrs.get("href"):
+                metadata.canonical_url = attrs["href"].strip()
+        elif tag == "script" and (attrs.get("type") or "").lower() == JSON_LD_TYPE:
+            self._json_ld = []
+
+    def handle_endtag(self, tag):
+        if tag in ("head", "body"):
+            raise _HeadDone
+        if tag == "title" and self._title is not None:
+            self.metadata.title = "".join(self._title).strip() or None
+            self._title = None
+        elif tag == "script" and self._json_ld is not None:
+            if self.metadata.json_ld_date is None:
+                self.metadata.json_ld_date = json_ld_date("".join(self._json_ld))
+            self._json_ld = None
+
+    def handle_data(self, data):
+        if self._title is not None:
+            self._title.append(data)
+        elif self._json_ld is not None:
+            self._json_ld.append(data)
+
+
+def parse_head(html_content):
+    """
+    Reads title, canonical URL and publication dates from the page head.
+
+    The raw HTML is tokenized in chunks and parsing stops at </head> or the
+    first body element, so the cost does not grow with the page size.
+
+    Args:
+        html_content (str): Page HTML.
+
+    Returns:
+        HeadMetadata
+    """
+    parser = _HeadParser()
+    try:
+        for start in range(0, len(html_content), CHUNK_SIZE):
+            parser.feed(html_content[start : start + CHUNK_SIZE])
+    except _HeadDone:
+        pass
+    return parser.metadata
@@ -0,0 +1,218 @@
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+from datetime import datetime
+from logging.handlers import (
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+    TimedRotatingFileHandler,
+)
+
+# Extra record attributes copied into JSON records when present,
+# e.g. logger.info("...", extra={"url": url, "phases": {...}})
+STRUCTURED_FIELDS = (
+    "url",
+    "domain",
+    "outcome",
+    "status",
+    "phases",
+    "peak_memory",
+    "throttle",
+    "cache",
+    "daemon",
+)
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formats records as one JSON object per line.
+    """
+
+    def format(self, record):
+        data = {
+            "time": datetime.fromtimestamp(record.created).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "worker": f"{record.process}:{record.threadName}",
+            "message": record.getMessage(),
+        }
+        for field in STRUCTURED_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                data[field] = value
+        if record.exc_info:
+            data["exception"] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+class QueueListenerHandler(QueueHandler):
+    """
+    Non-blocking handler: records are put on an in-memory queue and written to a
+    rotating log file by a single listener thread, off the scraping hot path.
+
+    Args:
+        filename (str): Log file path (opened on the first record).
+        rotation (str): "size" (max_bytes/backup_count) or "time" (when/backup_count).
+        max_bytes (int): Rotate when the file would exceed this size.
+        backup_count (int): Rotated files to keep.
+        when (str): TimedRotatingFileHandler interval for time-based rotation.
+    """
+
+    def __init__(
+        self,
+        filename,
+        rotation="size",
+        max_bytes=10 * 1024 * 1024,
+        backup_count=5,
+        when="midnight",
+        encoding="utf-8",
+    ):
+        super().__init__(queue.SimpleQueue())
+        if rotation == "time":
+            self.target = TimedRotatingFileHandler(
+                filename,
+                when=when,
+                backupCount=backup_count,
+                encoding=encoding,
+                delay=True,
+            )
+        elif rotation == "size":
+            self.target = RotatingFileHandler(
+                filename,
+                maxBytes=max_bytes,
+                backupCount=backup_count,
+                encoding=encoding,
+                delay=True,
+            )
+        else:
+            raise ValueError(f"Unknown log rotation {rotation!r}, use size or time.")
+        self.listeners = []
+        self._owner_pid = None
+        self._start_lock = threading.Lock()
+
+    def setFormatter(self, fmt):
+        # Formatting happens in the listener thread
+        self.target.setFormatter(fmt)
+
+    def prepare(self, record):
+        # Only merge args into the message here; JSON formatting and tracebacks
+        # are left to the listener thread.
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def emit(self, record):
+        if not self.listeners:
+            self.start()
+        super().emit(record)
+
+    def start(self):
+        with self._start_lock:
+            if not self.listeners:
+                self._owner_pid = os.getpid()
+                self.add_listener(self.queue)
+                atexit.register(self.stop)
+
+    def add_listener(self, log_queue):
+        listener = QueueListener(log_queue, self.target, respect_handler_level=True)
+        listener.start()
+        self.listeners.append(listener)
+        return listener
+
+    def remove_listener(self, listener):
+        """
+        Stops listener after it has written the records already queued.
+        """
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+            if self._owner_pid == os.getpid():
+                listener.stop()
+
+    def stop(self):
+        # A forked child inherits the listeners but not their threads; stopping
+        # them there would put a stop sentinel on the parent's worker queue.
+        if self._owner_pid == os.getpid():
+            for listener in self.listeners:
+                listener.stop()
+            self.target.close()
+        self.listeners = []
+
+    def close(self):
+        self.stop()
+        super().close()
+
+
+def get_queue_handler(logger_name="articles"):
+    for handler in logging.getLogger(logger_name).handlers:
+        if isinstance(handler, QueueListenerHandler):
+            return handler
+    return None
+
+
+class WorkerLogQueue:
+    """
+    Multiprocessing queue for worker processes' log records, drained by a
+    listener of this process' QueueListenerHandler. queue is None when the
+    logger has no such handler.
+
+    Pass queue to configure_worker_logging() in the pool initializer, so only one
+    process writes (and rotates) the log file, and close() the handle once the
+    pool has shut down.
+    """
+
+    def __init__(self, handler=None):
+        self.handler = handler
+        self.queue = None
+        self.listener = None
+        if handler is not None:
+            import multiprocessing
+
+            handler.start()
+            self.queue = multiprocessing.Queue()
+            self.listener = handler.add_listener(self.queue)
+
+    def close(self):
+        """
+        Writes the remaining records, then stops the listener thread and the queue.
+        """
+        if self.listener is None:
+            return
+        self.handler.remove_listener(self.listener)
+        self.listener = None
+        self.queue.close()
+        self.queue.join_thread()
+
+
+def create_worker_log_queue(logger_name="articles"):
+    """
+    Returns a WorkerLogQueue for the logger's QueueListenerHandler.
+    """
+    return WorkerLogQueue(get_queue_handler(logger_name))
+
+
+def configure_worker_logging(log_queue, logger_name="articles"):
+    """
+    Sends the worker process' records to the parent's queue instead of the file.
+    """
+    if log_queue is None:
+        return
+    logger = logging.getLogger(logger_name)
+    for handler in logger.handlers[:]:
+        logger.removeHandler(handler)
+    logger.addHandler(QueueHandler(log_queue))
+
+
+def setup_worker_process(log_queue=None):
+    """
+    Process pool initializer: sets up Django and routes logs to the parent.
+    """
+    import django
+
+    django.setup()
+    configure_worker_logging(log_queue)
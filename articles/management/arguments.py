@@ -0,0 +1,13 @@
+from datetime import datetime
+
+from django.core.management.base import CommandError
+
+
+def parse_date(value):
+    """
+    Argument type for YYYY-MM-DD dates of management commands.
+    """
+    try:
+        return datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        raise CommandError(f"Invalid date {value!r}, expected YYYY-MM-DD.")
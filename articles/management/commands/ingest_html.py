@@ -0,0 +1,224 @@
+import os
+import tarfile
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from urllib.parse import urlparse
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError, connections, transaction
+
+from articles.archives import iter_documents
+from articles.feed import notify_article_saved
+from articles.log import create_worker_log_queue, setup_worker_process
+from articles.models import Article
+from articles.profiles import get_profile, load_profiles, record_profile_result
+from articles.recrawl import content_hash
+from articles.scraper import extract_article_fields
+
+
+def extract_document(row):
+    """
+    Process pool task: runs extraction for one (url, html, profile, full_text,
+    check_error_page) row.
+    """
+    url, html_content, profile, full_text, check_error_page = row
+    return extract_article_fields(
+        html_content,
+        url,
+        profile=profile,
+        full_text=full_text,
+        check_error_page=check_error_page,
+    )
+
+
+class Command(BaseCommand):
+    help = (
+        "Import pre-fetched HTML pages from a directory, tarball or WARC file "
+        "into articles, without a browser."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "source",
+            help="Directory, .tar[.gz|.bz2|.xz] or .warc[.gz] file.",
+        )
+        parser.add_argument(
+            "--base-url",
+            help="URL prefix of the files in a directory or tarball "
+            "(e.g. https://example.com/); WARC records carry their own URLs.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Extraction processes (default: CPU count).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Documents extracted and inserted per batch.",
+        )
+        parser.add_argument(
+            "--full-text",
+            action="store_true",
+            help="Store text of the whole page instead of the article body only.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            documents = iter_documents(options["source"], options["base_url"])
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        load_profiles()
+
+        self.seen = set()
+        self.stats = Counter()
+        log_queue = create_worker_log_queue()
+        try:
+            with ProcessPoolExecutor(
+                max_workers=options["workers"],
+                initializer=setup_worker_process,
+                initargs=(log_queue.queue,),
+            ) as pool:
+                # Start the workers before queries are made, so forked workers
+                # don't inherit (and later close) the parent's database connection
+                connections.close_all()
+                pool.submit(int).result()
+
+                batch = []
+                for document in self.read(documents, options["source"]):
+                    batch.append(document)
+                    if len(batch) >= options["batch_size"]:
+                        self.process_batch(pool, batch, options)
+                        batch = []
+                if batch:
+                    self.process_batch(pool, batch, options)
+        finally:
+            log_queue.close()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Read {self.stats['read']} document(s). "
+                f"Created {self.stats['created']}, "
+                f"duplicates {self.stats['duplicate']}, "
+                f"error pages {self.stats['error_page']}, "
+                f"too large {self.stats['too_large']}, "
+                f"rejected by extraction {self.stats['rejected']}."
+            )
+        )
+
+    def read(self, documents, source):
+        """
+        Iterates documents, reporting unreadable or corrupt archives as command
+        errors (archives are read lazily, so they only surface here).
+        """
+        try:
+            yield from documents
+        except (OSError, EOFError, ValueError, tarfile.TarError) as e:
+            raise CommandError(f"Cannot read {source}: {e}")
+
+    def process_batch(self, pool, batch, options):
+        self.stats["read"] += len(batch)
+        documents = {}
+        for document in batch:
+            if document.url in self.seen:
+                self.stats["duplicate"] += 1
+                continue
+            self.seen.add(document.url)
+            documents[document.url] = document
+
+        existing = set(
+            Article.objects.filter(source_url__in=documents).values_list(
+                "source_url", flat=True
+            )
+        )
+        rows = []
+        for url, document in documents.items():
+            if url in existing:
+                self.stats["duplicate"] += 1
+            elif document.status is not None and document.status >= 400:
+                self.stats["error_page"] += 1
+            elif self.check_size(document):
+                rows.append(
+                    (
+                        url,
+                        document.html,
+                        get_profile(urlparse(url).netloc),
+                        options["full_text"],
+                        document.status is None,
+                    )
+                )
+
+        chunksize = max(1, len(rows) // (options["workers"] * 4))
+        articles = []
+        profile_results = Counter()
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        results = pool.map(extract_document, rows, chunksize=chunksize)
+        for (url, html_content, profile, _, _), fields in zip(rows, results):
+            if fields is None:
+                self.stats["rejected"] += 1
+                continue
+            if profile is not None:
+                profile_results[(profile, fields["profile_hit"])] += 1
+            articles.append(
+                Article(
+                    title=fields["title"],
+                    html_content=html_content,
+                    plain_text_content=fields["plain_text_content"],
+                    source_url=url,
+                    published_at=fields["published_at"]
+                    or documents[url].fetched_at
+                    or today,
+                    source_domain=urlparse(url).netloc,
+                    content_hash=content_hash(
+                        fields["title"], fields["plain_text_content"]
+                    ),
+                    last_scraped_at=documents[url].fetched_at,
+                )
+            )
+
+        self.save(articles)
+        for (profile, hit), count in profile_results.items():
+            record_profile_result(profile, hit, count)
+        self.stdout.write(
+            f"Read {self.stats['read']} document(s), created {self.stats['created']}"
+        )
+
+    def check_size(self, document):
+        max_size = settings.SCRAPER_MAX_HTML_SIZE
+        if not max_size or len(document.html) <= max_size:
+            return True
+        if settings.SCRAPER_OVERSIZE_ACTION == "reject":
+            self.stats["too_large"] += 1
+            return False
+        document.html = document.html[:max_size]
+        return True
+
+    def save(self, articles):
+        try:
+            with transaction.atomic():
+                Article.objects.bulk_create(articles)
+            self.stats["created"] += len(articles)
+            # bulk_create sends no post_save: announce the batch to the change feed
+            ids = [article.pk for article in articles if article.pk is not None]
+            if ids:
+                notify_article_saved(max(ids))
+            return
+        except IntegrityError:
+            pass
+
+        # Some URLs were saved meanwhile (e.g. by a running scraper): insert
+        # row by row and skip the conflicting ones
+        for article in articles:
+            article.pk = None
+            article._state.adding = True
+            try:
+                with transaction.atomic():
+                    article.save()
+                self.stats["created"] += 1
+            except IntegrityError:
+                self.stats["duplicate"] += 1
@@ -0,0 +1,94 @@
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from articles.partitions import (
+    create_partition,
+    default_partition_months,
+    drop_partition,
+    ensure_partitions,
+    is_partitioned,
+    list_partitions,
+    partition_name,
+)
+
+
+def parse_month(value):
+    try:
+        return datetime.strptime(value, "%Y-%m").date()
+    except ValueError:
+        raise CommandError(f"Invalid month {value!r}, expected YYYY-MM.")
+
+
+class Command(BaseCommand):
+    help = (
+        "Maintain the monthly partitions of the articles table (PostgreSQL): "
+        "create upcoming partitions (run daily, e.g. from cron), split months out "
+        "of the default partition, and drop old months for retention."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--months-ahead",
+            type=int,
+            default=None,
+            help="Create partitions up to this many months ahead "
+            "(default: ARTICLE_PARTITION_MONTHS_AHEAD).",
+        )
+        parser.add_argument(
+            "--split-default",
+            action="store_true",
+            help="Move the rows of the default partition into partitions of their "
+            "own months.",
+        )
+        parser.add_argument(
+            "--drop-before",
+            type=parse_month,
+            metavar="YYYY-MM",
+            help="Drop the partitions of months before this one, with their articles.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="With --drop-before: only list the partitions that would be dropped.",
+        )
+
+    def handle(self, *args, **options):
+        if not is_partitioned(connection.alias):
+            raise CommandError(
+                "The articles table is not partitioned (PostgreSQL only, "
+                "see migration 0004)."
+            )
+
+        for month in ensure_partitions(options["months_ahead"], connection.alias):
+            self.stdout.write(f"Created {partition_name(month)}")
+
+        if options["split_default"]:
+            for month in default_partition_months(connection.alias):
+                moved = create_partition(month, connection.alias)
+                self.stdout.write(
+                    f"Created {partition_name(month)} with {moved} row(s) "
+                    "from the default partition"
+                )
+
+        if options["drop_before"]:
+            expired = [
+                month
+                for month in list_partitions(connection.alias)
+                if month < options["drop_before"]
+            ]
+            for month in expired:
+                if options["dry_run"]:
+                    self.stdout.write(f"Would drop {partition_name(month)}")
+                    continue
+                deleted = drop_partition(month, connection.alias)
+                self.stdout.write(
+                    f"Dropped {partition_name(month)} ({deleted} article(s))"
+                )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{len(list_partitions(connection.alias))} monthly partition(s)."
+            )
+        )
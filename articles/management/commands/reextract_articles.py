@@ -0,0 +1,191 @@
+import difflib
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from articles.log import create_worker_log_queue, setup_worker_process
+from articles.management.arguments import parse_date
+from articles.models import Article
+from articles.profiles import get_profile, load_profiles
+from articles.recrawl import content_hash
+from articles.scraper import extract_article_fields
+
+UPDATED_FIELDS = ["title", "plain_text_content", "published_at"]
+
+
+def extract_row(row):
+    """
+    Process pool task: re-runs extraction for one (pk, html, url, profile, full_text) row.
+    """
+    pk, html_content, url, profile, full_text = row
+    return pk, extract_article_fields(
+        html_content, url, profile=profile, full_text=full_text
+    )
+
+
+class Command(BaseCommand):
+    help = (
+        "Re-run title, text and date extraction over stored html_content "
+        "and update changed articles, without fetching the pages again."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--domain",
+            action="append",
+            dest="domains",
+            help="Only articles from this source domain (repeatable).",
+        )
+        parser.add_argument(
+            "--published-after",
+            type=parse_date,
+            help="Only articles published on or after this date (YYYY-MM-DD).",
+        )
+        parser.add_argument(
+            "--published-before",
+            type=parse_date,
+            help="Only articles published before this date (YYYY-MM-DD).",
+        )
+        parser.add_argument(
+            "--start-id",
+            type=int,
+            default=0,
+            help="Resume from this article id (inclusive).",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Extraction processes (default: CPU count).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Rows fetched, extracted and written per batch.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report what would change without writing to the database.",
+        )
+        parser.add_argument(
+            "--diff-lines",
+            type=int,
+            default=10,
+            help="Max plain text diff lines shown per article in --dry-run.",
+        )
+        parser.add_argument(
+            "--full-text",
+            action="store_true",
+            help="Store text of the whole page instead of the article body only.",
+        )
+
+    def handle(self, *args, **options):
+        queryset = Article.objects.filter(pk__gte=options["start_id"]).order_by("pk")
+        if options["domains"]:
+            queryset = queryset.filter(source_domain__in=options["domains"])
+        if options["published_after"]:
+            queryset = queryset.filter(published_at__gte=options["published_after"])
+        if options["published_before"]:
+            queryset = queryset.filter(published_at__lt=options["published_before"])
+
+        load_profiles()
+
+        self.stats = {"processed": 0, "changed": 0, "rejected": 0}
+        log_queue = create_worker_log_queue()
+        try:
+            with ProcessPoolExecutor(
+                max_workers=options["workers"],
+                initializer=setup_worker_process,
+                initargs=(log_queue.queue,),
+            ) as pool:
+                # Start the workers before the cursor is opened, so forked workers
+                # don't inherit (and later close) the parent's database connection
+                connections.close_all()
+                pool.submit(int).result()
+
+                batch = []
+                # On PostgreSQL, iterator() streams rows through a server-side cursor
+                for article in queryset.iterator(chunk_size=options["batch_size"]):
+                    batch.append(article)
+                    if len(batch) >= options["batch_size"]:
+                        self.process_batch(pool, batch, options)
+                        batch = []
+                if batch:
+                    self.process_batch(pool, batch, options)
+        finally:
+            log_queue.close()
+
+        verb = "Would update" if options["dry_run"] else "Updated"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Processed {self.stats['processed']} article(s). "
+                f"{verb} {self.stats['changed']}, "
+                f"rejected by extraction {self.stats['rejected']}."
+            )
+        )
+
+    def process_batch(self, pool, batch, options):
+        articles = {article.pk: article for article in batch}
+        rows = [
+            (
+                article.pk,
+                article.html_content,
+                article.source_url,
+                get_profile(article.source_domain),
+                options["full_text"],
+            )
+            for article in batch
+        ]
+        chunksize = max(1, len(rows) // (options["workers"] * 4))
+
+        changed = []
+        for pk, fields in pool.map(extract_row, rows, chunksize=chunksize):
+            article = articles[pk]
+            if fields is None:
+                self.stats["rejected"] += 1
+                continue
+            # No date found this time: keep what we had
+            if fields["published_at"] is None:
+                fields["published_at"] = article.published_at
+            diff = {
+                name: (getattr(article, name), fields[name])
+                for name in UPDATED_FIELDS
+                if getattr(article, name) != fields[name]
+            }
+            if not diff:
+                continue
+            if options["dry_run"]:
+                self.report_diff(article, diff, options["diff_lines"])
+            for name, (_, new) in diff.items():
+                setattr(article, name, new)
+            article.content_hash = content_hash(
+                article.title, article.plain_text_content
+            )
+            changed.append(article)
+
+        if changed and not options["dry_run"]:
+            Article.objects.bulk_update(changed, UPDATED_FIELDS + ["content_hash"])
+
+        self.stats["processed"] += len(batch)
+        self.stats["changed"] += len(changed)
+        self.stdout.write(
+            f"Processed up to id {batch[-1].pk} "
+            f"({self.stats['processed']} done, {self.stats['changed']} changed)"
+        )
+
+    def report_diff(self, article, diff, diff_lines):
+        self.stdout.write(self.style.WARNING(f"#{article.pk} {article.source_url}"))
+        for name, (old, new) in diff.items():
+            if name != "plain_text_content":
+                self.stdout.write(f"  {name}: {old!r} -> {new!r}")
+                continue
+            self.stdout.write(f"  {name}: {len(old)} -> {len(new)} chars")
+            lines = difflib.unified_diff(
+                old.splitlines(), new.splitlines(), lineterm="", n=0
+            )
+            for line in list(lines)[2 : 2 + diff_lines]:
+                self.stdout.write(f"    {line}")
@@ -1,6 +1,24 @@
-from django.core.management.base import BaseCommand
+import itertools
+import math
+import os
+import threading
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
 
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from articles.browser import BrowserSession
+from articles.browser_extraction import CAPTURE_MODES
+from articles.page_cache import PageCache
+from articles.profiles import load_profiles
+from articles.profiling import SamplingProfiler
+from articles.recrawl import due_articles
 from articles.scraper import scrape_article_selenium
+from articles.tabs import TabRenderer
+from articles.throttle import AutoThrottle
 
 
 class Command(BaseCommand):
@@ -25,8 +43,105 @@ class Command(BaseCommand):
             type=str,
             help="Optional list of URLs to scrape (space-separated).",
         )
+        parser.add_argument(
+            "--full-text",
+            action="store_true",
+            help="Store text of the whole page instead of the article body only.",
+        )
+        parser.add_argument(
+            "--track-memory",
+            action="store_true",
+            help="Measure peak Python memory per scrape (tracemalloc, slows "
+            "scraping); needs a single worker.",
+        )
+        parser.add_argument(
+            "--recrawl",
+            action="store_true",
+            help="Scrape stored URLs again when due under the recrawl policy "
+            "and update changed articles.",
+        )
+        parser.add_argument(
+            "--recrawl-due",
+            type=int,
+            metavar="LIMIT",
+            help="Re-scrape up to LIMIT stored articles due for recrawl "
+            "(oldest first); implies --recrawl.",
+        )
+        parser.add_argument(
+            "--cache",
+            action="store_true",
+            help="Reuse rendered pages from the on-disk page cache (SCRAPER_CACHE_DIR) "
+            "and store new ones there.",
+        )
+        parser.add_argument(
+            "--in-browser",
+            action="store_true",
+            help="Extract title, date and text inside the page and transfer only "
+            "the result instead of the whole page source (for remote browsers).",
+        )
+        parser.add_argument(
+            "--capture-html",
+            choices=CAPTURE_MODES,
+            default="gzip",
+            help="Raw HTML stored with --in-browser: gzip (compressed in the "
+            "browser, default), plain, or none (html_content left empty).",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Scrape this many URLs concurrently, one browser per worker.",
+        )
+        parser.add_argument(
+            "--tabs",
+            type=int,
+            default=1,
+            help="Render up to this many pages at once in tabs of one browser; "
+            "workers share browsers (at least --tabs workers are used).",
+        )
+        parser.add_argument(
+            "--max-domain-concurrency",
+            type=int,
+            default=4,
+            help="Upper bound of the adaptive per-domain concurrency.",
+        )
+        parser.add_argument(
+            "--target-latency",
+            type=float,
+            default=3.0,
+            help="Page load time (s) above which a domain is slowed down.",
+        )
+        parser.add_argument(
+            "--ignore-robots",
+            action="store_true",
+            help="Don't apply robots.txt Crawl-delay.",
+        )
+        parser.add_argument(
+            "--profile",
+            action="store_true",
+            help="Sample scraping threads and write pstats and collapsed-stack files.",
+        )
+        parser.add_argument(
+            "--profile-dir",
+            default="profiling",
+            help="Directory for --profile output files (default: profiling).",
+        )
+        parser.add_argument(
+            "--profile-interval",
+            type=float,
+            default=5.0,
+            help="Sampling interval of --profile in milliseconds (default: 5).",
+        )
 
     def handle(self, *args, **options):
+        if options["in_browser"] and options["tabs"] > 1:
+            raise CommandError("--in-browser can't be combined with --tabs.")
+        if options["track_memory"] and (options["workers"] > 1 or options["tabs"] > 1):
+            # tracemalloc is process-wide: concurrent scrapes would mix their peaks
+            raise CommandError(
+                "--track-memory measures one scrape at a time and can't be "
+                "combined with --workers or --tabs."
+            )
         default_urls = [
             "https://galicjaexpress.pl/ford-c-max-jaki-silnik-benzynowy-wybrac-aby-zaoszczedzic-na-paliwie",
             "https://galicjaexpress.pl/bmw-e9-30-cs-szczegolowe-informacje-o-osiagach-i-historii-modelu",
@@ -34,23 +149,201 @@ class Command(BaseCommand):
             "https://take-group.github.io/example-blog-without-ssr/co-mozna-zrobic-ze-schabu-oprocz-kotletow-5-zaskakujacych-przepisow",
         ]
         provided_urls = options.get("urls") or options.get("input_urls")
-        urls = provided_urls if provided_urls else default_urls
-        if not provided_urls:
+        if options["recrawl_due"] is not None:
+            options["recrawl"] = True
+            due_urls = list(
+                due_articles().values_list("source_url", flat=True)[
+                    : options["recrawl_due"]
+                ]
+            )
+            self.stdout.write(f"{len(due_urls)} stored article(s) due for recrawl.")
+            urls = (provided_urls or []) + due_urls
+        elif provided_urls:
+            urls = provided_urls
+        else:
+            urls = default_urls
             if hasattr(self.style, "NOTICE"):
                 self.stdout.write(self.style.NOTICE("No URLs provided. Using 4 predefined task URLs."))
             else:
                 self.stdout.write("No URLs provided. Using 4 predefined task URLs.")
 
-        total = len(urls)
+        profiles = load_profiles()
+        if profiles:
+            self.stdout.write(f"Loaded {len(profiles)} extraction profile(s).")
 
-        for idx, url in enumerate(urls, start=1):
-            self.stdout.write(f"Scraping article {idx} / {total}: {url}")
-            article = scrape_article_selenium(url)
-            if article:
-                self.stdout.write(self.style.SUCCESS(f"Saved: {article.title}"))
-            else:
-                self.stdout.write(
-                    self.style.WARNING(f"Already exists or failed: {url}")
+        self.options = options
+        self.total = len(urls)
+        self.throttle = AutoThrottle(
+            target_latency=options["target_latency"],
+            max_concurrency=options["max_domain_concurrency"],
+            respect_robots=not options["ignore_robots"],
+        )
+        self.cache = None
+        if options["cache"]:
+            self.cache = PageCache(
+                settings.SCRAPER_CACHE_DIR,
+                ttl=settings.SCRAPER_CACHE_TTL_HOURS * 3600,
+                max_bytes=settings.SCRAPER_CACHE_MAX_MB * 1024 * 1024,
+            )
+        self.sessions = []
+        self.local = threading.local()
+        self.renderers = []
+        if options["tabs"] > 1:
+            options["workers"] = max(options["workers"], options["tabs"])
+            self.renderers = [
+                TabRenderer(
+                    max_tabs=options["tabs"],
+                    max_rss_bytes=settings.SCRAPER_BROWSER_MAX_RSS_MB * 1024 * 1024,
+                    max_pages=settings.SCRAPER_BROWSER_MAX_PAGES,
+                    max_size=settings.SCRAPER_MAX_HTML_SIZE,
+                    oversize_action=settings.SCRAPER_OVERSIZE_ACTION,
                 )
+                for _ in range(math.ceil(options["workers"] / options["tabs"]))
+            ]
+            self.sessions.extend(renderer.session for renderer in self.renderers)
+            self.next_renderer = itertools.cycle(self.renderers)
+            self.renderer_lock = threading.Lock()
+            self.stdout.write(
+                f"Rendering in {len(self.renderers)} browser(s) "
+                f"with up to {options['tabs']} tab(s) each."
+            )
+        self.peaks = []
+        if options["track_memory"]:
+            tracemalloc.start()
+        self.profiler = None
+        if options["profile"]:
+            self.profiler = SamplingProfiler(
+                interval=options["profile_interval"] / 1000
+            )
+            self.profiler.start()
+
+        try:
+            if options["workers"] > 1:
+                with ThreadPoolExecutor(max_workers=options["workers"]) as pool:
+                    futures = [
+                        pool.submit(self.scrape_in_worker, idx, url)
+                        for idx, url in enumerate(urls, start=1)
+                    ]
+                    for future in as_completed(futures):
+                        future.result()
+            else:
+                for idx, url in enumerate(urls, start=1):
+                    self.scrape(idx, url)
+        finally:
+            for renderer in self.renderers:
+                renderer.close()
+            for session in self.sessions:
+                session.quit()
+            if options["track_memory"]:
+                tracemalloc.stop()
+            if self.profiler:
+                self.profiler.stop()
 
+        self.write_summary()
+        if self.profiler:
+            self.write_profile()
         self.stdout.write(self.style.SUCCESS("Scraping finished!"))
+
+    def get_session(self):
+        # One browser per worker thread
+        session = getattr(self.local, "session", None)
+        if session is None:
+            session = BrowserSession(
+                max_rss_bytes=settings.SCRAPER_BROWSER_MAX_RSS_MB * 1024 * 1024,
+                max_pages=settings.SCRAPER_BROWSER_MAX_PAGES,
+            )
+            self.local.session = session
+            self.sessions.append(session)
+        return session
+
+    def get_renderer(self):
+        # Worker threads are spread evenly over the shared browsers
+        renderer = getattr(self.local, "renderer", None)
+        if renderer is None:
+            with self.renderer_lock:
+                renderer = next(self.next_renderer)
+            self.local.renderer = renderer
+        return renderer
+
+    def scrape_in_worker(self, idx, url):
+        try:
+            self.scrape(idx, url)
+        finally:
+            # Worker threads get their own DB connections; don't leak them
+            connection.close()
+
+    def scrape(self, idx, url):
+        self.stdout.write(f"Scraping article {idx} / {self.total}: {url}")
+        if self.profiler:
+            self.profiler.add_thread()
+        article = scrape_article_selenium(
+            url,
+            full_text=self.options["full_text"],
+            session=None if self.renderers else self.get_session(),
+            throttle=self.throttle,
+            recrawl=self.options["recrawl"],
+            cache=self.cache,
+            renderer=self.get_renderer() if self.renderers else None,
+            in_browser=self.options["in_browser"],
+            capture_html=self.options["capture_html"],
+        )
+        if self.options["track_memory"]:
+            # Peak since scrape_article_selenium() reset it
+            self.peaks.append(tracemalloc.get_traced_memory()[1])
+        if article:
+            self.stdout.write(self.style.SUCCESS(f"Saved: {article.title}"))
+        else:
+            self.stdout.write(
+                self.style.WARNING(f"Already exists, unchanged or failed: {url}")
+            )
+
+    def write_summary(self):
+        mb = 1024 * 1024
+        recycles = sum(session.recycles for session in self.sessions)
+        self.stdout.write(f"Browser restarts over memory/page limits: {recycles}")
+        rss = [session.last_rss for session in self.sessions if session.last_rss]
+        if rss:
+            self.stdout.write(f"Last browser RSS: {max(rss) / mb:.1f} MB")
+        if self.peaks:
+            self.stdout.write(
+                f"Peak Python memory per scrape: max {max(self.peaks) / mb:.1f} MB, "
+                f"mean {sum(self.peaks) / len(self.peaks) / mb:.1f} MB"
+            )
+
+        if self.cache:
+            stats = self.cache.stats
+            self.cache.log_stats()
+            self.stdout.write(
+                f"Page cache: {stats['hits']} hit(s), {stats['misses']} miss(es), "
+                f"{stats['expired']} expired, {stats['evictions']} evicted, "
+                f"{stats['bytes_saved'] / mb:.1f} MB not fetched again"
+            )
+
+        self.throttle.log_state()
+        for domain, state in self.throttle.snapshot().items():
+            latency = f"{state['latency']:.2f}s" if state["latency"] else "-"
+            self.stdout.write(
+                f"{domain}: concurrency {state['concurrency']}, "
+                f"delay {state['delay']:.2f}s, latency {latency}, "
+                f"requests {state['requests']}, errors {state['errors']}, "
+                f"timeouts {state['timeouts']}"
+            )
+
+    def write_profile(self, limit=10):
+        os.makedirs(self.options["profile_dir"], exist_ok=True)
+        path = os.path.join(
+            self.options["profile_dir"], f"scrape-{datetime.now():%Y%m%d-%H%M%S}"
+        )
+        self.profiler.write_pstats(f"{path}.pstats")
+        self.profiler.write_collapsed(f"{path}.collapsed")
+        self.stdout.write(
+            f"Profile ({self.profiler.samples} samples) written to "
+            f"{path}.pstats and {path}.collapsed"
+        )
+
+        for phase, (seconds, top) in self.profiler.top_functions(limit).items():
+            self.stdout.write(f"Phase {phase}: {seconds:.2f}s sampled")
+            for function, function_seconds, share in top:
+                self.stdout.write(
+                    f"  {function_seconds:8.3f}s {share:6.1%}  {function}"
+                )
@@ -0,0 +1,330 @@
+import json
+import logging
+import os
+import queue
+import signal
+import threading
+import time
+from datetime import datetime
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections, connection
+
+from articles.browser import BrowserSession
+from articles.page_cache import PageCache
+from articles.profiles import load_profiles
+from articles.schedule import load_schedules
+from articles.scraper import FAILED_OUTCOMES, scrape_article_selenium
+from articles.throttle import AutoThrottle
+
+logger = logging.getLogger(__name__)
+
+# Longest sleep of the scheduler loop, so stop/reload requests are seen promptly
+MAX_SLEEP = 1.0
+
+
+class Command(BaseCommand):
+    help = (
+        "Run as a long-lived scraper: per-domain crawl schedules from a JSON "
+        "configuration file, warm browsers and database connections, a heartbeat "
+        "with queue depth. SIGTERM/SIGINT stop gracefully, SIGHUP reloads the "
+        "configuration and extraction profiles."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--config",
+            required=True,
+            help="JSON file with workers/throttle settings and the crawl schedules.",
+        )
+        parser.add_argument(
+            "--heartbeat",
+            type=float,
+            default=60.0,
+            help="Seconds between heartbeat log records (default: 60).",
+        )
+        parser.add_argument(
+            "--heartbeat-file",
+            help="Also write each heartbeat as JSON to this file (for health checks).",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Run every schedule once, wait for the queue to drain and exit.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            config, schedules = load_schedules(options["config"])
+        except ValueError as e:
+            raise CommandError(str(e))
+        if config["workers"] < 1:
+            raise CommandError("workers must be at least 1.")
+
+        self.options = options
+        self.config = config
+        self.schedules = schedules
+        self.queue = queue.Queue()
+        # URLs queued or being scraped; a URL is never queued twice at once
+        self.pending = set()
+        self.pending_lock = threading.Lock()
+        self.stats = {"scraped": 0, "saved": 0, "failed": 0, "dropped": 0}
+        self.in_flight = 0
+        self.started = time.monotonic()
+        self.stopping = threading.Event()
+        self.reload_requested = threading.Event()
+
+        profiles = load_profiles()
+        if profiles:
+            self.stdout.write(f"Loaded {len(profiles)} extraction profile(s).")
+        self.throttle = AutoThrottle(
+            target_latency=config["target_latency"],
+            max_concurrency=config["max_domain_concurrency"],
+            respect_robots=not config["ignore_robots"],
+        )
+        self.cache = None
+        if config["cache"]:
+            self.cache = PageCache(
+                settings.SCRAPER_CACHE_DIR,
+                ttl=settings.SCRAPER_CACHE_TTL_HOURS * 3600,
+                max_bytes=settings.SCRAPER_CACHE_MAX_MB * 1024 * 1024,
+            )
+
+        self.install_signal_handlers()
+        self.sessions = [
+            BrowserSession(
+                max_rss_bytes=settings.SCRAPER_BROWSER_MAX_RSS_MB * 1024 * 1024,
+                max_pages=settings.SCRAPER_BROWSER_MAX_PAGES,
+            )
+            for _ in range(config["workers"])
+        ]
+        self.ready = threading.Barrier(len(self.sessions) + 1)
+        self.threads = [
+            threading.Thread(
+                target=self.work, args=(session,), name=f"scrape-worker-{idx}"
+            )
+            for idx, session in enumerate(self.sessions, start=1)
+        ]
+        for thread in self.threads:
+            thread.start()
+        # Schedules start once every browser is up
+        self.ready.wait()
+        self.stdout.write(
+            f"Scrape daemon running {len(self.schedules)} schedule(s) "
+            f"with {len(self.sessions)} worker(s)."
+        )
+        logger.info(
+            f"Scrape daemon started: {len(self.schedules)} schedule(s), "
+            f"{len(self.sessions)} worker(s)"
+        )
+
+        try:
+            self.run()
+        finally:
+            self.shutdown()
+        self.stdout.write(self.style.SUCCESS("Scrape daemon stopped."))
+
+    def install_signal_handlers(self):
+        self.previous_handlers = {}
+        # Signal handlers can only be installed from the main thread
+        if threading.current_thread() is not threading.main_thread():
+            return
+        handlers = {signal.SIGTERM: self.request_stop, signal.SIGINT: self.request_stop}
+        if hasattr(signal, "SIGHUP"):
+            handlers[signal.SIGHUP] = self.request_reload
+        for signum, handler in handlers.items():
+            self.previous_handlers[signum] = signal.signal(signum, handler)
+
+    def request_stop(self, signum=None, frame=None):
+        self.stopping.set()
+
+    def request_reload(self, signum=None, frame=None):
+        self.reload_requested.set()
+
+    def run(self):
+        next_heartbeat = time.monotonic() + self.options["heartbeat"]
+        while not self.stopping.is_set():
+            if self.reload_requested.is_set():
+                self.reload_requested.clear()
+                self.reload()
+
+            now = time.monotonic()
+            for schedule in self.schedules:
+                if schedule.next_run <= now:
+                    self.enqueue(schedule)
+                    schedule.next_run = now + schedule.interval
+            if self.options["once"]:
+                # Like queue.join(), but a stop request still interrupts it
+                while self.queue.unfinished_tasks and not self.stopping.wait(0.1):
+                    pass
+                break
+
+            if now >= next_heartbeat:
+                self.heartbeat()
+                next_heartbeat = now + self.options["heartbeat"]
+            wake = min(
+                [next_heartbeat] + [schedule.next_run for schedule in self.schedules]
+            )
+            self.stopping.wait(min(max(wake - time.monotonic(), 0), MAX_SLEEP))
+
+    def enqueue(self, schedule):
+        # The scheduler thread keeps its connection open between runs
+        close_old_connections()
+        try:
+            urls = schedule.collect_urls()
+        except Exception:
+            logger.exception(f"Schedule {schedule.name} failed to list its URLs")
+            return
+        added = 0
+        with self.pending_lock:
+            for url, recrawl in urls:
+                if url not in self.pending:
+                    self.pending.add(url)
+                    self.queue.put((url, recrawl))
+                    added += 1
+        logger.info(
+            f"Schedule {schedule.name} queued {added} URL(s) "
+            f"({len(urls) - added} already pending)"
+        )
+
+    def work(self, session):
+        # Warm up: start the browser and the DB connection before the first job
+        try:
+            session.get_driver()
+            connection.ensure_connection()
+        except Exception:
+            logger.exception("Worker warm-up failed; retrying on the first job")
+        self.ready.wait()
+
+        try:
+            while True:
+                job = self.queue.get()
+                if job is None:
+                    self.queue.task_done()
+                    return
+                try:
+                    self.scrape(session, *job)
+                finally:
+                    with self.pending_lock:
+                        self.pending.discard(job[0])
+                    self.queue.task_done()
+        finally:
+            connection.close()
+
+    def scrape(self, session, url, recrawl):
+        # Reuse the connection unless it broke or is older than CONN_MAX_AGE
+        close_old_connections()
+        with self.pending_lock:
+            self.in_flight += 1
+        try:
+            article, outcome = scrape_article_selenium(
+                url,
+                full_text=self.config["full_text"],
+                session=session,
+                throttle=self.throttle,
+                recrawl=recrawl,
+                cache=self.cache,
+                return_outcome=True,
+            )
+        except Exception:
+            # A daemon worker must survive any single page
+            logger.exception(f"Unexpected error scraping {url}", extra={"url": url})
+            article, outcome = None, "error"
+        with self.pending_lock:
+            self.in_flight -= 1
+            self.stats["scraped"] += 1
+            if article:
+                self.stats["saved"] += 1
+            elif outcome in FAILED_OUTCOMES:
+                self.stats["failed"] += 1
+
+    def reload(self):
+        """
+        Re-reads the configuration (SIGHUP). Schedules keep their next run time
+        by name, new ones run at once; an invalid file keeps the old config.
+        """
+        try:
+            config, schedules = load_schedules(self.options["config"])
+        except ValueError as e:
+            logger.error(f"Configuration not reloaded: {e}")
+            return
+        previous = {schedule.name: schedule for schedule in self.schedules}
+        for schedule in schedules:
+            if schedule.name in previous:
+                schedule.next_run = previous[schedule.name].next_run
+        # Only full_text and the schedules apply to the running workers
+        fixed = [
+            key
+            for key in config
+            if key != "full_text" and config[key] != self.config[key]
+        ]
+        if fixed:
+            logger.warning(f"Changes to {', '.join(fixed)} take effect after a restart")
+            for key in fixed:
+                config[key] = self.config[key]
+        self.config = config
+        self.schedules = schedules
+        load_profiles()
+        logger.info(f"Configuration reloaded: {len(schedules)} schedule(s)")
+
+    def heartbeat_state(self):
+        now = time.monotonic()
+        with self.pending_lock:
+            state = dict(
+                self.stats,
+                queue_depth=self.queue.qsize(),
+                in_flight=self.in_flight,
+            )
+        state["uptime"] = round(now - self.started, 1)
+        state["schedules"] = {
+            schedule.name: round(max(schedule.next_run - now, 0), 1)
+            for schedule in self.schedules
+        }
+        return state
+
+    def heartbeat(self):
+        state = self.heartbeat_state()
+        logger.info(
+            f"Scrape daemon heartbeat: queue depth {state['queue_depth']}, "
+            f"in flight {state['in_flight']}, saved {state['saved']}, "
+            f"failed {state['failed']}",
+            extra={"daemon": state},
+        )
+        path = self.options["heartbeat_file"]
+        if path:
+            data = dict(state, time=datetime.now().isoformat(timespec="seconds"))
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            # Readers never see a half-written file
+            os.replace(tmp_path, path)
+
+    def shutdown(self):
+        # Drop queued work; pages in flight are finished
+        with self.pending_lock:
+            while True:
+                try:
+                    url, _ = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                self.pending.discard(url)
+                self.queue.task_done()
+                self.stats["dropped"] += 1
+        for _ in self.threads:
+            self.queue.put(None)
+        for thread in self.threads:
+            thread.join()
+        for session in self.sessions:
+            session.quit()
+        for signum, handler in self.previous_handlers.items():
+            signal.signal(signum, handler)
+        self.heartbeat()
+        if self.cache:
+            self.cache.log_stats()
+        self.throttle.log_state()
+        self.stdout.write(
+            f"Scraped {self.stats['scraped']} page(s): {self.stats['saved']} saved, "
+            f"{self.stats['failed']} failed, {self.stats['dropped']} dropped from "
+            "the queue."
+        )
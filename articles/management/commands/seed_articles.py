@@ -0,0 +1,236 @@
+import csv
+import io
+import random
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from articles.management.arguments import parse_date
+from articles.models import Article
+
+SEED_FIELDS = [
+    "title",
+    "html_content",
+    "plain_text_content",
+    "source_url",
+    "published_at",
+    "source_domain",
+    # NOT NULL without a database default, so COPY has to list them
+    "content_hash",
+    "etag",
+    "last_modified",
+]
+
+WORDS = (
+    "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor "
+    "incididunt ut labore et dolore magna aliqua artykuł samochód silnik paliwo "
+    "przepis kuchnia miasto region wiadomości sport pogoda gospodarka rynek "
+    "analysis market report engine recipe weather city council election season"
+).split()
+
+PAGE_TEMPLATE = (
+    "<html><head><title>{title}</title>"
+    '<meta property="article:published_time" content="{published}"></head>'
+    "<body><nav>{boilerplate}</nav><article><h1>{title}</h1>{body}</article>"
+    "<footer>{boilerplate}</footer></body></html>"
+)
+
+
+class Corpus:
+    """
+    Builds synthetic articles from a pool of pre-generated paragraphs, so that
+    generation stays cheap for millions of rows.
+    """
+
+    def __init__(self, rng, text_size, html_padding, paragraphs=500):
+        self.rng = rng
+        self.text_size = text_size
+        self.paragraphs = [
+            " ".join(rng.choices(WORDS, k=rng.randint(40, 120))).capitalize() + "."
+            for _ in range(paragraphs)
+        ]
+        # Navigation/footer filler making pages as heavy as scraped ones
+        links = []
+        while sum(len(link) for link in links) < html_padding // 2:
+            links.append(f'<a href="/section/{len(links)}">{rng.choice(WORDS)}</a>')
+        self.boilerplate = "".join(links)
+
+    def text(self):
+        size = self.rng.randint(*self.text_size)
+        parts, length = [], 0
+        while length < size:
+            paragraph = self.rng.choice(self.paragraphs)
+            parts.append(paragraph)
+            length += len(paragraph) + 1
+        return parts
+
+    def title(self):
+        return " ".join(self.rng.choices(WORDS, k=self.rng.randint(4, 12))).capitalize()
+
+    def html(self, title, parts, published_at):
+        return PAGE_TEMPLATE.format(
+            title=title,
+            published=published_at.isoformat(),
+            boilerplate=self.boilerplate,
+            body="".join(f"<p>{part}</p>" for part in parts),
+        )
+
+
+def parse_range(value):
+    low, _, high = value.partition(":")
+    try:
+        low, high = int(low), int(high or low)
+    except ValueError:
+        raise CommandError(f"Invalid range {value!r}, expected MIN:MAX.")
+    if not 0 < low <= high:
+        raise CommandError(f"Invalid range {value!r}, expected 0 < MIN <= MAX.")
+    return low, high
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate a synthetic article corpus for load testing "
+        "(bulk_create, or PostgreSQL COPY when available)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--count",
+            type=int,
+            default=10_000,
+            help="Number of articles to create (default: 10000).",
+        )
+        parser.add_argument(
+            "--domains",
+            type=int,
+            default=20,
+            help="Number of distinct source domains (default: 20).",
+        )
+        parser.add_argument(
+            "--start-date",
+            type=parse_date,
+            default=None,
+            help="Earliest publication date (YYYY-MM-DD, default: --days ago).",
+        )
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=365,
+            help="Spread publication dates over this many days (default: 365).",
+        )
+        parser.add_argument(
+            "--text-size",
+            type=parse_range,
+            default=(1_000, 8_000),
+            help="Plain text size range in characters, MIN:MAX (default: 1000:8000).",
+        )
+        parser.add_argument(
+            "--html-padding",
+            type=int,
+            default=20_000,
+            help="Boilerplate characters around the article body (default: 20000).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5_000,
+            help="Rows inserted per batch (default: 5000).",
+        )
+        parser.add_argument(
+            "--method",
+            choices=["auto", "bulk", "copy"],
+            default="auto",
+            help="Insert method; auto uses COPY on PostgreSQL, bulk_create elsewhere.",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=None,
+            help="Random seed for a reproducible corpus.",
+        )
+
+    def handle(self, *args, **options):
+        method = options["method"]
+        if method == "auto":
+            method = "copy" if connection.vendor == "postgresql" else "bulk"
+        if method == "copy" and connection.vendor != "postgresql":
+            raise CommandError("--method copy requires PostgreSQL.")
+        if options["count"] < 1 or options["domains"] < 1 or options["days"] < 1:
+            raise CommandError("--count, --domains and --days must be positive.")
+
+        rng = random.Random(options["seed"])
+        corpus = Corpus(rng, options["text_size"], options["html_padding"])
+        start = options["start_date"] or datetime.now().replace(
+            hour=0, minute=0, second=0, microsecond=0
+        ) - timedelta(days=options["days"])
+        domains = [f"site{i}.example.com" for i in range(1, options["domains"] + 1)]
+        # Unique per run (even with --seed), so the command can be run repeatedly
+        run_id = uuid.uuid4().hex[:12]
+
+        insert = self.copy_rows if method == "copy" else self.bulk_create_rows
+        started = time.perf_counter()
+        created = 0
+        while created < options["count"]:
+            size = min(options["batch_size"], options["count"] - created)
+            rows = [
+                self.make_row(corpus, rng, domains, start, options["days"], run_id, i)
+                for i in range(created, created + size)
+            ]
+            insert(rows)
+            created += size
+            self.stdout.write(f"Inserted {created} / {options['count']}")
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Created {created} article(s) across {len(domains)} domain(s) "
+                f"using {method} in {elapsed:.1f}s ({created / elapsed:.0f} rows/s)."
+            )
+        )
+
+    def make_row(self, corpus, rng, domains, start, days, run_id, index):
+        domain = rng.choice(domains)
+        title = corpus.title()
+        parts = corpus.text()
+        published_at = start + timedelta(days=rng.randrange(days))
+        return {
+            "title": title,
+            "html_content": corpus.html(title, parts, published_at),
+            "plain_text_content": "\n".join([title] + parts),
+            "source_url": f"https://{domain}/seed/{run_id}/{index}",
+            "published_at": published_at,
+            "source_domain": domain,
+            "content_hash": "",
+            "etag": "",
+            "last_modified": "",
+        }
+
+    def bulk_create_rows(self, rows):
+        Article.objects.bulk_create([Article(**row) for row in rows])
+
+    def copy_rows(self, rows):
+        buffer = io.StringIO()
+        # COPY reads an unquoted empty value as NULL
+        writer = csv.writer(buffer, quoting=csv.QUOTE_ALL)
+        for row in rows:
+            writer.writerow(
+                [
+                    row[name].isoformat() if name == "published_at" else row[name]
+                    for name in SEED_FIELDS
+                ]
+            )
+        buffer.seek(0)
+
+        quote = connection.ops.quote_name
+        columns = ", ".join(
+            quote(Article._meta.get_field(name).column) for name in SEED_FIELDS
+        )
+        sql = (
+            f"COPY {quote(Article._meta.db_table)} ({columns}) "
+            "FROM STDIN WITH (FORMAT csv)"
+        )
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.copy_expert(sql, buffer)
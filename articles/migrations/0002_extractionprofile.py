@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-19 11:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExtractionProfile',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source_domain', models.CharField(max_length=255, unique=True)),
+                ('title_selector', models.CharField(blank=True, max_length=255)),
+                ('body_selector', models.CharField(blank=True, max_length=255)),
+                ('date_selector', models.CharField(blank=True, max_length=255)),
+                ('date_attribute', models.CharField(blank=True, help_text='Attribute holding the date (e.g. content, datetime); element text if empty.', max_length=50)),
+                ('date_format', models.CharField(blank=True, help_text='strptime format of the date; dateparser is used if empty.', max_length=100)),
+                ('wait_selector', models.CharField(blank=True, help_text='Element to wait for instead of a fixed delay after page load.', max_length=255)),
+                ('hits', models.PositiveIntegerField(default=0)),
+                ('misses', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0002_extractionprofile'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='content_hash',
+            field=models.CharField(blank=True, max_length=64),
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='etag',
+            field=models.CharField(blank=True, max_length=255),
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='last_modified',
+            field=models.CharField(blank=True, max_length=64),
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='last_scraped_at',
+            field=models.DateTimeField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='extractionprofile',
+            name='recrawl_hours',
+            field=models.PositiveIntegerField(blank=True, help_text='Re-scrape articles after this many hours (0: never); SCRAPER_RECRAWL_AFTER_HOURS if empty.', null=True),
+        ),
+    ]
@@ -0,0 +1,193 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:37
+
+from django.db import migrations, models
+
+# PostgreSQL only: articles_article becomes a table partitioned by published_at
+# month. The primary key has to include the partition key, so it becomes
+# (id, published_at) with ids from a plain sequence (identity columns aren't
+# supported on partitioned tables before PostgreSQL 17), and source_url
+# uniqueness moves to the primary key of articles_article_url, kept in sync by
+# triggers. Django still treats id as the primary key, so the database no longer
+# matches the migration state of Article: later schema changes of the model have
+# to be written by hand (see the Article docstring). Existing rows are copied
+# into the new table, which locks the articles table for the duration.
+#
+# Everything is inline, with no input but the existing rows: partitions are
+# created for the months that have articles, later months by the
+# partition_articles command. Index names are the ones of migration 0001, so
+# reversing restores the original table.
+INDEX_SQL = [
+    "CREATE INDEX articles_article_source_url_0705e2f8_like "
+    "ON articles_article (source_url varchar_pattern_ops)",
+    "CREATE INDEX articles_article_source_domain_c14a92c8 "
+    "ON articles_article (source_domain)",
+    "CREATE INDEX articles_article_source_domain_c14a92c8_like "
+    "ON articles_article (source_domain varchar_pattern_ops)",
+    "CREATE INDEX articles_article_last_scraped_at_ea131b5b "
+    "ON articles_article (last_scraped_at)",
+]
+
+DROP_INDEX_SQL = [
+    "DROP INDEX articles_article_source_url_0705e2f8_like",
+    "DROP INDEX articles_article_source_domain_c14a92c8",
+    "DROP INDEX articles_article_source_domain_c14a92c8_like",
+    "DROP INDEX articles_article_last_scraped_at_ea131b5b",
+]
+
+PARTITION_SQL = [
+    "ALTER TABLE articles_article RENAME TO articles_article_unpartitioned",
+    "ALTER INDEX articles_article_pkey RENAME TO articles_article_unpartitioned_pkey",
+    *DROP_INDEX_SQL,
+    """
+    CREATE TABLE articles_article (
+        LIKE articles_article_unpartitioned INCLUDING DEFAULTS
+    ) PARTITION BY RANGE (published_at)
+    """,
+    "ALTER TABLE articles_article ADD PRIMARY KEY (id, published_at)",
+    # Replaces the unique constraint for lookups by URL
+    "CREATE INDEX articles_article_source_url_idx ON articles_article (source_url)",
+    *INDEX_SQL,
+    "CREATE TABLE articles_article_default PARTITION OF articles_article DEFAULT",
+]
+
+MONTHS_SQL = """
+    SELECT DISTINCT
+        to_char(date_trunc('month', published_at), 'YYYYMM'),
+        date_trunc('month', published_at)::date,
+        (date_trunc('month', published_at) + interval '1 month')::date
+    FROM articles_article_unpartitioned
+    ORDER BY 1
+"""
+
+# Same naming as articles.partitions.partition_name()
+CREATE_PARTITION_SQL = """
+    CREATE TABLE articles_article_p{} PARTITION OF articles_article
+    FOR VALUES FROM (%s) TO (%s)
+"""
+
+COPY_SQL = [
+    "INSERT INTO articles_article SELECT * FROM articles_article_unpartitioned",
+    """
+    CREATE FUNCTION articles_article_url_sync() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        IF current_setting('articles.moving_rows', true) = 'on' THEN
+            RETURN NULL;
+        END IF;
+        IF TG_OP <> 'INSERT' THEN
+            DELETE FROM articles_article_url
+            WHERE source_url = OLD.source_url AND article_id = OLD.id;
+        END IF;
+        IF TG_OP <> 'DELETE' THEN
+            INSERT INTO articles_article_url (source_url, article_id, published_at)
+            VALUES (NEW.source_url, NEW.id, NEW.published_at);
+        END IF;
+        RETURN NULL;
+    END;
+    $$
+    """,
+    # Rows moving to another partition fire the DELETE and INSERT triggers
+    """
+    CREATE TRIGGER articles_article_url_insert_delete
+    AFTER INSERT OR DELETE ON articles_article
+    FOR EACH ROW EXECUTE FUNCTION articles_article_url_sync()
+    """,
+    """
+    CREATE TRIGGER articles_article_url_update
+    AFTER UPDATE OF source_url, published_at ON articles_article
+    FOR EACH ROW
+    WHEN (
+        OLD.source_url IS DISTINCT FROM NEW.source_url
+        OR OLD.published_at IS DISTINCT FROM NEW.published_at
+    )
+    EXECUTE FUNCTION articles_article_url_sync()
+    """,
+    """
+    INSERT INTO articles_article_url (source_url, article_id, published_at)
+    SELECT source_url, id, published_at FROM articles_article
+    """,
+    # Also drops the sequence of the identity column
+    "DROP TABLE articles_article_unpartitioned",
+    "CREATE SEQUENCE articles_article_id_seq OWNED BY articles_article.id",
+    """
+    SELECT setval('articles_article_id_seq', COALESCE(MAX(id), 0) + 1, false)
+    FROM articles_article
+    """,
+    "ALTER TABLE articles_article "
+    "ALTER COLUMN id SET DEFAULT nextval('articles_article_id_seq')",
+]
+
+UNPARTITION_SQL = [
+    "ALTER TABLE articles_article RENAME TO articles_article_partitioned",
+    "ALTER INDEX articles_article_pkey RENAME TO articles_article_partitioned_pkey",
+    "DROP INDEX articles_article_source_url_idx",
+    *DROP_INDEX_SQL,
+    """
+    CREATE TABLE articles_article (
+        LIKE articles_article_partitioned INCLUDING DEFAULTS
+    )
+    """,
+    "ALTER TABLE articles_article ALTER COLUMN id DROP DEFAULT",
+    "INSERT INTO articles_article SELECT * FROM articles_article_partitioned",
+    # Drops the partitions, triggers and id sequence with it
+    "DROP TABLE articles_article_partitioned",
+    "DROP FUNCTION articles_article_url_sync()",
+    "ALTER TABLE articles_article "
+    "ALTER COLUMN id ADD GENERATED BY DEFAULT AS IDENTITY",
+    """
+    SELECT setval(
+        pg_get_serial_sequence('articles_article', 'id'),
+        COALESCE(MAX(id), 0) + 1,
+        false
+    )
+    FROM articles_article
+    """,
+    "ALTER TABLE articles_article ADD PRIMARY KEY (id)",
+    "ALTER TABLE articles_article "
+    "ADD CONSTRAINT articles_article_source_url_key UNIQUE (source_url)",
+    *INDEX_SQL,
+]
+
+
+def partition_articles(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        for statement in PARTITION_SQL:
+            cursor.execute(statement)
+        cursor.execute(MONTHS_SQL)
+        # The new table is still empty: partitions can be created in place
+        for suffix, start, end in cursor.fetchall():
+            cursor.execute(CREATE_PARTITION_SQL.format(suffix), [start, end])
+        for statement in COPY_SQL:
+            cursor.execute(statement)
+
+
+def unpartition_articles(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        for statement in UNPARTITION_SQL:
+            cursor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0003_change_detection'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArticleUrl',
+            fields=[
+                ('source_url', models.URLField(primary_key=True, serialize=False)),
+                ('article_id', models.BigIntegerField()),
+                ('published_at', models.DateTimeField(db_index=True)),
+            ],
+            options={
+                'db_table': 'articles_article_url',
+            },
+        ),
+        migrations.RunPython(partition_articles, unpartition_articles),
+    ]
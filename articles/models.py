@@ -2,12 +2,89 @@ from django.db import models
 
 
 class Article(models.Model):
+    """
+    A scraped article.
+
+    On PostgreSQL the table is partitioned by published_at month (migration
+    0004) and differs from this model's migration state: the primary key is
+    (id, published_at), id comes from articles_article_id_seq, and source_url has
+    a plain index, its uniqueness being kept by ArticleUrl. Schema changes of
+    this model have to be written by hand, as SeparateDatabaseAndState with
+    RunSQL for PostgreSQL; makemigrations output would target constraints that
+    no longer exist.
+    """
+
     title = models.CharField(max_length=500)
     html_content = models.TextField()
     plain_text_content = models.TextField()
     source_url = models.URLField(unique=True)
     published_at = models.DateTimeField()
     source_domain = models.CharField(max_length=255, db_index=True)
+    # Change detection for re-scrapes
+    last_scraped_at = models.DateTimeField(null=True, blank=True, db_index=True)
+    content_hash = models.CharField(max_length=64, blank=True)
+    etag = models.CharField(max_length=255, blank=True)
+    last_modified = models.CharField(max_length=64, blank=True)
 
     def __str__(self):
         return self.title
+
+
+class ArticleUrl(models.Model):
+    """
+    Source URL lookup of the articles table.
+
+    On PostgreSQL articles_article is partitioned by published_at month, and a
+    unique index there must include published_at; the primary key of this table
+    keeps source URLs unique instead. Rows are written by triggers on
+    articles_article (migration 0004), so other databases leave it empty.
+    """
+
+    source_url = models.URLField(primary_key=True)
+    article_id = models.BigIntegerField()
+    published_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        db_table = "articles_article_url"
+
+    def __str__(self):
+        return self.source_url
+
+
+class ExtractionProfile(models.Model):
+    """
+    Site-specific extraction rules for a source domain.
+
+    Selectors are CSS selectors; empty ones fall back to the generic heuristics.
+    """
+
+    source_domain = models.CharField(max_length=255, unique=True)
+    title_selector = models.CharField(max_length=255, blank=True)
+    body_selector = models.CharField(max_length=255, blank=True)
+    date_selector = models.CharField(max_length=255, blank=True)
+    date_attribute = models.CharField(
+        max_length=50,
+        blank=True,
+        help_text="Attribute holding the date (e.g. content, datetime); element text if empty.",
+    )
+    date_format = models.CharField(
+        max_length=100,
+        blank=True,
+        help_text="strptime format of the date; dateparser is used if empty.",
+    )
+    wait_selector = models.CharField(
+        max_length=255,
+        blank=True,
+        help_text="Element to wait for instead of a fixed delay after page load.",
+    )
+    recrawl_hours = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        help_text="Re-scrape articles after this many hours (0: never); "
+        "SCRAPER_RECRAWL_AFTER_HOURS if empty.",
+    )
+    hits = models.PositiveIntegerField(default=0)
+    misses = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return self.source_domain
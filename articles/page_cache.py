@@ -0,0 +1,145 @@
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+class PageCache:
+    """
+    On-disk cache of rendered pages, so reruns and retries skip the browser.
+
+    Entries are gzipped JSON files named by the SHA-256 of the URL. Entries older
+    than ttl seconds are dropped on read; when the files exceed max_bytes, the
+    least recently used ones (file mtime, refreshed on every hit) are evicted.
+    Safe to share between threads; files are replaced atomically.
+
+    Args:
+        directory (str): Cache directory (created on first store).
+        ttl (float): Seconds an entry stays valid.
+        max_bytes (int): Upper bound of the compressed cache size on disk.
+    """
+
+    def __init__(self, directory, ttl=24 * 3600, max_bytes=1024 * 1024 * 1024):
+        self.directory = Path(directory)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        # hits, misses, expired, stores, evictions, bytes_saved
+        self.stats = Counter()
+        self._size = None
+        self._lock = threading.Lock()
+
+    def path(self, url):
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.directory / key[:2] / f"{key}.json.gz"
+
+    def get(self, url):
+        """
+        Returns the cached entry of url (html, size, response, stored_at) or None.
+        """
+        path = self.path(url)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            self._count("misses")
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Dropping unreadable page cache entry {path}: {e}")
+            self._remove(path)
+            self._count("misses")
+            return None
+
+        if entry.get("url") != url:
+            self._count("misses")
+            return None
+        if time.time() - entry["stored_at"] > self.ttl:
+            self._remove(path)
+            self._count("expired")
+            return None
+
+        try:
+            # mtime is the last use, for LRU eviction
+            os.utime(path)
+        except OSError:
+            pass
+        with self._lock:
+            self.stats["hits"] += 1
+            self.stats["bytes_saved"] += entry["bytes"]
+        return entry
+
+    def put(self, url, html, size=None, response=None):
+        """
+        Stores a rendered page and evicts old entries over max_bytes.
+        """
+        entry = {
+            "url": url,
+            "html": html,
+            "size": size,
+            "response": response,
+            "bytes": len(html.encode("utf-8")),
+            "stored_at": time.time(),
+        }
+        path = self.path(url)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb") as f:
+                f.write(json.dumps(entry, ensure_ascii=False).encode("utf-8"))
+            written = os.path.getsize(tmp_path)
+            with self._lock:
+                previous = path.stat().st_size if path.exists() else 0
+                os.replace(tmp_path, path)
+                self.stats["stores"] += 1
+                self._size = self._disk_size() if self._size is None else self._size
+                self._size += written - previous
+                if self._size > self.max_bytes:
+                    self._evict()
+        except OSError as e:
+            logger.warning(f"Could not store {url} in page cache: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _entries(self):
+        return list(self.directory.glob("*/*.json.gz"))
+
+    def _disk_size(self):
+        return sum(path.stat().st_size for path in self._entries())
+
+    def _evict(self):
+        # Called with the lock held
+        entries = []
+        for path in self._entries():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+        self._size = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if self._size <= self.max_bytes:
+                break
+            self._remove(path)
+            self._size -= size
+            self.stats["evictions"] += 1
+
+    def _remove(self, path):
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def _count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+
+    def log_stats(self):
+        logger.info("Page cache stats", extra={"cache": dict(self.stats)})
@@ -0,0 +1,83 @@
+from django.conf import settings
+from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+
+def table_estimate(model, using="default"):
+    """
+    Returns PostgreSQL's planner estimate of the row count of model's table.
+
+    A partitioned table is estimated as the sum of its partitions. Returns None
+    on other databases and for tables never analyzed (reltuples -1 on
+    PostgreSQL 14+, 0 before).
+    """
+    connection = connections[using]
+    if connection.vendor != "postgresql":
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT SUM(reltuples)::bigint FROM pg_class "
+            "WHERE relkind <> 'p' AND reltuples > 0 AND (oid = %(table)s::regclass "
+            "OR oid IN (SELECT inhrelid FROM pg_inherits "
+            "WHERE inhparent = %(table)s::regclass))",
+            {"table": model._meta.db_table},
+        )
+        row = cursor.fetchone()
+    if row is None or not row[0]:
+        return None
+    return row[0]
+
+
+def is_unfiltered(queryset):
+    query = queryset.query
+    return (
+        not query.where
+        and not query.distinct
+        and not query.combinator
+        and query.low_mark == 0
+        and query.high_mark is None
+    )
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that doesn't run SELECT COUNT(*) over a whole large table.
+
+    For unfiltered querysets the planner estimate is used when it is above
+    settings.ESTIMATED_COUNT_THRESHOLD; filtered querysets and small tables get
+    the exact count. With an estimated count any page number is accepted (a page
+    past the real end is just empty), since the estimate may be too low.
+    """
+
+    estimated = False
+
+    @cached_property
+    def count(self):
+        object_list = self.object_list
+        if hasattr(object_list, "query") and is_unfiltered(object_list):
+            estimate = table_estimate(object_list.model, object_list.db)
+            if estimate is not None and estimate > settings.ESTIMATED_COUNT_THRESHOLD:
+                self.estimated = True
+                return estimate
+        return super().count
+
+    def validate_number(self, number):
+        if not self.count or not self.estimated:
+            return super().validate_number(number)
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(self.error_messages["invalid_page"])
+        if number < 1:
+            raise EmptyPage(self.error_messages["min_page"])
+        return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        if not self.estimated:
+            return super().page(number)
+        bottom = (number - 1) * self.per_page
+        return self._get_page(
+            self.object_list[bottom : bottom + self.per_page], number, self
+        )
@@ -0,0 +1,156 @@
+import re
+from datetime import date
+
+from django.conf import settings
+from django.db import connections, transaction
+
+from .models import Article, ArticleUrl
+
+TABLE = Article._meta.db_table
+# Rows outside every monthly partition (e.g. old articles) land here
+DEFAULT_PARTITION = f"{TABLE}_default"
+PARTITION_RE = re.compile(rf"^{TABLE}_p(\d{{4}})(\d{{2}})$")
+# Transaction-local flag: rows moved between partitions keep their URL lookup row
+MOVING_ROWS_SETTING = "articles.moving_rows"
+
+
+def month_start(value):
+    return date(value.year, value.month, 1)
+
+
+def add_months(month, count):
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month):
+    return f"{TABLE}_p{month:%Y%m}"
+
+
+def partition_month(name):
+    """
+    Returns the month of a monthly partition name, None for other tables.
+    """
+    match = PARTITION_RE.match(name)
+    if not match:
+        return None
+    return date(int(match[1]), int(match[2]), 1)
+
+
+def is_partitioned(using="default"):
+    """
+    True when the articles table is a partitioned PostgreSQL table.
+    """
+    connection = connections[using]
+    if connection.vendor != "postgresql":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT relkind FROM pg_class WHERE oid = %s::regclass", [TABLE])
+        row = cursor.fetchone()
+    return row is not None and row[0] == "p"
+
+
+def list_partitions(using="default"):
+    """
+    Returns the months of the existing monthly partitions, oldest first.
+    """
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = %s::regclass",
+            [TABLE],
+        )
+        names = [row[0] for row in cursor.fetchall()]
+    return sorted(filter(None, map(partition_month, names)))
+
+
+def create_partition(month, using="default"):
+    """
+    Creates the partition of one month, moving its rows out of the default partition.
+
+    A partition can't be attached while the default partition holds rows of its
+    range, so they are copied into the new table first. Their source_url lookup
+    rows stay as they are: article id and published_at don't change (the
+    MOVING_ROWS_SETTING flag, local to the transaction, tells the trigger so).
+
+    Returns:
+        int: Rows moved from the default partition.
+    """
+    month = month_start(month)
+    name = partition_name(month)
+    start, end = month.isoformat(), add_months(month, 1).isoformat()
+    connection = connections[using]
+    qn = connection.ops.quote_name
+    with transaction.atomic(using=using), connection.cursor() as cursor:
+        cursor.execute("SELECT set_config(%s, 'on', true)", [MOVING_ROWS_SETTING])
+        cursor.execute(f"CREATE TABLE {qn(name)} (LIKE {qn(TABLE)} INCLUDING DEFAULTS)")
+        cursor.execute(
+            f"WITH moved AS (DELETE FROM {qn(DEFAULT_PARTITION)} "
+            "WHERE published_at >= %s AND published_at < %s RETURNING *) "
+            f"INSERT INTO {qn(name)} SELECT * FROM moved",
+            [start, end],
+        )
+        moved = cursor.rowcount
+        cursor.execute(
+            f"ALTER TABLE {qn(TABLE)} ATTACH PARTITION {qn(name)} "
+            "FOR VALUES FROM (%s) TO (%s)",
+            [start, end],
+        )
+        # The flag would otherwise last until an enclosing transaction ends
+        cursor.execute("SELECT set_config(%s, 'off', true)", [MOVING_ROWS_SETTING])
+    return moved
+
+
+def default_partition_months(using="default"):
+    """
+    Returns the months of the rows in the default partition, oldest first.
+    """
+    qn = connections[using].ops.quote_name
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            "SELECT DISTINCT date_trunc('month', published_at)::date "
+            f"FROM {qn(DEFAULT_PARTITION)} ORDER BY 1"
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+
+def drop_partition(month, using="default"):
+    """
+    Drops the partition of one month together with its source_url lookup rows.
+
+    Returns:
+        int: Lookup rows deleted (articles dropped).
+    """
+    month = month_start(month)
+    qn = connections[using].ops.quote_name
+    with transaction.atomic(using=using):
+        deleted, _ = (
+            ArticleUrl.objects.using(using)
+            .filter(published_at__gte=month, published_at__lt=add_months(month, 1))
+            .delete()
+        )
+        with connections[using].cursor() as cursor:
+            cursor.execute(f"DROP TABLE {qn(partition_name(month))}")
+    return deleted
+
+
+def ensure_partitions(months_ahead=None, using="default", today=None):
+    """
+    Creates the missing partitions from the current month to months_ahead months
+    ahead (settings.ARTICLE_PARTITION_MONTHS_AHEAD by default).
+
+    Returns:
+        list: Months of the created partitions.
+    """
+    if months_ahead is None:
+        months_ahead = settings.ARTICLE_PARTITION_MONTHS_AHEAD
+    current = month_start(today or date.today())
+    existing = set(list_partitions(using))
+    created = []
+    for offset in range(months_ahead + 1):
+        month = add_months(current, offset)
+        if month not in existing:
+            create_partition(month, using)
+            created.append(month)
+    return created
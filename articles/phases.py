@@ -0,0 +1,72 @@
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+# thread id -> (phase name, stack depth of the code that opened the phase);
+# read by the sampling profiler to attribute samples to phases. Only kept up to
+# date while a profiler is running (see start_phase_tracking()).
+active_phases = {}
+_trackers = 0
+_trackers_lock = threading.Lock()
+
+
+def start_phase_tracking():
+    """
+    Makes PhaseTimer record the current phase of each thread in active_phases.
+    """
+    global _trackers
+    with _trackers_lock:
+        _trackers += 1
+
+
+def stop_phase_tracking():
+    global _trackers
+    with _trackers_lock:
+        _trackers = max(_trackers - 1, 0)
+
+
+def stack_depth(frame):
+    depth = 0
+    while frame is not None:
+        depth += 1
+        frame = frame.f_back
+    return depth
+
+
+class PhaseTimer:
+    """
+    Collects wall-clock durations of the phases of a single scrape.
+
+    Usage:
+        timer = PhaseTimer()
+        with timer.phase("fetch"):
+            driver.get(url)
+        timer.as_dict()  # {"fetch": 1.234}
+    """
+
+    def __init__(self):
+        self.durations = {}
+
+    @contextmanager
+    def phase(self, name):
+        tracked = _trackers > 0
+        if tracked:
+            thread_id = threading.get_ident()
+            previous = active_phases.get(thread_id)
+            # Frame 0 is this generator, 1 is contextlib's __enter__, 2 the caller
+            active_phases[thread_id] = (name, stack_depth(sys._getframe(2)))
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            self.durations[name] = self.durations.get(name, 0.0) + elapsed
+            if tracked:
+                if previous is None:
+                    active_phases.pop(thread_id, None)
+                else:
+                    active_phases[thread_id] = previous
+
+    def as_dict(self):
+        return {name: round(seconds, 4) for name, seconds in self.durations.items()}
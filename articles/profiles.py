@@ -0,0 +1,146 @@
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import ExtractionProfile
+
+logger = logging.getLogger(__name__)
+
+_profiles = None
+
+
+@lru_cache(maxsize=None)
+def compile_selector(selector):
+    if not selector:
+        return None
+    import soupsieve
+
+    return soupsieve.compile(selector)
+
+
+@dataclass(frozen=True)
+class CompiledProfile:
+    """
+    In-memory, pre-compiled copy of an ExtractionProfile.
+    """
+
+    pk: int
+    source_domain: str
+    title_selector: str = ""
+    body_selector: str = ""
+    date_selector: str = ""
+    date_attribute: str = ""
+    date_format: str = ""
+    wait_selector: str = ""
+    recrawl_hours: int = None
+
+    @classmethod
+    def from_model(cls, profile):
+        compiled = cls(
+            pk=profile.pk,
+            source_domain=profile.source_domain,
+            title_selector=profile.title_selector,
+            body_selector=profile.body_selector,
+            date_selector=profile.date_selector,
+            date_attribute=profile.date_attribute,
+            date_format=profile.date_format,
+            wait_selector=profile.wait_selector,
+            recrawl_hours=profile.recrawl_hours,
+        )
+        # Fail fast on broken selectors instead of on every scraped page
+        for selector in (
+            compiled.title_selector,
+            compiled.body_selector,
+            compiled.date_selector,
+        ):
+            compile_selector(selector)
+        return compiled
+
+    def extract(self, soup):
+        """
+        Runs the profile selectors against soup.
+
+        Returns:
+            dict: title, body and date_text; a value is None when its selector
+            is not configured or matched nothing.
+        """
+        result = {"title": None, "body": None, "date_text": None}
+
+        title_selector = compile_selector(self.title_selector)
+        if title_selector:
+            tag = title_selector.select_one(soup)
+            if tag:
+                result["title"] = tag.get_text(" ", strip=True) or None
+
+        body_selector = compile_selector(self.body_selector)
+        if body_selector:
+            parts = [t.get_text("\n", strip=True) for t in body_selector.select(soup)]
+            result["body"] = "\n".join(p for p in parts if p) or None
+
+        date_selector = compile_selector(self.date_selector)
+        if date_selector:
+            tag = date_selector.select_one(soup)
+            if tag:
+                if self.date_attribute:
+                    value = tag.get(self.date_attribute)
+                else:
+                    value = tag.get_text(strip=True)
+                result["date_text"] = value or None
+        return result
+
+    def is_hit(self, result):
+        """
+        True when every configured selector produced a value.
+        """
+        configured = {
+            "title": self.title_selector,
+            "body": self.body_selector,
+            "date_text": self.date_selector,
+        }
+        return all(result[key] for key, selector in configured.items() if selector)
+
+
+def load_profiles():
+    """
+    Loads and compiles all extraction profiles into the process-wide cache.
+    """
+    global _profiles
+    from soupsieve import SelectorSyntaxError
+
+    profiles = {}
+    for profile in ExtractionProfile.objects.all():
+        try:
+            profiles[profile.source_domain] = CompiledProfile.from_model(profile)
+        except SelectorSyntaxError:
+            logger.exception(f"Invalid selector in extraction profile {profile}")
+    _profiles = profiles
+    return profiles
+
+
+def get_profile(source_domain):
+    """
+    Returns the CompiledProfile for source_domain or None.
+    """
+    if _profiles is None:
+        load_profiles()
+    return _profiles.get(source_domain)
+
+
+def record_profile_result(profile, hit, count=1):
+    """
+    Increments the hit or miss counter of a profile by count.
+    """
+    counter = "hits" if hit else "misses"
+    ExtractionProfile.objects.filter(pk=profile.pk).update(
+        **{counter: F(counter) + count}
+    )
+
+
+@receiver([post_save, post_delete], sender=ExtractionProfile)
+def invalidate_profiles(sender, **kwargs):
+    global _profiles
+    _profiles = None
@@ -0,0 +1,165 @@
+import marshal
+import os
+import sys
+import threading
+from collections import Counter, defaultdict
+
+from .phases import active_phases, start_phase_tracking, stop_phase_tracking
+
+# Samples taken outside of any PhaseTimer phase
+NO_PHASE = "other"
+
+
+def function_key(code):
+    return (
+        code.co_filename,
+        code.co_firstlineno,
+        getattr(code, "co_qualname", code.co_name),
+    )
+
+
+def function_label(key):
+    filename, _, name = key
+    module = os.path.splitext(os.path.basename(filename))[0]
+    return f"{module}:{name}"
+
+
+class SamplingProfiler:
+    """
+    Wall-clock sampling profiler for scraping threads.
+
+    A background thread takes the stacks of the registered threads every
+    interval seconds and attributes each sample to the thread's current
+    PhaseTimer phase. Unlike cProfile it covers any number of threads at once
+    and its overhead does not depend on how many calls are made.
+
+    Usage:
+        profiler = SamplingProfiler(interval=0.005)
+        profiler.start()
+        profiler.add_thread()             # in every thread to profile
+        ...
+        profiler.stop()
+        profiler.write_pstats("run.pstats")
+        profiler.write_collapsed("run.collapsed")
+    """
+
+    def __init__(self, interval=0.005):
+        self.interval = interval
+        self.threads = set()
+        self.samples = 0
+        # Whole-stack statistics (pstats)
+        self.self_counts = Counter()
+        self.total_counts = Counter()
+        self.callers = defaultdict(Counter)
+        # Per-phase statistics, stacks cut at the code that opened the phase
+        self.phase_samples = Counter()
+        self.phase_counts = defaultdict(Counter)
+        self.collapsed = Counter()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def add_thread(self, thread_id=None):
+        self.threads.add(thread_id or threading.get_ident())
+
+    def start(self):
+        start_phase_tracking()
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="scrape-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+            stop_phase_tracking()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def sample(self):
+        frames = sys._current_frames()
+        for thread_id in list(self.threads):
+            frame = frames.get(thread_id)
+            if frame is not None:
+                self.record(frame, active_phases.get(thread_id))
+
+    def record(self, frame, phase=None):
+        """
+        Adds one sample of the stack ending at frame.
+
+        Args:
+            frame: Innermost frame of the sampled thread.
+            phase (tuple): (phase name, stack depth of the phase owner) or None.
+        """
+        keys = []
+        while frame is not None:
+            keys.append(function_key(frame.f_code))
+            frame = frame.f_back
+        keys.reverse()
+
+        self.samples += 1
+        self.self_counts[keys[-1]] += 1
+        for key in set(keys):
+            self.total_counts[key] += 1
+        for caller, callee in zip(keys, keys[1:]):
+            self.callers[callee][caller] += 1
+
+        name, depth = phase or (NO_PHASE, 1)
+        stack = keys[depth - 1 :] or keys
+        self.phase_samples[name] += 1
+        # The phase owner (e.g. _scrape) is in every sample; rank its callees
+        for key in set(stack[1:]):
+            self.phase_counts[name][key] += 1
+        self.collapsed[";".join([name] + [function_label(k) for k in stack])] += 1
+
+    def write_pstats(self, path):
+        """
+        Writes a pstats-compatible file (load with pstats.Stats(path)).
+
+        Call counts are sample counts and times are samples * interval.
+        """
+        stats = {}
+        for key, total in self.total_counts.items():
+            own = self.self_counts[key]
+            callers = {
+                caller: (count, count, count * self.interval, count * self.interval)
+                for caller, count in self.callers[key].items()
+            }
+            stats[key] = (
+                total,
+                total,
+                own * self.interval,
+                total * self.interval,
+                callers,
+            )
+        with open(path, "wb") as f:
+            marshal.dump(stats, f)
+
+    def write_collapsed(self, path):
+        """
+        Writes "phase;frame;frame count" lines for flamegraph.pl / speedscope.
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in sorted(self.collapsed.items()):
+                f.write(f"{stack} {count}\n")
+
+    def top_functions(self, limit=10):
+        """
+        Returns functions with the most cumulative time in each phase.
+
+        Returns:
+            dict: phase -> (phase seconds, [(function, seconds, share)]),
+            phases ordered by time spent.
+        """
+        result = {}
+        for name, samples in self.phase_samples.most_common():
+            top = [
+                (function_label(key), count * self.interval, count / samples)
+                for key, count in self.phase_counts[name].most_common(limit)
+            ]
+            result[name] = (samples * self.interval, top)
+        return result
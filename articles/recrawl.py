@@ -0,0 +1,130 @@
+import hashlib
+import logging
+import time
+import urllib.error
+import urllib.request
+from datetime import datetime, timedelta
+from urllib.parse import urlparse
+
+from django.conf import settings
+from django.db.models import F, Q
+
+from .models import Article
+from .profiles import load_profiles
+
+logger = logging.getLogger(__name__)
+
+# Article fields needed to decide on and perform a re-scrape
+RECRAWL_FIELDS = [
+    "pk",
+    "source_url",
+    "source_domain",
+    "published_at",
+    "last_scraped_at",
+    "content_hash",
+    "etag",
+    "last_modified",
+]
+
+
+def content_hash(title, plain_text_content):
+    """
+    Returns a SHA-256 hex digest of the extracted content.
+
+    The rendered HTML is not hashed: ads, tracking ids and timestamps change it
+    on every load even when the article itself did not change.
+    """
+    data = f"{title}\n{plain_text_content}".encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+def recrawl_interval(profile=None):
+    """
+    Returns how long a scraped article stays fresh, or None when it never expires.
+    """
+    hours = settings.SCRAPER_RECRAWL_AFTER_HOURS
+    if profile is not None and profile.recrawl_hours is not None:
+        hours = profile.recrawl_hours
+    return timedelta(hours=hours) if hours else None
+
+
+def is_due(article, profile=None, now=None):
+    """
+    True when article should be scraped again under the recrawl policy.
+    """
+    interval = recrawl_interval(profile)
+    if interval is None:
+        return False
+    if article.last_scraped_at is None:
+        return True
+    return (now or datetime.now()) - article.last_scraped_at >= interval
+
+
+def due_articles(now=None):
+    """
+    Returns stored articles due for a re-scrape, never scraped / oldest first.
+    """
+    now = now or datetime.now()
+    custom = {
+        domain: profile
+        for domain, profile in load_profiles().items()
+        if profile.recrawl_hours is not None
+    }
+
+    def stale(interval):
+        return Q(last_scraped_at__isnull=True) | Q(last_scraped_at__lt=now - interval)
+
+    condition = Q(pk__in=[])
+    interval = recrawl_interval()
+    if interval is not None:
+        condition |= ~Q(source_domain__in=custom) & stale(interval)
+    for domain, profile in custom.items():
+        interval = recrawl_interval(profile)
+        if interval is not None:
+            condition |= Q(source_domain=domain) & stale(interval)
+    return Article.objects.filter(condition).order_by(
+        F("last_scraped_at").asc(nulls_first=True), "pk"
+    )
+
+
+def revalidate(article, throttle=None, timeout=10):
+    """
+    Sends a conditional GET with the article's stored ETag/Last-Modified.
+
+    Only the status is read: a 304 means the page is unchanged and the browser
+    fetch can be skipped.
+
+    Returns:
+        int or None: HTTP status, None on network errors.
+    """
+    headers = {}
+    if article.etag:
+        headers["If-None-Match"] = article.etag
+    if article.last_modified:
+        headers["If-Modified-Since"] = article.last_modified
+    request = urllib.request.Request(article.source_url, headers=headers)
+    domain = urlparse(article.source_url).netloc
+
+    if throttle is not None:
+        throttle.acquire(domain)
+    started = time.perf_counter()
+    status, retry_after, error = None, None, False
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            status = response.status
+    except urllib.error.HTTPError as e:
+        # urllib reports 304 as an error too
+        status, retry_after = e.code, e.headers.get("Retry-After")
+    except (urllib.error.URLError, OSError) as e:
+        error = True
+        logger.info(f"Conditional request failed for {article.source_url}: {e}")
+    finally:
+        if throttle is not None:
+            throttle.release(
+                domain,
+                latency=time.perf_counter() - started,
+                status=status,
+                error=error,
+                retry_after=retry_after,
+            )
+    return status
@@ -0,0 +1,129 @@
+import json
+from dataclasses import dataclass, field
+
+from .recrawl import due_articles
+
+# Top-level settings of a daemon configuration file and their defaults
+DAEMON_DEFAULTS = {
+    "workers": 1,
+    "full_text": False,
+    "cache": False,
+    "max_domain_concurrency": 4,
+    "target_latency": 3.0,
+    "ignore_robots": False,
+}
+
+
+@dataclass
+class Schedule:
+    """
+    A crawl that runs every interval seconds.
+
+    Each run queues the configured URLs, the lines of url_file (re-read on every
+    run, so other tools can update it) and, with recrawl_due, up to that many
+    stored articles of domain that are due for a re-scrape.
+    """
+
+    name: str
+    interval: float
+    domain: str = ""
+    urls: list = field(default_factory=list)
+    url_file: str = ""
+    recrawl: bool = False
+    recrawl_due: int = None
+    # time.monotonic() of the next run; 0 runs at once
+    next_run: float = 0.0
+
+    def collect_urls(self):
+        """
+        Returns (url, recrawl) pairs for one run of the schedule.
+        """
+        urls = [(url, self.recrawl) for url in self.urls]
+        if self.url_file:
+            with open(self.url_file, encoding="utf-8") as f:
+                urls.extend(
+                    (line.strip(), self.recrawl)
+                    for line in f
+                    if line.strip() and not line.startswith("#")
+                )
+        if self.recrawl_due:
+            queryset = due_articles()
+            if self.domain:
+                queryset = queryset.filter(source_domain=self.domain)
+            due = queryset.values_list("source_url", flat=True)[: self.recrawl_due]
+            urls.extend((url, True) for url in due)
+        return urls
+
+
+def parse_schedule(data):
+    name = data.get("name") or data.get("domain")
+    if not name:
+        raise ValueError("Every schedule needs a name or a domain.")
+    minutes = data.get("every_minutes")
+    if not isinstance(minutes, (int, float)) or minutes <= 0:
+        raise ValueError(f"Schedule {name}: every_minutes must be a positive number.")
+    urls = data.get("urls", [])
+    if not isinstance(urls, list) or not all(isinstance(url, str) for url in urls):
+        raise ValueError(f"Schedule {name}: urls must be a list of URLs.")
+    recrawl_due = data.get("recrawl_due")
+    if recrawl_due is not None and (
+        not isinstance(recrawl_due, int) or recrawl_due < 1
+    ):
+        raise ValueError(f"Schedule {name}: recrawl_due must be a positive integer.")
+    if not (urls or data.get("url_file") or recrawl_due):
+        raise ValueError(f"Schedule {name}: set urls, url_file or recrawl_due.")
+    return Schedule(
+        name=name,
+        interval=minutes * 60,
+        domain=data.get("domain", ""),
+        urls=urls,
+        url_file=data.get("url_file", ""),
+        recrawl=bool(data.get("recrawl", False)),
+        recrawl_due=recrawl_due,
+    )
+
+
+def load_schedules(path):
+    """
+    Reads a scrape daemon configuration file (JSON).
+
+    Example:
+        {
+            "workers": 2,
+            "schedules": [
+                {"domain": "example.com", "every_minutes": 30,
+                 "url_file": "/data/example-urls.txt", "recrawl_due": 100},
+                {"name": "front pages", "every_minutes": 10,
+                 "urls": ["https://example.org/a"], "recrawl": true}
+            ]
+        }
+
+    Returns:
+        tuple: (settings dict with DAEMON_DEFAULTS filled in, list of Schedules)
+
+    Raises:
+        ValueError: Unreadable or invalid configuration.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except OSError as e:
+        raise ValueError(f"Can't read daemon configuration {path}: {e}")
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON in daemon configuration {path}: {e}")
+    if not isinstance(data, dict):
+        raise ValueError("The daemon configuration must be a JSON object.")
+
+    unknown = set(data) - set(DAEMON_DEFAULTS) - {"schedules"}
+    if unknown:
+        raise ValueError(f"Unknown configuration keys: {', '.join(sorted(unknown))}")
+    options = {key: data.get(key, default) for key, default in DAEMON_DEFAULTS.items()}
+
+    schedules = [parse_schedule(item) for item in data.get("schedules", [])]
+    if not schedules:
+        raise ValueError("The daemon configuration has no schedules.")
+    names = [schedule.name for schedule in schedules]
+    duplicates = {name for name in names if names.count(name) > 1}
+    if duplicates:
+        raise ValueError(f"Duplicate schedule names: {', '.join(sorted(duplicates))}")
+    return options, schedules
@@ -1,72 +1,99 @@
 import logging
-import os
+import re
 import time
+import tracemalloc
 from datetime import datetime
 from urllib.parse import urlparse
 
-import dateparser
-from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
+from django.conf import settings
+
+from .browser import (
+    get_document_response,
+    get_page_source,
+    get_response_header,
+    get_selenium_driver,
+    wait_for_page,
+)
+from .browser_extraction import extract_in_browser
+from .extraction import extract_main_text
+from .head import (
+    DATE_META_NAMES,
+    DATE_META_PROPERTIES,
+    JSON_LD_TYPE,
+    json_ld_date,
+    parse_head,
+)
+from .models import Article
+from .phases import PhaseTimer
+from .profiles import get_profile, record_profile_result
+from .recrawl import RECRAWL_FIELDS, content_hash, is_due, revalidate
 
-try:
-    from webdriver_manager.chrome import ChromeDriverManager
-except ImportError:
-    ChromeDriverManager = None
+# Selenium, BeautifulSoup and dateparser are imported on first use, so importing
+# this module (management command registry, tests, re-extraction) stays cheap.
 
-import re
+logger = logging.getLogger(__name__)
 
-from .models import Article
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-    handlers=[
-        logging.FileHandler("scraper.log", encoding="utf-8"),
-    ],
+ERROR_SIGNATURES_RE = re.compile(
+    r"\b(?:404|500)\b"
+    r"|not found"
+    r"|nie znaleziono"
+    r"|strona nie została znaleziona"
+    r"|internal server error"
+    r"|błąd serwera",
+    re.IGNORECASE,
+)
+# Scrape outcomes (see scrape_article_selenium()) of pages that could not be
+# stored; the others are saved/updated or skipped (duplicate, fresh, unchanged,
+# not_modified)
+FAILED_OUTCOMES = frozenset(
+    ["error", "fetch_error", "error_page", "too_large", "rejected"]
 )
+# Pages with less text than this are rejected as empty (blocked, not rendered).
+# Measured on the whole page, so short articles (briefs, live updates) are kept.
+MIN_PAGE_TEXT_LENGTH = 200
+DATE_PATTERNS = [
+    r"\d{1,2} [a-ząćęłńóśźż]+ \d{4}",
+    r"\d{1,2} [A-Za-z]+ \d{4}",
+    r"\d{2}\.\d{2}\.\d{4}",
+    r"\d+\s+(hours?|minutes?|days?)\s+ago",
+    r"\d+\s+godzin(y)?\s+temu",
+    r"\d+\s+minut(y)?\s+temu",
+    r"\d+\s+dni\s+temu",
+]
+RELATIVE_WORDS = r"(yesterday|today|wczoraj|dzisiaj)"
 
 
-def get_selenium_driver():
+def looks_like_error_page(soup):
     """
-    Creates webdriver Selenium in local or remote mode.
-    Mode chosen by environment variable REMOTE_SELENIUM.
+    Fallback error page heuristic used when the HTTP status is unknown.
+
+    Only the title and top-level headings are checked, so articles that merely
+    mention e.g. "500" in their body are not rejected.
     """
-    remote = os.environ.get("REMOTE_SELENIUM", "false").lower() == "true"
-    options = Options()
-    options.add_argument("--headless")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--window-size=1920,1080")
-    chrome_bin = os.environ.get("CHROME_BINARY")
-    if chrome_bin:
-        options.binary_location = chrome_bin
+    candidates = [soup.title.string if soup.title and soup.title.string else ""]
+    candidates.extend(h.get_text(" ", strip=True) for h in soup.find_all(["h1", "h2"]))
+    return has_error_signature(candidates)
 
-    if remote:
-        selenium_url = os.environ.get("SELENIUM_URL", "http://selenium:4444/wd/hub")
-        return webdriver.Remote(command_executor=selenium_url, options=options)
-    else:
-        if ChromeDriverManager is None:
-            raise RuntimeError("webdriver_manager must be installed locally!")
-        return webdriver.Chrome(
-            service=Service(ChromeDriverManager().install()), options=options
-        )
+
+def has_error_signature(texts):
+    return any(ERROR_SIGNATURES_RE.search(text) for text in texts if text)
 
 
 def extract_date_text(soup):
     for tag in soup.find_all("meta"):
-        if tag.get("property") in [
-            "article:published_time",
-            "og:published_time",
-            "datePublished",
-        ]:
+        if tag.get("property") in DATE_META_PROPERTIES:
             if tag.get("content"):
                 return tag.get("content")
-        if tag.get("name") in ["date", "publishdate", "pubdate"]:
+        if tag.get("name") in DATE_META_NAMES:
             if tag.get("content"):
                 return tag.get("content")
 
+    for script in soup.find_all("script", type=JSON_LD_TYPE):
+        date_text = json_ld_date(script.string or "")
+        if date_text:
+            return date_text
+
     for t in soup.find_all("time"):
         txt = t.get_text(strip=True)
         if txt:
@@ -75,140 +102,605 @@ def extract_date_text(soup):
         if datetime_attr:
             return datetime_attr
 
-    date_patterns = [
-        r"\d{1,2} [a-ząćęłńóśźż]+ \d{4}",
-        r"\d{1,2} [A-Za-z]+ \d{4}",
-        r"\d{2}\.\d{2}\.\d{4}",
-        r"\d+\s+(hours?|minutes?|days?)\s+ago",
-        r"\d+\s+godzin(y)?\s+temu",
-        r"\d+\s+minut(y)?\s+temu",
-        r"\d+\s+dni\s+temu",
-    ]
-    relative_words = r"(yesterday|today|wczoraj|dzisiaj)"
-
     for tag in soup.find_all(["p", "span", "div"]):
         txt = tag.get_text(strip=True)
-        for pat in date_patterns:
+        for pat in DATE_PATTERNS:
             match = re.search(pat, txt, re.IGNORECASE)
             if match:
                 return match.group(0)
-        if re.search(relative_words, txt, re.IGNORECASE):
+        if re.search(RELATIVE_WORDS, txt, re.IGNORECASE):
             return txt
 
     # Fallback: scan the main text (sometimes date in header/footer)
-    main_text = soup.get_text(separator=" ", strip=True)
-    for pat in date_patterns:
-        match = re.search(pat, main_text, re.IGNORECASE)
+    return match_date_text(soup.get_text(separator=" ", strip=True))
+
+
+def match_date_text(text):
+    """
+    Returns the first date-like substring of text (see DATE_PATTERNS), or None.
+    """
+    for pat in DATE_PATTERNS:
+        match = re.search(pat, text, re.IGNORECASE)
         if match:
             return match.group(0)
-    match = re.search(relative_words, main_text, re.IGNORECASE)
+    match = re.search(RELATIVE_WORDS, text, re.IGNORECASE)
     if match:
         return match.group(0)
-
     return None
 
 
-def scrape_article_selenium(url):
+def parse_published_date(published_str, date_format=None):
+    """
+    Parses a raw date string to a naive datetime normalized to midnight.
+
+    Tries date_format (strptime) first when given, then dateparser.
+    Returns None when the string can't be parsed.
+    """
+    import dateparser
+
+    published_date = None
+    if date_format:
+        try:
+            published_date = datetime.strptime(published_str, date_format)
+        except ValueError:
+            pass
+    if published_date is None:
+        published_date = dateparser.parse(
+            published_str,
+            languages=["pl", "en"],
+            settings={
+                "TIMEZONE": "Europe/Warsaw",
+                "RETURN_AS_TIMEZONE_AWARE": False,
+                "RELATIVE_BASE": datetime.now(),
+            },
+        )
+    if published_date is None:
+        return None
+    return published_date.replace(
+        hour=0, minute=0, second=0, microsecond=0, tzinfo=None
+    )
+
+
+def extract_article_fields(
+    html_content, url, profile=None, full_text=False, check_error_page=True
+):
+    """
+    Runs the extraction pipeline on a rendered page, without touching the database.
+
+    Used for live scrapes as well as for re-extraction from stored HTML.
+
+    Args:
+        html_content (str): Rendered page HTML.
+        url (str): Page URL (used for logging).
+        profile (CompiledProfile or None): Extraction profile of the page's domain.
+        full_text (bool): Keep text of the whole page instead of the article body only.
+        check_error_page (bool): Apply the title/heading error page heuristic.
+
+    Returns:
+        dict or None: title, plain_text_content, published_at (None when no date
+        was found) and profile_hit (None without a profile); None when the page
+        looks like an error page or has too little text.
+    """
+    from bs4 import BeautifulSoup
+
+    # Most pages carry the date in head meta tags or JSON-LD: reading the head
+    # alone is cheap and spares the body scans of extract_date_text()
+    head = parse_head(html_content)
+    soup = BeautifulSoup(html_content, "html.parser")
+
+    if check_error_page and looks_like_error_page(soup):
+        logger.warning(f"Possible error page (404/500) for {url}")
+        return None
+
+    profile_result = {"title": None, "body": None, "date_text": None}
+    if profile is not None:
+        profile_result = profile.extract(soup)
+
+    title = profile_result["title"] or (
+        soup.title.string.strip() if soup.title and soup.title.string else "No title"
+    )
+    published_str = (
+        profile_result["date_text"] or head.date_text or extract_date_text(soup)
+    )
+    page_text = soup.get_text(separator="\n", strip=True)
+    if len(page_text) < MIN_PAGE_TEXT_LENGTH:
+        logger.warning(f"Too short HTML for {url}")
+        return None
+    if full_text:
+        plain_text_content = page_text
+    else:
+        # Runs last: strips boilerplate from soup in place
+        plain_text_content = profile_result["body"] or extract_main_text(soup)
+
+    published_at = None
+    if published_str:
+        published_at = parse_published_date(
+            published_str, profile.date_format if profile else None
+        )
+
+    # Break the tree's reference cycles now instead of waiting for the GC
+    soup.decompose()
+    return {
+        "title": title,
+        "plain_text_content": plain_text_content,
+        "published_at": published_at,
+        "profile_hit": profile.is_hit(profile_result) if profile else None,
+    }
+
+
+def extract_browser_fields(
+    result, url, profile=None, full_text=False, check_error_page=True
+):
+    """
+    Counterpart of extract_article_fields() for an extract_in_browser() result.
+
+    The date is taken from the profile match, the meta tags, JSON-LD, the first
+    <time> element or a date-like phrase of the article text, in this order.
+
+    Returns:
+        dict or None: Same as extract_article_fields().
+    """
+    headings = [result["title"], *result["headings"]]
+    if check_error_page and has_error_signature(headings):
+        logger.warning(f"Possible error page (404/500) for {url}")
+        return None
+
+    profile_result = result["profile"]
+    page_length = len(result["text"]) if full_text else result["page_length"]
+    if page_length < MIN_PAGE_TEXT_LENGTH:
+        logger.warning(f"Too short HTML for {url}")
+        return None
+    plain_text_content = (not full_text and profile_result["body"]) or result["text"]
+
+    published_str = (
+        profile_result["date_text"]
+        or result["meta_date"]
+        or next(filter(None, map(json_ld_date, result["json_ld"])), None)
+        or result["time"]
+        or match_date_text(result["text"])
+    )
+    published_at = None
+    if published_str:
+        published_at = parse_published_date(
+            published_str, profile.date_format if profile else None
+        )
+    return {
+        "title": profile_result["title"] or result["title"] or "No title",
+        "plain_text_content": plain_text_content,
+        "published_at": published_at,
+        "profile_hit": profile.is_hit(profile_result) if profile else None,
+    }
+
+
+def scrape_article_selenium(
+    url,
+    full_text=False,
+    session=None,
+    throttle=None,
+    recrawl=False,
+    cache=None,
+    renderer=None,
+    in_browser=False,
+    capture_html="gzip",
+    return_outcome=False,
+):
     """
     Scrapes a single article using Selenium and BeautifulSoup, and saves to an Article model.
-    - Checks if Article with given source_url already exists (logs and skips if yes)
+    - Checks if Article with given source_url already exists (logs and skips if yes,
+      unless recrawl is set and the article is due under the recrawl policy)
     - Uses Selenium to render page (including JS), retrieves HTML and plain text
+    - Uses the source domain's ExtractionProfile selectors when one exists, with the
+      generic heuristics below as fallback for anything the profile doesn't match
     - Extracts publication date (many formats/edge cases) using extract_date_text()
+    - Stores only the article body as plain text (boilerplate removed), unless full_text
     - Uses dateparser to normalize to Python datetime object
     - Always sets hour/minute/second to 00:00:00
+    - Rejects error pages by the main document HTTP status before parsing; when the
+      status is unknown, falls back to error signatures in the title/headings
     - Handles errors gracefully; logs actions and exceptions (timeout, network, content, error pages)
 
     Args:
         url (str): Target article URL.
+        full_text (bool): Store text of the whole page instead of the article body only.
+        session (BrowserSession or None): Reuse the session's browser (recycled over
+            its memory limit) instead of starting and quitting one for this URL.
+        throttle (AutoThrottle or None): Per-domain rate control; the page load
+            waits for a slot and reports its latency/status/errors back.
+        recrawl (bool): Re-scrape a stored article when it is due. A conditional
+            request with its ETag/Last-Modified runs first (304: browser skipped),
+            and the row is rewritten only when the content hash changed.
+        cache (PageCache or None): Serve the rendered page from this on-disk cache
+            when present, and store fresh renders in it (not used for recrawls).
+        renderer (TabRenderer or None): Render the page in a tab of a shared
+            browser instead of a browser of its own (session is then unused).
+        in_browser (bool): Run the extraction inside the page and transfer
+            only its result instead of page_source (see extract_in_browser()).
+            Not supported together with renderer.
+        capture_html (str): With in_browser, the raw HTML stored in
+            html_content: "gzip" (compressed in the browser), "plain" or "none"
+            (html_content is left empty).
+        return_outcome (bool): Return (article, outcome) instead of the article.
 
     Returns:
-        Article or None: Saved Article instance, or None if duplicate/error encountered.
+        Article or None: Saved or updated Article instance, or None if
+        duplicate/fresh/unchanged/error encountered. With return_outcome a
+        tuple of it and the outcome logged for the scrape ("saved", "updated",
+        "duplicate", ..., FAILED_OUTCOMES).
+
+    Rendered HTML over SCRAPER_MAX_HTML_SIZE characters is truncated or rejected
+    (SCRAPER_OVERSIZE_ACTION). A final structured log record carries the url,
+    domain, outcome, the duration of each phase (fetch, extract, save, ...) and,
+    while tracemalloc is tracing, the peak Python memory of the scrape (the peak is
+    process-wide, so it is only meaningful when scrapes run one at a time).
     """
-    if Article.objects.filter(source_url=url).exists():
-        logging.info(f"Article already exists: {url}")
-        return None
+    timer = PhaseTimer()
+    source_domain = urlparse(url).netloc
+    outcome = "error"
+    if tracemalloc.is_tracing():
+        tracemalloc.reset_peak()
+    try:
+        article, outcome = _scrape(
+            url,
+            source_domain,
+            full_text,
+            timer,
+            session,
+            throttle,
+            recrawl,
+            cache,
+            renderer,
+            in_browser,
+            capture_html,
+        )
+        return (article, outcome) if return_outcome else article
+    finally:
+        peak_memory = None
+        if tracemalloc.is_tracing():
+            peak_memory = tracemalloc.get_traced_memory()[1]
+        logger.info(
+            f"Scrape finished ({outcome}): {url}",
+            extra={
+                "url": url,
+                "domain": source_domain,
+                "outcome": outcome,
+                "phases": timer.as_dict(),
+                "peak_memory": peak_memory,
+            },
+        )
 
-    driver = get_selenium_driver()
+
+def _scrape(
+    url,
+    source_domain,
+    full_text,
+    timer,
+    session=None,
+    throttle=None,
+    recrawl=False,
+    cache=None,
+    renderer=None,
+    in_browser=False,
+    capture_html="gzip",
+):
+    """
+    Body of scrape_article_selenium(); returns (Article or None, outcome).
+    """
+    profile = get_profile(source_domain)
+
+    with timer.phase("dedupe"):
+        existing = Article.objects.filter(source_url=url).only(*RECRAWL_FIELDS).first()
+    if existing is not None:
+        if not recrawl:
+            logger.info(f"Article already exists: {url}")
+            return None, "duplicate"
+        if not is_due(existing, profile):
+            logger.info(f"Article not due for recrawl: {url}")
+            return None, "fresh"
+        if existing.etag or existing.last_modified:
+            with timer.phase("revalidate"):
+                status = revalidate(existing, throttle)
+            if status == 304:
+                Article.objects.filter(pk=existing.pk).update(
+                    last_scraped_at=datetime.now()
+                )
+                logger.info(f"Article not modified (HTTP 304): {url}")
+                return None, "not_modified"
+
+    page = None
+    # Recrawls want the live page, not a cached render
+    if cache is not None and existing is None:
+        with timer.phase("cache"):
+            page = cache.get(url)
+    if page is None:
+        if renderer is not None:
+            page, outcome = _render_in_tab(
+                url, source_domain, profile, timer, renderer, throttle
+            )
+        else:
+            browser_extraction = None
+            if in_browser:
+                browser_extraction = {"full_text": full_text, "capture": capture_html}
+            page, outcome = _render(
+                url,
+                source_domain,
+                profile,
+                timer,
+                session,
+                throttle,
+                browser_extraction,
+            )
+        if page is None:
+            return None, outcome
+        if cache is not None and page["html"]:
+            with timer.phase("cache"):
+                cache.put(url, page["html"], page["size"], page["response"])
+
+    try:
+        html_content, response = page["html"], page["response"]
+        status = response["status"] if response else None
+        with timer.phase("extract"):
+            if page.get("extracted") is not None:
+                fields = extract_browser_fields(
+                    page["extracted"],
+                    url,
+                    profile=profile,
+                    full_text=full_text,
+                    check_error_page=status is None,
+                )
+            else:
+                fields = extract_article_fields(
+                    html_content,
+                    url,
+                    profile=profile,
+                    full_text=full_text,
+                    check_error_page=status is None,
+                )
+        if fields is None:
+            return None, "rejected"
+
+        title = fields["title"]
+        plain_text_content = fields["plain_text_content"]
+        digest = content_hash(title, plain_text_content)
+        last_modified = get_response_header(response, "Last-Modified") or ""
+        scraped = {
+            "last_scraped_at": datetime.now(),
+            "etag": (get_response_header(response, "ETag") or "")[:255],
+            "last_modified": last_modified[:64],
+        }
+
+        with timer.phase("save"):
+            if profile is not None:
+                record_profile_result(profile, fields["profile_hit"])
+            if existing is not None:
+                return _update_article(existing, fields, html_content, digest, scraped)
+            published_date = fields["published_at"] or datetime.now().replace(
+                hour=0, minute=0, second=0, microsecond=0
+            )
+            article = Article.objects.create(
+                title=title,
+                html_content=html_content,
+                plain_text_content=plain_text_content,
+                source_url=url,
+                published_at=published_date,
+                source_domain=source_domain,
+                content_hash=digest,
+                **scraped,
+            )
+        logger.info(
+            f"Article saved: {title} ({published_date.strftime('%d.%m.%Y %H:%M:%S')})"
+        )
+        return article, "saved"
+
+    except Exception:
+        logger.exception(f"Unexpected error while scraping {url}")
+        return None, "error"
+
+
+def _render(
+    url,
+    source_domain,
+    profile,
+    timer,
+    session=None,
+    throttle=None,
+    browser_extraction=None,
+):
+    """
+    Loads url in the browser.
+
+    With browser_extraction (dict with full_text and capture, see
+    extract_in_browser()), the page is extracted in the browser and the result
+    is returned as page["extracted"].
+
+    Returns:
+        tuple: (page, outcome); page is a dict with the html, its size in the
+        browser and the main document response, or None when the page could
+        not be used (outcome says why).
+    """
+    with timer.phase("driver_start"):
+        driver = session.get_driver() if session else get_selenium_driver()
+    healthy = True
     try:
         driver.set_page_load_timeout(20)
+        if throttle is not None:
+            with timer.phase("throttle"):
+                throttle.acquire(source_domain)
+        fetch_error = None
+        response = None
+        fetch_started = time.perf_counter()
+        latency = None
         try:
-            driver.get(url)
-        except Exception as e:
-            logging.error(f"Page load timeout or network error for {url}: {e}")
-            return None
-        time.sleep(3)
-
-        html_content = driver.page_source
-        soup = BeautifulSoup(html_content, "html.parser")
-
-        # Check for 404/500 or error pages in the title or page text
-        page_title = (
-            soup.title.string if soup.title and soup.title.string else ""
-        ).lower()
-        page_text = soup.get_text(separator=" ", strip=True).lower()
-        error_signatures = [
-            "404",
-            "not found",
-            "error 404",
-            "nie znaleziono",
-            "strona nie została znaleziona",
-            "500",
-            "internal server error",
-            "error 500",
-            "błąd serwera",
-        ]
-        if (
-            any(signature in page_title for signature in error_signatures)
-            or any(signature in page_text for signature in error_signatures)
-            or len(page_text) < 200
-        ):
-            logging.warning(
-                f"Possible error page (404/500) or too short HTML for {url}"
+            with timer.phase("fetch"):
+                try:
+                    driver.get(url)
+                    # Page load only: the render wait below is our own delay
+                    latency = time.perf_counter() - fetch_started
+                except Exception as e:
+                    fetch_error = e
+                    logger.error(f"Page load timeout or network error for {url}: {e}")
+                    healthy = False
+                    return None, "fetch_error"
+                wait_for_page(driver, profile)
+            response = get_document_response(driver)
+        finally:
+            if throttle is not None:
+                throttle.release(
+                    source_domain,
+                    latency=latency or time.perf_counter() - fetch_started,
+                    status=response["status"] if response else None,
+                    error=fetch_error is not None,
+                    timeout="timeout" in type(fetch_error).__name__.lower(),
+                    retry_after=get_response_header(response, "Retry-After"),
+                )
+
+        status = response["status"] if response else None
+        if status is not None and status >= 400:
+            logger.warning(f"Error page (HTTP {status}) for {url}")
+            return None, "error_page"
+
+        if browser_extraction is not None:
+            return _extract_in_page(
+                driver, url, profile, timer, response, **browser_extraction
             )
-            return None
 
-        title = (
-            soup.title.string.strip()
-            if soup.title and soup.title.string
-            else "No title"
-        )
-        plain_text_content = soup.get_text(separator="\n", strip=True)
-        published_str = extract_date_text(soup)
-
-        published_date = None
-        if published_str:
-            published_date = dateparser.parse(
-                published_str,
-                languages=["pl", "en"],
-                settings={
-                    "TIMEZONE": "Europe/Warsaw",
-                    "RETURN_AS_TIMEZONE_AWARE": False,
-                    "RELATIVE_BASE": datetime.now(),
-                },
+        with timer.phase("page_source"):
+            html_content, html_size = get_page_source(
+                driver,
+                max_size=settings.SCRAPER_MAX_HTML_SIZE,
+                oversize_action=settings.SCRAPER_OVERSIZE_ACTION,
             )
-        if not published_date:
-            published_date = datetime.now()
+        if html_content is None:
+            logger.warning(f"Page too large ({html_size} characters), skipped: {url}")
+            return None, "too_large"
+        if html_size and len(html_content) < html_size:
+            logger.warning(
+                f"Page truncated from {html_size} to {len(html_content)} characters: {url}"
+            )
+        page = {"html": html_content, "size": html_size, "response": response}
+        return page, "fetched"
 
-        published_date = published_date.replace(
-            hour=0, minute=0, second=0, microsecond=0
-        )
-        source_domain = urlparse(url).netloc
-
-        article = Article.objects.create(
-            title=title,
-            html_content=html_content,
-            plain_text_content=plain_text_content,
-            source_url=url,
-            published_at=published_date,
-            source_domain=source_domain,
-        )
-        logging.info(
-            f"Article saved: {title} ({published_date.strftime('%d.%m.%Y %H:%M:%S')})"
+    except Exception:
+        logger.exception(f"Unexpected error while rendering {url}")
+        healthy = False
+        return None, "error"
+    finally:
+        with timer.phase("driver_quit"):
+            if session is None:
+                driver.quit()
+            elif healthy:
+                session.page_done()
+            else:
+                # The browser may be stuck (e.g. after a timeout): start fresh
+                session.quit()
+
+
+def _extract_in_page(driver, url, profile, timer, response, full_text, capture):
+    """
+    In-browser extraction step of _render(); returns (page, outcome).
+    """
+    with timer.phase("browser_extract"):
+        extracted = extract_in_browser(
+            driver,
+            profile=profile,
+            full_text=full_text,
+            capture_html=capture,
+            max_size=settings.SCRAPER_MAX_HTML_SIZE,
+            oversize_action=settings.SCRAPER_OVERSIZE_ACTION,
         )
-        return article
+    if response is None and extracted["status"]:
+        # No performance log (e.g. some grids): use the navigation timing status
+        response = {"url": driver.current_url, "status": extracted["status"]}
+        if extracted["status"] >= 400:
+            logger.warning(f"Error page (HTTP {extracted['status']}) for {url}")
+            return None, "error_page"
 
-    except Exception as e:
-        logging.exception(f"Unexpected error while scraping {url}")
-        return None
+    html_content, html_size = extracted.pop("html"), extracted.pop("size")
+    if capture != "none":
+        if html_content is None:
+            logger.warning(f"Page too large ({html_size} characters), skipped: {url}")
+            return None, "too_large"
+        if len(html_content) < html_size:
+            logger.warning(
+                f"Page truncated from {html_size} to {len(html_content)} "
+                f"characters: {url}"
+            )
+    page = {
+        "html": html_content or "",
+        "size": html_size,
+        "response": response,
+        "extracted": extracted,
+    }
+    return page, "fetched"
+
+
+def _render_in_tab(url, source_domain, profile, timer, renderer, throttle=None):
+    """
+    Same as _render(), with the page loaded in a tab of renderer's browser.
+    """
+    if throttle is not None:
+        with timer.phase("throttle"):
+            throttle.acquire(source_domain)
+    result = None
+    try:
+        with timer.phase("fetch"):
+            result = renderer.render(url, profile)
     finally:
-        driver.quit()
+        if throttle is not None:
+            response = result.response if result else None
+            throttle.release(
+                source_domain,
+                latency=result.latency if result else None,
+                status=response["status"] if response else None,
+                error=result is None or result.error is not None,
+                timeout=bool(result and result.timed_out),
+                retry_after=get_response_header(response, "Retry-After"),
+            )
+
+    status = result.response["status"] if result.response else None
+    if result.error is not None:
+        logger.error(f"Page load timeout or network error for {url}: {result.error}")
+        return None, "fetch_error"
+    if status is not None and status >= 400:
+        logger.warning(f"Error page (HTTP {status}) for {url}")
+        return None, "error_page"
+    if result.html is None:
+        logger.warning(f"Page too large ({result.size} characters), skipped: {url}")
+        return None, "too_large"
+    if result.size and len(result.html) < result.size:
+        logger.warning(
+            f"Page truncated from {result.size} to {len(result.html)} characters: {url}"
+        )
+    page = {"html": result.html, "size": result.size, "response": result.response}
+    return page, "fetched"
+
+
+def _update_article(article, fields, html_content, digest, scraped):
+    """
+    Stores a re-scrape of article; rows whose content hash is unchanged only get
+    their scrape time and validators updated. Returns (Article or None, outcome).
+    """
+    if digest == article.content_hash:
+        Article.objects.filter(pk=article.pk).update(**scraped)
+        logger.info(f"Article unchanged: {article.source_url}")
+        return None, "unchanged"
+
+    article.title = fields["title"]
+    article.html_content = html_content
+    article.plain_text_content = fields["plain_text_content"]
+    # No date found this time: keep what we had
+    article.published_at = fields["published_at"] or article.published_at
+    article.content_hash = digest
+    for name, value in scraped.items():
+        setattr(article, name, value)
+    article.save(
+        update_fields=[
+            "title",
+            "html_content",
+            "plain_text_content",
+            "published_at",
+            "content_hash",
+            *scraped,
+        ]
+    )
+    logger.info(f"Article updated: {article.title} ({article.source_url})")
+    return article, "updated"
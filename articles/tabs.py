@@ -0,0 +1,286 @@
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from functools import partial
+
+from .browser import (
+    BrowserSession,
+    get_page_source,
+    get_selenium_driver,
+    read_document_responses,
+)
+
+logger = logging.getLogger(__name__)
+
+# Fixed render delay after load, when the profile has no wait_selector
+# (same as wait_for_page())
+RENDER_DELAY = 3.0
+
+
+@dataclass
+class TabResult:
+    """
+    Outcome of rendering one page in a tab.
+
+    html is None when the page failed to load (error), returned an error status
+    (response["status"] >= 400) or was rejected as oversized (size is set).
+    """
+
+    response: dict = None
+    html: str = None
+    size: int = None
+    latency: float = None
+    error: str = None
+    timed_out: bool = False
+
+
+@dataclass
+class _Tab:
+    url: str
+    profile: object
+    future: Future = field(default_factory=Future)
+    handle: str = None
+    started: float = 0.0
+    loaded_at: float = None
+
+
+class TabRenderer:
+    """
+    Renders several pages at once in tabs of a single browser.
+
+    WebDriver sessions are not thread-safe, so one thread owns the browser: it
+    opens a tab per queued URL (up to max_tabs), starts loading it without
+    waiting (pageLoadStrategy "none"), and polls the open tabs. A tab is
+    collected once the document has loaded and its wait condition holds (the
+    profile's wait_selector, or a fixed render delay), then closed. Scraping
+    threads call render() and block until their page is done.
+
+    The browser is recycled over the BrowserSession limits once its open tabs
+    have drained.
+
+    Usage:
+        renderer = TabRenderer(max_tabs=8)
+        try:
+            result = renderer.render(url)     # from several threads
+        finally:
+            renderer.close()
+    """
+
+    def __init__(
+        self,
+        max_tabs=4,
+        driver_factory=None,
+        max_rss_bytes=None,
+        max_pages=None,
+        timeout=20,
+        wait_timeout=10,
+        render_delay=RENDER_DELAY,
+        poll_interval=0.1,
+        max_size=None,
+        oversize_action="truncate",
+    ):
+        self.max_tabs = max_tabs
+        self.session = BrowserSession(
+            max_rss_bytes=max_rss_bytes,
+            max_pages=max_pages,
+            driver_factory=driver_factory
+            or partial(get_selenium_driver, page_load_strategy="none"),
+        )
+        self.timeout = timeout
+        self.wait_timeout = wait_timeout
+        self.render_delay = render_delay
+        self.poll_interval = poll_interval
+        self.max_size = max_size
+        self.oversize_action = oversize_action
+        self.tabs = []
+        # Document responses read from the shared performance log, by URL
+        self.responses = {}
+        self._requests = queue.Queue()
+        self._base_handle = None
+        self._recycle_reason = None
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+    def render(self, url, profile=None):
+        """
+        Loads url in a tab and blocks until it is rendered.
+
+        Returns:
+            TabResult
+        """
+        tab = _Tab(url=url, profile=profile)
+        with self._start_lock:
+            self._start()
+            self._requests.put(tab)
+        return tab.future.result()
+
+    def close(self):
+        """
+        Finishes the open tabs and quits the browser.
+        """
+        with self._start_lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._requests.put(None)
+            thread.join()
+
+    def _start(self):
+        # Called with _start_lock held. A thread that died of an error has
+        # cleared _thread (see _run), so a new one is started.
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="tab-renderer", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self):
+        stopping = False
+        try:
+            while not stopping or self.tabs:
+                stopping = self._open_tabs() or stopping
+                for tab in list(self.tabs):
+                    self._poll(tab)
+                if not self.tabs and self._recycle_reason:
+                    self.session.recycle(self._recycle_reason)
+                    self._recycle_reason = None
+                    self._base_handle = None
+                if self.tabs:
+                    time.sleep(self.poll_interval)
+        except Exception as e:
+            logger.exception("Tab renderer failed")
+            for tab in self.tabs:
+                if not tab.future.done():
+                    tab.future.set_result(TabResult(error=str(e)))
+            self.tabs = []
+        finally:
+            self.session.quit()
+            with self._start_lock:
+                if self._thread is threading.current_thread():
+                    # Crashed: the next render() starts a new thread
+                    self._thread = None
+                # Requests that arrived after close() or a crash
+                while True:
+                    try:
+                        tab = self._requests.get_nowait()
+                    except queue.Empty:
+                        break
+                    if tab is not None:
+                        tab.future.set_result(TabResult(error="Renderer closed"))
+
+    def _open_tabs(self):
+        """
+        Opens tabs for queued URLs while there are free slots; True on close().
+        """
+        while len(self.tabs) < self.max_tabs and not self._recycle_reason:
+            try:
+                # Nothing to poll: wait for work instead of spinning
+                tab = self._requests.get(block=not self.tabs)
+            except queue.Empty:
+                return False
+            if tab is None:
+                return True
+            self._open(tab)
+        return False
+
+    def _open(self, tab):
+        try:
+            driver = self.session.get_driver()
+            if self._base_handle is None:
+                # The first window stays open, so closing tabs never ends the session
+                self._base_handle = driver.current_window_handle
+        except Exception as e:
+            logger.error(f"Could not start the browser for {tab.url}: {e}")
+            tab.future.set_result(TabResult(error=str(e)))
+            # Start a new browser for the next tab
+            self.session.quit()
+            self._base_handle = None
+            return
+        try:
+            driver.switch_to.new_window("tab")
+            tab.handle = driver.current_window_handle
+            tab.started = time.monotonic()
+            self.tabs.append(tab)
+            driver.get(tab.url)
+        except Exception as e:
+            logger.error(f"Could not open tab for {tab.url}: {e}")
+            self._finish(tab, TabResult(error=str(e)))
+            # The browser may be broken: restart it once the other tabs are done
+            self._recycle_reason = self._recycle_reason or "tab error"
+
+    def _poll(self, tab):
+        driver = self.session.driver
+        now = time.monotonic()
+        try:
+            driver.switch_to.window(tab.handle)
+            if tab.loaded_at is None:
+                state = driver.execute_script("return document.readyState")
+                if state == "complete":
+                    tab.loaded_at = now
+                elif now - tab.started > self.timeout:
+                    logger.error(f"Page load timeout for {tab.url}")
+                    self._finish(
+                        tab, TabResult(error="Page load timeout", timed_out=True)
+                    )
+                    return
+                else:
+                    return
+            if not self._rendered(driver, tab, now):
+                return
+            self._finish(tab, self._collect(driver, tab))
+        except Exception as e:
+            logger.error(f"Error while rendering {tab.url} in a tab: {e}")
+            self._finish(tab, TabResult(error=str(e)))
+            self._recycle_reason = self._recycle_reason or "tab error"
+
+    def _rendered(self, driver, tab, now):
+        selector = getattr(tab.profile, "wait_selector", "")
+        waited = now - tab.loaded_at
+        if not selector:
+            return waited >= self.render_delay
+        script = "return !!document.querySelector(arguments[0])"
+        if driver.execute_script(script, selector):
+            return True
+        if waited >= self.wait_timeout:
+            logger.warning(f"Wait condition {selector!r} not met for {tab.url}")
+            return True
+        return False
+
+    def _collect(self, driver, tab):
+        for response in read_document_responses(driver):
+            self.responses.setdefault(response.get("url"), response)
+        current_url = driver.current_url
+        response = self.responses.pop(current_url, None) or self.responses.pop(
+            tab.url, None
+        )
+        result = TabResult(response=response, latency=tab.loaded_at - tab.started)
+        if response and response["status"] >= 400:
+            return result
+        result.html, result.size = get_page_source(
+            driver, max_size=self.max_size, oversize_action=self.oversize_action
+        )
+        return result
+
+    def _finish(self, tab, result):
+        if tab in self.tabs:
+            self.tabs.remove(tab)
+        driver = self.session.driver
+        try:
+            if tab.handle is not None:
+                driver.switch_to.window(tab.handle)
+                driver.close()
+            driver.switch_to.window(self._base_handle)
+        except Exception as e:
+            logger.warning(f"Could not close tab of {tab.url}: {e}")
+        if not self.tabs:
+            # Responses of iframes and redirects nobody asked for
+            self.responses.clear()
+        tab.future.set_result(result)
+
+        self.session.pages += 1
+        reason = self.session.over_limits()
+        if reason:
+            # Stop opening tabs; the browser is recycled once the others finish
+            self._recycle_reason = reason
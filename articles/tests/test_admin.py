@@ -0,0 +1,100 @@
+from datetime import datetime
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from articles.models import Article, ExtractionProfile
+from articles.pagination import EstimatedCountPaginator
+
+
+def create_articles(count, domain="example.com"):
+    Article.objects.bulk_create(
+        Article(
+            title=f"Article {i}",
+            html_content="<p>HTML</p>",
+            plain_text_content="Text",
+            source_url=f"https://{domain}/{i}",
+            published_at=datetime(2025, 1, 1),
+            source_domain=domain,
+        )
+        for i in range(count)
+    )
+
+
+@override_settings(ESTIMATED_COUNT_THRESHOLD=10)
+class EstimatedCountPaginatorTest(TestCase):
+    def setUp(self):
+        create_articles(5)
+
+    @patch("articles.pagination.table_estimate", return_value=1000)
+    def test_should_use_estimate_for_unfiltered_large_table(self, mock_estimate):
+        paginator = EstimatedCountPaginator(Article.objects.order_by("pk"), 2)
+
+        with self.assertNumQueries(1):
+            page = paginator.page(400)
+
+            self.assertEqual(list(page), [])
+        self.assertEqual(paginator.count, 1000)
+        self.assertTrue(paginator.estimated)
+
+    @patch("articles.pagination.table_estimate", return_value=1000)
+    def test_should_count_filtered_querysets_exactly(self, mock_estimate):
+        queryset = Article.objects.filter(title="Article 1").order_by("pk")
+
+        paginator = EstimatedCountPaginator(queryset, 2)
+
+        self.assertEqual(paginator.count, 1)
+        mock_estimate.assert_not_called()
+
+    @patch("articles.pagination.table_estimate", return_value=8)
+    def test_should_count_exactly_below_threshold(self, mock_estimate):
+        paginator = EstimatedCountPaginator(Article.objects.order_by("pk"), 2)
+
+        self.assertEqual(paginator.count, 5)
+        self.assertFalse(paginator.estimated)
+
+
+class ArticleAdminTest(TestCase):
+    def setUp(self):
+        create_articles(3)
+        create_articles(2, domain="other.com")
+        user = User.objects.create_superuser("admin", "admin@example.com", "pass")
+        self.client.force_login(user)
+
+    def test_should_list_articles_without_text_columns(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/admin/articles/article/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Article 2")
+        article_queries = [q["sql"] for q in queries if "articles_article" in q["sql"]]
+        self.assertTrue(article_queries)
+        for sql in article_queries:
+            self.assertNotIn("html_content", sql)
+            self.assertNotIn("plain_text_content", sql)
+
+    def test_should_filter_by_source_domain(self):
+        response = self.client.get(
+            "/admin/articles/article/", {"source_domain": "other.com"}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["cl"].result_count, 2)
+
+    def test_should_offer_profile_domains_without_scanning_articles(self):
+        ExtractionProfile.objects.create(source_domain="other.com")
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/admin/articles/article/")
+
+        changelist = response.context["cl"]
+        choices = [
+            choice["display"]
+            for choice in changelist.filter_specs[0].choices(changelist)
+        ]
+        self.assertEqual(choices, ["All", "other.com"])
+        for query in queries:
+            self.assertNotIn("DISTINCT", query["sql"])
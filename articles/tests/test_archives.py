@@ -0,0 +1,136 @@
+import gzip
+import io
+import tarfile
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+from django.test import SimpleTestCase
+
+from articles.archives import iter_documents, parse_http_response
+
+PAGE = "<html><head><title>Zażółć</title></head><body><p>Treść</p></body></html>"
+
+
+def warc_record(headers, block):
+    lines = ["WARC/1.0"] + [f"{name}: {value}" for name, value in headers.items()]
+    lines.append(f"Content-Length: {len(block)}")
+    return ("\r\n".join(lines) + "\r\n\r\n").encode() + block + b"\r\n\r\n"
+
+
+def http_response(body, status="200 OK", headers=""):
+    head = f"HTTP/1.1 {status}\r\nContent-Type: text/html; charset=utf-8\r\n{headers}"
+    return head.encode() + b"\r\n" + body
+
+
+class DirectoryAndTarballTest(SimpleTestCase):
+    def test_should_read_html_files_of_directory_with_base_url(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            Path(tmp, "news").mkdir()
+            Path(tmp, "news", "a.html").write_text(PAGE, encoding="utf-8")
+            Path(tmp, "notes.txt").write_text("not a page")
+
+            documents = list(iter_documents(tmp, "https://example.com"))
+
+        self.assertEqual([d.url for d in documents], ["https://example.com/news/a.html"])
+        self.assertEqual(documents[0].html, PAGE)
+        self.assertIsNone(documents[0].status)
+
+    def test_should_stream_compressed_tarball(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp, "pages.tar.gz")
+            with tarfile.open(path, "w:gz") as tar:
+                data = PAGE.encode()
+                member = tarfile.TarInfo("./site/b.htm")
+                member.size = len(data)
+                tar.addfile(member, io.BytesIO(data))
+
+            documents = list(iter_documents(str(path), "https://example.com/"))
+
+        self.assertEqual([d.url for d in documents], ["https://example.com/site/b.htm"])
+        self.assertEqual(documents[0].html, PAGE)
+
+    def test_should_require_base_url(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            with self.assertRaises(ValueError):
+                iter_documents(tmp)
+
+    def test_should_reject_unknown_source(self):
+        with self.assertRaises(ValueError):
+            iter_documents("pages.zip", "https://example.com/")
+
+
+class WarcTest(SimpleTestCase):
+    def write_warc(self, tmp, records, compress=False):
+        data = b"".join(records)
+        path = Path(tmp, "crawl.warc.gz" if compress else "crawl.warc")
+        path.write_bytes(gzip.compress(data) if compress else data)
+        return str(path)
+
+    def test_should_read_html_responses_and_skip_other_records(self):
+        records = [
+            warc_record({"WARC-Type": "warcinfo"}, b"software: test"),
+            warc_record(
+                {
+                    "WARC-Type": "request",
+                    "WARC-Target-URI": "https://example.com/a",
+                    "Content-Type": "application/http; msgtype=request",
+                },
+                b"GET /a HTTP/1.1\r\n\r\n",
+            ),
+            warc_record(
+                {
+                    "WARC-Type": "response",
+                    "WARC-Target-URI": "<https://example.com/a>",
+                    "WARC-Date": "2024-05-01T12:30:00Z",
+                    "Content-Type": "application/http; msgtype=response",
+                },
+                http_response(PAGE.encode()),
+            ),
+            warc_record(
+                {
+                    "WARC-Type": "response",
+                    "WARC-Target-URI": "https://example.com/logo.png",
+                    "Content-Type": "application/http; msgtype=response",
+                },
+                b"HTTP/1.1 200 OK\r\nContent-Type: image/png\r\n\r\n\x89PNG",
+            ),
+        ]
+        with tempfile.TemporaryDirectory() as tmp:
+            documents = list(iter_documents(self.write_warc(tmp, records, True)))
+
+        self.assertEqual(len(documents), 1)
+        self.assertEqual(documents[0].url, "https://example.com/a")
+        self.assertEqual(documents[0].html, PAGE)
+        self.assertEqual(documents[0].status, 200)
+        self.assertEqual(documents[0].fetched_at, datetime(2024, 5, 1))
+
+    def test_should_keep_error_status(self):
+        records = [
+            warc_record(
+                {
+                    "WARC-Type": "response",
+                    "WARC-Target-URI": "https://example.com/missing",
+                    "Content-Type": "application/http; msgtype=response",
+                },
+                http_response(b"<html>Not found</html>", status="404 Not Found"),
+            )
+        ]
+        with tempfile.TemporaryDirectory() as tmp:
+            documents = list(iter_documents(self.write_warc(tmp, records)))
+
+        self.assertEqual(documents[0].status, 404)
+
+    def test_should_decode_chunked_gzip_body(self):
+        body = gzip.compress(PAGE.encode())
+        chunked = b"%x\r\n" % 10 + body[:10] + b"\r\n"
+        chunked += b"%x\r\n" % (len(body) - 10) + body[10:] + b"\r\n0\r\n\r\n"
+        block = http_response(
+            chunked,
+            headers="Transfer-Encoding: chunked\r\nContent-Encoding: gzip\r\n",
+        )
+
+        status, headers, decoded = parse_http_response(block)
+
+        self.assertEqual(status, 200)
+        self.assertEqual(decoded.decode(), PAGE)
@@ -0,0 +1,121 @@
+import os
+from unittest.mock import MagicMock, patch
+
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from articles.browser import BrowserSession, get_browser_rss, get_page_source
+from articles.scraper import scrape_article_selenium
+
+PAGE = "<html><head><title>Session</title></head><body>{}</body></html>".format(
+    "S" * 300
+)
+
+
+class GetPageSourceTest(SimpleTestCase):
+    def test_should_return_page_source_within_limit(self):
+        driver = MagicMock(page_source=PAGE)
+        driver.execute_script.return_value = len(PAGE)
+
+        self.assertEqual(get_page_source(driver, max_size=10_000), (PAGE, len(PAGE)))
+
+    def test_should_reject_oversized_page_without_fetching_it(self):
+        driver = MagicMock()
+        driver.execute_script.return_value = 50_000
+
+        html, size = get_page_source(driver, max_size=10_000, oversize_action="reject")
+
+        self.assertIsNone(html)
+        self.assertEqual(size, 50_000)
+        driver.execute_script.assert_called_once()
+
+    def test_should_truncate_oversized_page_in_browser(self):
+        driver = MagicMock()
+        driver.execute_script.side_effect = [50_000, "<html>" + "T" * 9_994]
+
+        html, size = get_page_source(driver, max_size=10_000)
+
+        self.assertEqual(len(html), 10_000)
+        self.assertEqual(size, 50_000)
+        self.assertEqual(driver.execute_script.call_args.args[1], 10_000)
+
+
+class BrowserRssTest(SimpleTestCase):
+    def test_should_measure_local_process_tree(self):
+        driver = MagicMock()
+        driver.service.process.pid = os.getpid()
+
+        rss = get_browser_rss(driver)
+
+        if os.path.exists("/proc"):
+            self.assertGreater(rss, 0)
+
+    def test_should_return_none_for_remote_driver(self):
+        driver = MagicMock(spec=["get", "quit"])
+
+        self.assertIsNone(get_browser_rss(driver))
+
+
+class BrowserSessionTest(SimpleTestCase):
+    def test_should_reuse_driver_until_page_limit(self):
+        factory = MagicMock(side_effect=[MagicMock(), MagicMock()])
+        session = BrowserSession(max_pages=2, driver_factory=factory)
+
+        first = session.get_driver()
+        session.page_done()
+        self.assertIs(session.get_driver(), first)
+        session.page_done()
+
+        self.assertIsNot(session.get_driver(), first)
+        first.quit.assert_called_once()
+        self.assertEqual(session.recycles, 1)
+
+    @patch("articles.browser.get_browser_rss", return_value=600 * 1024 * 1024)
+    def test_should_recycle_driver_over_rss_limit(self, mock_rss):
+        driver = MagicMock()
+        session = BrowserSession(
+            max_rss_bytes=512 * 1024 * 1024, driver_factory=lambda: driver
+        )
+
+        session.get_driver()
+        session.page_done()
+
+        driver.quit.assert_called_once()
+        self.assertIsNone(session.driver)
+        self.assertEqual(session.last_rss, 600 * 1024 * 1024)
+
+
+class ScrapeWithSessionTest(TestCase):
+    def test_should_keep_session_browser_open(self):
+        driver = MagicMock(page_source=PAGE)
+        session = BrowserSession(driver_factory=lambda: driver)
+
+        with patch("articles.browser.time.sleep"):
+            article = scrape_article_selenium("https://example.com/s1", session=session)
+
+        self.assertEqual(article.title, "Session")
+        driver.quit.assert_not_called()
+        self.assertEqual(session.pages, 1)
+
+    def test_should_restart_session_browser_after_fetch_error(self):
+        driver = MagicMock()
+        driver.get.side_effect = Exception("timeout")
+        session = BrowserSession(driver_factory=lambda: driver)
+
+        article = scrape_article_selenium("https://example.com/s2", session=session)
+
+        self.assertIsNone(article)
+        driver.quit.assert_called_once()
+        self.assertIsNone(session.driver)
+
+    @override_settings(SCRAPER_OVERSIZE_ACTION="reject", SCRAPER_MAX_HTML_SIZE=1000)
+    @patch("articles.scraper.get_selenium_driver")
+    def test_should_skip_oversized_page(self, mock_get_driver):
+        driver = MagicMock()
+        driver.execute_script.return_value = 5000
+        mock_get_driver.return_value = driver
+
+        with patch("articles.browser.time.sleep"):
+            article = scrape_article_selenium("https://example.com/huge")
+
+        self.assertIsNone(article)
+        driver.quit.assert_called_once()
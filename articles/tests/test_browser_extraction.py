@@ -0,0 +1,200 @@
+import base64
+import gzip
+from datetime import datetime
+from pathlib import Path
+from unittest import SkipTest
+from unittest.mock import MagicMock, PropertyMock, patch
+
+from django.test import SimpleTestCase, TestCase
+
+from articles.browser import get_selenium_driver
+from articles.browser_extraction import extract_in_browser
+from articles.models import Article
+from articles.scraper import (
+    extract_article_fields,
+    extract_browser_fields,
+    scrape_article_selenium,
+)
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+TEXT = "Treść artykułu, akapit pierwszy. " * 10
+HTML = f"<html><head><title>Title</title></head><body><p>{TEXT}</p></body></html>"
+
+
+def browser_result(**overrides):
+    result = {
+        "title": "Title",
+        "headings": ["Heading"],
+        "meta_date": None,
+        "json_ld": [],
+        "time": None,
+        "profile": {"title": None, "body": None, "date_text": None},
+        "text": TEXT,
+        "page_length": len(TEXT) + 100,
+        "status": None,
+        "html": None,
+        "html_gzip": None,
+        "size": None,
+    }
+    result.update(overrides)
+    return result
+
+
+class ExtractInBrowserTest(SimpleTestCase):
+    def test_should_decode_html_compressed_in_browser(self):
+        driver = MagicMock()
+        driver.execute_async_script.return_value = browser_result(
+            html_gzip=base64.b64encode(gzip.compress(HTML.encode())).decode(),
+            size=len(HTML),
+        )
+
+        result = extract_in_browser(driver, capture_html="gzip", max_size=1000)
+
+        self.assertEqual(result["html"], HTML)
+        self.assertNotIn("html_gzip", result)
+        options = driver.execute_async_script.call_args.args[1]
+        self.assertEqual(options["capture"], "gzip")
+        self.assertEqual(options["maxSize"], 1000)
+
+    def test_should_raise_when_script_fails(self):
+        driver = MagicMock()
+        driver.execute_async_script.return_value = {"error": "TypeError: boom"}
+
+        with self.assertRaisesRegex(RuntimeError, "boom"):
+            extract_in_browser(driver)
+
+
+class ExtractInRealBrowserTest(SimpleTestCase):
+    """
+    Runs the extraction script in a headless browser; skipped where none starts.
+    """
+
+    url = "https://example.com/news/article.html"
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        try:
+            cls.driver = get_selenium_driver()
+        except Exception as e:
+            raise SkipTest(f"No browser available: {e}")
+        cls.addClassCleanup(cls.driver.quit)
+
+    def load(self, html):
+        data = base64.b64encode(html.encode()).decode()
+        self.driver.get(f"data:text/html;charset=utf-8;base64,{data}")
+
+    def test_should_match_python_extraction_on_article_page(self):
+        html = (FIXTURES_DIR / "news_article.html").read_text(encoding="utf-8")
+        self.load(html)
+
+        for full_text in [False, True]:
+            with self.subTest(full_text=full_text):
+                result = extract_in_browser(self.driver, full_text=full_text)
+
+                self.assertEqual(
+                    extract_browser_fields(result, self.url, full_text=full_text),
+                    extract_article_fields(html, self.url, full_text=full_text),
+                )
+                self.assertIn("<title>", result["html"])
+                self.assertEqual(len(result["html"]), result["size"])
+
+    def test_should_leave_code_out_of_page_text(self):
+        script = "var bundle = '" + "x" * 1000 + "';"
+        self.load(
+            f"<html><head><title>App</title><script>{script}</script>"
+            "<style>body { margin: 0; }</style></head>"
+            '<body><div id="app"></div></body></html>'
+        )
+
+        result = extract_in_browser(self.driver, capture_html="none")
+
+        self.assertEqual(result["page_length"], len("App"))
+        self.assertIsNone(extract_browser_fields(result, self.url))
+
+
+class ExtractBrowserFieldsTest(SimpleTestCase):
+    def test_should_prefer_meta_date_then_json_ld_then_time(self):
+        json_ld = ['{"@type": "NewsArticle", "datePublished": "2025-02-02"}']
+        cases = [
+            (browser_result(meta_date="2025-01-01", json_ld=json_ld), 1),
+            (browser_result(json_ld=json_ld, time="03.03.2025"), 2),
+            (browser_result(time="03.03.2025"), 3),
+        ]
+
+        for result, month in cases:
+            fields = extract_browser_fields(result, "https://example.com/a")
+            self.assertEqual(fields["published_at"], datetime(2025, month, month))
+
+    def test_should_find_date_phrase_in_text(self):
+        result = browser_result(text=TEXT + " Opublikowano 15 stycznia 2025")
+
+        fields = extract_browser_fields(result, "https://example.com/a")
+
+        self.assertEqual(fields["published_at"], datetime(2025, 1, 15))
+
+    def test_should_reject_error_pages_and_short_text(self):
+        error_page = browser_result(title="404 Not Found")
+        short = browser_result(text="Too short", page_length=9)
+
+        self.assertIsNone(extract_browser_fields(error_page, "https://example.com/a"))
+        self.assertIsNotNone(
+            extract_browser_fields(
+                error_page, "https://example.com/a", check_error_page=False
+            )
+        )
+        self.assertIsNone(extract_browser_fields(short, "https://example.com/a"))
+
+    def test_should_keep_short_article_on_full_page(self):
+        result = browser_result(text="A short brief.", page_length=1500)
+
+        fields = extract_browser_fields(result, "https://example.com/a")
+
+        self.assertEqual(fields["plain_text_content"], "A short brief.")
+
+
+@patch("articles.scraper.wait_for_page")
+@patch("articles.scraper.get_selenium_driver")
+class ScrapeInBrowserTest(TestCase):
+    def make_driver(self, mock_get_driver, **overrides):
+        driver = MagicMock()
+        driver.get_log.return_value = []
+        driver.current_url = "https://example.com/a"
+        driver.execute_async_script.return_value = browser_result(**overrides)
+        type(driver).page_source = PropertyMock(side_effect=AssertionError)
+        mock_get_driver.return_value = driver
+        return driver
+
+    def test_should_save_article_without_reading_page_source(
+        self, mock_get_driver, mock_wait
+    ):
+        self.make_driver(mock_get_driver, html=HTML, size=len(HTML))
+
+        article = scrape_article_selenium(
+            "https://example.com/a", in_browser=True, capture_html="plain"
+        )
+
+        self.assertEqual(article.title, "Title")
+        self.assertEqual(article.plain_text_content, TEXT)
+        self.assertEqual(article.html_content, HTML)
+
+    def test_should_leave_html_empty_without_capture(self, mock_get_driver, mock_wait):
+        self.make_driver(mock_get_driver)
+
+        scrape_article_selenium(
+            "https://example.com/a", in_browser=True, capture_html="none"
+        )
+
+        self.assertEqual(Article.objects.get().html_content, "")
+
+    def test_should_use_navigation_status_without_performance_log(
+        self, mock_get_driver, mock_wait
+    ):
+        self.make_driver(mock_get_driver, status=404)
+
+        article = scrape_article_selenium(
+            "https://example.com/a", in_browser=True, capture_html="none"
+        )
+
+        self.assertIsNone(article)
+        self.assertFalse(Article.objects.exists())
@@ -0,0 +1,445 @@
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from io import StringIO
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from django.core.management import CommandError, call_command
+from django.db import IntegrityError
+from django.test import TransactionTestCase
+
+from articles.management.commands.seed_articles import Command as SeedCommand
+from articles.models import Article
+from articles.phases import PhaseTimer
+
+ARTICLE_HTML = """
+    <html>
+        <head>
+            <title>Stored article</title>
+            <meta property="article:published_time" content="2025-03-02T10:00:00Z">
+        </head>
+        <body>
+            <nav><a href="/">Home</a> <a href="/news">News</a></nav>
+            <article>
+                <p>First paragraph of the stored article, long enough to be content.</p>
+                <p>Second paragraph, with some commas, details, and more words. {}</p>
+            </article>
+            <footer>Footer text, all rights reserved.</footer>
+        </body>
+    </html>
+""".format(
+    "R" * 200
+)
+
+
+class ReextractArticlesCommandTest(TransactionTestCase):
+    def setUp(self):
+        self.article = Article.objects.create(
+            title="Old title",
+            html_content=ARTICLE_HTML,
+            plain_text_content="Home\nNews\nOld full page text\nFooter text",
+            source_url="https://example.com/stored",
+            published_at=datetime(2025, 1, 1),
+            source_domain="example.com",
+        )
+        self.other = Article.objects.create(
+            title="Other",
+            html_content=ARTICLE_HTML,
+            plain_text_content="untouched",
+            source_url="https://other.com/stored",
+            published_at=datetime(2025, 1, 1),
+            source_domain="other.com",
+        )
+
+    def call(self, *args):
+        out = StringIO()
+        call_command("reextract_articles", "--workers", "2", *args, stdout=out)
+        return out.getvalue()
+
+    def test_should_update_changed_articles(self):
+        output = self.call("--domain", "example.com")
+
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.title, "Stored article")
+        self.assertEqual(self.article.published_at, datetime(2025, 3, 2))
+        self.assertIn("First paragraph", self.article.plain_text_content)
+        self.assertNotIn("Footer text", self.article.plain_text_content)
+        self.other.refresh_from_db()
+        self.assertEqual(self.other.plain_text_content, "untouched")
+        self.assertIn("Updated 1", output)
+
+    def test_should_only_report_changes_in_dry_run(self):
+        output = self.call("--dry-run")
+
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.title, "Old title")
+        self.assertIn(f"#{self.article.pk} https://example.com/stored", output)
+        self.assertIn("title: 'Old title' -> 'Stored article'", output)
+        self.assertIn("-Old full page text", output)
+        self.assertIn("Would update 2", output)
+
+    def test_should_resume_from_start_id(self):
+        self.call("--start-id", str(self.other.pk))
+
+        self.article.refresh_from_db()
+        self.other.refresh_from_db()
+        self.assertEqual(self.article.title, "Old title")
+        self.assertEqual(self.other.title, "Stored article")
+
+    def test_should_filter_by_published_date(self):
+        output = self.call("--published-after", "2025-02-01")
+
+        self.assertIn("Processed 0 article(s)", output)
+
+    def test_should_keep_existing_date_when_none_found(self):
+        self.article.html_content = ARTICLE_HTML.replace("article:published_time", "x")
+        self.article.save()
+
+        self.call("--domain", "example.com")
+
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.published_at, datetime(2025, 1, 1))
+
+
+class ScrapeArticlesCommandTest(TransactionTestCase):
+    @patch("articles.management.commands.scrape_articles.scrape_article_selenium")
+    def test_should_scrape_urls_concurrently_with_shared_throttle(self, mock_scrape):
+        mock_scrape.return_value = None
+        urls = [f"https://example.com/{i}" for i in range(4)]
+        out = StringIO()
+
+        call_command(
+            "scrape_articles", *urls, "--workers", "2", "--ignore-robots", stdout=out
+        )
+
+        self.assertCountEqual([c.args[0] for c in mock_scrape.call_args_list], urls)
+        throttles = {id(c.kwargs["throttle"]) for c in mock_scrape.call_args_list}
+        self.assertEqual(len(throttles), 1)
+        self.assertIn("Scraping finished!", out.getvalue())
+
+    def test_should_refuse_memory_tracking_of_concurrent_scrapes(self):
+        for option in ["--workers", "--tabs"]:
+            with self.subTest(option=option):
+                with self.assertRaisesMessage(CommandError, "--track-memory"):
+                    call_command(
+                        "scrape_articles",
+                        "https://example.com/1",
+                        "--track-memory",
+                        option,
+                        "2",
+                        stdout=StringIO(),
+                    )
+
+    @patch("articles.management.commands.scrape_articles.scrape_article_selenium")
+    def test_should_report_peak_memory_of_each_scrape(self, mock_scrape):
+        def scrape(url, **kwargs):
+            # Like scrape_article_selenium(), which resets the peak first
+            tracemalloc.reset_peak()
+            buffer = bytearray(int(url[-1]) * 1024 * 1024)
+            del buffer
+
+        mock_scrape.side_effect = scrape
+        out = StringIO()
+
+        call_command(
+            "scrape_articles",
+            "https://example.com/4",
+            "https://example.com/1",
+            "--track-memory",
+            "--ignore-robots",
+            stdout=out,
+        )
+
+        self.assertRegex(
+            out.getvalue(),
+            r"Peak Python memory per scrape: max 4\.\d MB, mean 2\.\d MB",
+        )
+
+    @patch("articles.management.commands.scrape_articles.scrape_article_selenium")
+    def test_should_report_throttle_state(self, mock_scrape):
+        def scrape(url, throttle, **kwargs):
+            throttle.acquire("example.com")
+            throttle.release("example.com", latency=0.5, status=200)
+
+        mock_scrape.side_effect = scrape
+        out = StringIO()
+
+        call_command(
+            "scrape_articles", "https://example.com/a", "--ignore-robots", stdout=out
+        )
+
+        self.assertIn("example.com: concurrency 2", out.getvalue())
+
+    @patch("articles.management.commands.scrape_articles.scrape_article_selenium")
+    def test_should_write_profile_per_run(self, mock_scrape):
+        def scrape(url, **kwargs):
+            with PhaseTimer().phase("extract"):
+                time.sleep(0.05)
+
+        mock_scrape.side_effect = scrape
+        out = StringIO()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            call_command(
+                "scrape_articles",
+                "https://example.com/a",
+                "https://example.com/b",
+                "--workers",
+                "2",
+                "--ignore-robots",
+                "--profile",
+                "--profile-dir",
+                tmp,
+                "--profile-interval",
+                "1",
+                stdout=out,
+            )
+            files = sorted(path.suffix for path in Path(tmp).iterdir())
+
+        self.assertEqual(files, [".collapsed", ".pstats"])
+        self.assertIn("Phase extract:", out.getvalue())
+
+    @patch("articles.management.commands.scrape_articles.scrape_article_selenium")
+    def test_should_share_tab_renderers_between_workers(self, mock_scrape):
+        mock_scrape.return_value = None
+        urls = [f"https://example.com/{i}" for i in range(6)]
+        out = StringIO()
+
+        call_command(
+            "scrape_articles",
+            *urls,
+            "--tabs",
+            "2",
+            "--workers",
+            "4",
+            "--ignore-robots",
+            stdout=out,
+        )
+
+        calls = mock_scrape.call_args_list
+        self.assertLessEqual(len({id(c.kwargs["renderer"]) for c in calls}), 2)
+        self.assertTrue(all(c.kwargs["session"] is None for c in calls))
+        self.assertIn(
+            "Rendering in 2 browser(s) with up to 2 tab(s) each.", out.getvalue()
+        )
+
+    @patch("articles.management.commands.scrape_articles.scrape_article_selenium")
+    def test_should_recrawl_due_articles(self, mock_scrape):
+        mock_scrape.return_value = None
+        for name, scraped_at in [("due", datetime(2025, 1, 1)), ("fresh", None)]:
+            Article.objects.create(
+                title=name,
+                html_content="<p>x</p>",
+                plain_text_content="x",
+                source_url=f"https://example.com/{name}",
+                published_at=datetime(2025, 1, 1),
+                source_domain="example.com",
+                last_scraped_at=scraped_at or datetime.now(),
+            )
+        out = StringIO()
+
+        call_command(
+            "scrape_articles", "--recrawl-due", "10", "--ignore-robots", stdout=out
+        )
+
+        mock_scrape.assert_called_once()
+        self.assertEqual(mock_scrape.call_args.args, ("https://example.com/due",))
+        self.assertTrue(mock_scrape.call_args.kwargs["recrawl"])
+        self.assertIn("1 stored article(s) due for recrawl.", out.getvalue())
+
+
+class SeedArticlesCommandTest(TransactionTestCase):
+    def test_should_create_requested_corpus(self):
+        out = StringIO()
+
+        call_command(
+            "seed_articles",
+            "--count",
+            "25",
+            "--domains",
+            "3",
+            "--start-date",
+            "2025-01-01",
+            "--days",
+            "10",
+            "--text-size",
+            "500:600",
+            "--batch-size",
+            "10",
+            "--seed",
+            "1",
+            stdout=out,
+        )
+
+        articles = Article.objects.all()
+        self.assertEqual(articles.count(), 25)
+        self.assertLessEqual(articles.values("source_domain").distinct().count(), 3)
+        for article in articles:
+            self.assertGreaterEqual(article.published_at, datetime(2025, 1, 1))
+            self.assertLess(article.published_at, datetime(2025, 1, 11))
+            self.assertGreaterEqual(len(article.plain_text_content), 500)
+            self.assertIn(article.title, article.html_content)
+        self.assertIn("Created 25 article(s) across 3 domain(s)", out.getvalue())
+
+    def test_should_allow_repeated_runs(self):
+        for _ in range(2):
+            call_command(
+                "seed_articles", "--count", "5", "--seed", "1", stdout=StringIO()
+            )
+
+        self.assertEqual(Article.objects.count(), 10)
+
+    @patch(
+        "articles.management.commands.seed_articles.connection",
+        MagicMock(vendor="sqlite"),
+    )
+    def test_should_reject_copy_outside_postgresql(self):
+        with self.assertRaises(CommandError):
+            call_command("seed_articles", "--count", "5", "--method", "copy")
+
+    def test_should_copy_every_required_column(self):
+        connection = MagicMock(vendor="postgresql")
+        connection.ops.quote_name = lambda name: f'"{name}"'
+        cursor = connection.cursor.return_value.__enter__.return_value
+        row = {
+            "title": "Title",
+            "html_content": "<p>HTML</p>",
+            "plain_text_content": "Text",
+            "source_url": "https://site1.example.com/seed/1",
+            "published_at": datetime(2025, 1, 1),
+            "source_domain": "site1.example.com",
+            "content_hash": "",
+            "etag": "",
+            "last_modified": "",
+        }
+
+        with (
+            patch("articles.management.commands.seed_articles.connection", connection),
+            patch("articles.management.commands.seed_articles.transaction"),
+        ):
+            SeedCommand().copy_rows([row])
+
+        sql, buffer = cursor.copy_expert.call_args.args
+        self.assertEqual(
+            sql,
+            'COPY "articles_article" ("title", "html_content", "plain_text_content", '
+            '"source_url", "published_at", "source_domain", "content_hash", "etag", '
+            '"last_modified") FROM STDIN WITH (FORMAT csv)',
+        )
+        required = {
+            field.name
+            for field in Article._meta.concrete_fields
+            if not field.null and not field.primary_key
+        }
+        self.assertEqual(required, set(row))
+        self.assertEqual(
+            buffer.getvalue().strip(),
+            '"Title","<p>HTML</p>","Text","https://site1.example.com/seed/1",'
+            '"2025-01-01T00:00:00","site1.example.com","","",""',
+        )
+
+    def test_should_reject_invalid_start_date(self):
+        with self.assertRaises(CommandError):
+            call_command("seed_articles", "--start-date", "2025-13-01")
+
+
+class IngestHtmlCommandTest(TransactionTestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        for name, html in {
+            "a.html": ARTICLE_HTML,
+            "b.html": ARTICLE_HTML.replace("Stored article", "Second article"),
+            "404.html": "<html><head><title>404 Not Found</title></head></html>",
+            "existing.html": ARTICLE_HTML,
+        }.items():
+            Path(self.tmp.name, name).write_text(html, encoding="utf-8")
+        Article.objects.create(
+            title="Existing",
+            html_content="<p>Existing</p>",
+            plain_text_content="Existing",
+            source_url="https://example.com/news/existing.html",
+            published_at=datetime(2025, 1, 1),
+            source_domain="example.com",
+        )
+
+    def ingest(self, *args):
+        out = StringIO()
+        call_command(
+            "ingest_html",
+            self.tmp.name,
+            "--base-url",
+            "https://example.com/news/",
+            "--workers",
+            "2",
+            "--batch-size",
+            "2",
+            *args,
+            stdout=out,
+        )
+        return out.getvalue()
+
+    def test_should_import_new_pages_and_skip_existing_and_error_pages(self):
+        output = self.ingest()
+
+        article = Article.objects.get(source_url="https://example.com/news/a.html")
+        self.assertEqual(article.title, "Stored article")
+        self.assertEqual(article.source_domain, "example.com")
+        self.assertEqual(article.published_at, datetime(2025, 3, 2))
+        self.assertNotIn("Home", article.plain_text_content)
+        self.assertEqual(Article.objects.count(), 3)
+        self.assertIn(
+            "Read 4 document(s). Created 2, duplicates 1, error pages 0, "
+            "too large 0, rejected by extraction 1.",
+            output,
+        )
+
+    def test_should_skip_already_imported_pages_on_rerun(self):
+        self.ingest()
+
+        output = self.ingest()
+
+        self.assertEqual(Article.objects.count(), 3)
+        self.assertIn("Created 0, duplicates 3", output)
+
+    @patch("articles.management.commands.ingest_html.Article.objects.bulk_create")
+    def test_should_fall_back_to_row_inserts_on_conflict(self, mock_bulk_create):
+        mock_bulk_create.side_effect = IntegrityError("duplicate key")
+
+        output = self.ingest()
+
+        self.assertEqual(Article.objects.count(), 3)
+        self.assertIn("Created 2, duplicates 1", output)
+
+    def test_should_require_base_url_for_directories(self):
+        with self.assertRaises(CommandError):
+            call_command("ingest_html", self.tmp.name, stdout=StringIO())
+
+    def test_should_report_missing_archive(self):
+        with self.assertRaisesMessage(CommandError, "does not exist"):
+            call_command(
+                "ingest_html",
+                str(Path(self.tmp.name, "missing.warc")),
+                stdout=StringIO(),
+            )
+
+    def test_should_report_corrupt_archives(self):
+        warc = Path(self.tmp.name, "crawl.warc")
+        warc.write_bytes(b"not a WARC record\r\n")
+        tarball = Path(self.tmp.name, "pages.tar.gz")
+        tarball.write_bytes(b"not gzip data")
+
+        for path in [warc, tarball]:
+            with self.subTest(path=path.name):
+                with self.assertRaisesMessage(CommandError, f"Cannot read {path}"):
+                    call_command(
+                        "ingest_html",
+                        str(path),
+                        "--base-url",
+                        "https://example.com/",
+                        "--workers",
+                        "1",
+                        stdout=StringIO(),
+                    )
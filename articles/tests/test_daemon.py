@@ -0,0 +1,232 @@
+import json
+import os
+import tempfile
+from datetime import datetime
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase, TestCase, TransactionTestCase
+
+from articles.management.commands.scrape_daemon import Command
+from articles.models import Article
+from articles.schedule import load_schedules
+
+
+class ConfigFileMixin:
+    def write_config(self, data):
+        handle, path = tempfile.mkstemp(suffix=".json")
+        with os.fdopen(handle, "w") as f:
+            json.dump(data, f)
+        self.addCleanup(os.remove, path)
+        return path
+
+
+class LoadSchedulesTest(ConfigFileMixin, SimpleTestCase):
+    def test_should_fill_in_defaults(self):
+        path = self.write_config(
+            {
+                "schedules": [
+                    {"domain": "example.com", "every_minutes": 30, "urls": ["u"]}
+                ]
+            }
+        )
+
+        options, schedules = load_schedules(path)
+
+        self.assertEqual(options["workers"], 1)
+        self.assertEqual(schedules[0].name, "example.com")
+        self.assertEqual(schedules[0].interval, 1800)
+
+    def test_should_reject_invalid_configuration(self):
+        invalid = [
+            {"schedules": []},
+            {"schedules": [{"name": "a", "urls": ["u"]}]},
+            {"schedules": [{"name": "a", "every_minutes": 5}]},
+            {"workers": 2, "threads": 3, "schedules": []},
+            {
+                "schedules": [
+                    {"name": "a", "every_minutes": 5, "urls": ["u"]},
+                    {"name": "a", "every_minutes": 9, "urls": ["v"]},
+                ]
+            },
+        ]
+        for data in invalid:
+            with self.subTest(data=data), self.assertRaises(ValueError):
+                load_schedules(self.write_config(data))
+
+
+class ScheduleTest(ConfigFileMixin, TestCase):
+    def test_should_collect_listed_file_and_due_urls(self):
+        for domain in ["example.com", "other.com"]:
+            Article.objects.create(
+                title=domain,
+                html_content="<p>x</p>",
+                plain_text_content="x",
+                source_url=f"https://{domain}/old",
+                published_at=datetime(2025, 1, 1),
+                source_domain=domain,
+                last_scraped_at=datetime(2025, 1, 1),
+            )
+        with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
+            f.write("https://example.com/b\n# comment\n\n")
+        self.addCleanup(os.remove, f.name)
+        path = self.write_config(
+            {
+                "schedules": [
+                    {
+                        "domain": "example.com",
+                        "every_minutes": 10,
+                        "urls": ["https://example.com/a"],
+                        "url_file": f.name,
+                        "recrawl_due": 5,
+                    }
+                ]
+            }
+        )
+        _, (schedule,) = load_schedules(path)
+
+        self.assertEqual(
+            schedule.collect_urls(),
+            [
+                ("https://example.com/a", False),
+                ("https://example.com/b", False),
+                ("https://example.com/old", True),
+            ],
+        )
+
+
+@patch("articles.management.commands.scrape_daemon.BrowserSession")
+@patch("articles.management.commands.scrape_daemon.scrape_article_selenium")
+class ScrapeDaemonCommandTest(ConfigFileMixin, TransactionTestCase):
+    def test_should_run_schedules_once_and_write_heartbeat(
+        self, mock_scrape, mock_session
+    ):
+        mock_scrape.side_effect = lambda url, **kwargs: (
+            (None, "error_page") if url.endswith("b") else (object(), "saved")
+        )
+        path = self.write_config(
+            {
+                "workers": 2,
+                "ignore_robots": True,
+                "schedules": [
+                    {"name": "one", "every_minutes": 5, "urls": ["https://a.com/a"]},
+                    {
+                        "name": "two",
+                        "every_minutes": 5,
+                        "urls": ["https://a.com/a", "https://a.com/b"],
+                    },
+                ],
+            }
+        )
+        heartbeat_path = f"{path}.heartbeat"
+        self.addCleanup(
+            lambda: os.path.exists(heartbeat_path) and os.remove(heartbeat_path)
+        )
+        out = StringIO()
+
+        call_command(
+            "scrape_daemon",
+            "--config",
+            path,
+            "--once",
+            "--heartbeat-file",
+            heartbeat_path,
+            stdout=out,
+        )
+
+        self.assertCountEqual(
+            [c.args[0] for c in mock_scrape.call_args_list],
+            ["https://a.com/a", "https://a.com/b"],
+        )
+        sessions = {id(c.kwargs["session"]) for c in mock_scrape.call_args_list}
+        self.assertLessEqual(len(sessions), 2)
+        self.assertEqual(mock_session.return_value.get_driver.call_count, 2)
+        self.assertEqual(mock_session.return_value.quit.call_count, 2)
+        with open(heartbeat_path) as f:
+            heartbeat = json.load(f)
+        self.assertEqual(heartbeat["scraped"], 2)
+        self.assertEqual(heartbeat["saved"], 1)
+        self.assertEqual(heartbeat["failed"], 1)
+        self.assertEqual(heartbeat["queue_depth"], 0)
+        self.assertEqual(set(heartbeat["schedules"]), {"one", "two"})
+        self.assertIn("Scrape daemon stopped.", out.getvalue())
+
+    def test_should_keep_running_after_unexpected_errors(
+        self, mock_scrape, mock_session
+    ):
+        mock_scrape.side_effect = RuntimeError("boom")
+        path = self.write_config(
+            {
+                "schedules": [
+                    {"name": "a", "every_minutes": 5, "urls": ["https://a.com/"]}
+                ]
+            }
+        )
+        out = StringIO()
+
+        with self.assertLogs("articles.management.commands.scrape_daemon", "ERROR"):
+            call_command("scrape_daemon", "--config", path, "--once", stdout=out)
+
+        self.assertIn("1 failed", out.getvalue())
+
+    def test_should_reject_invalid_configuration(self, mock_scrape, mock_session):
+        path = self.write_config({"schedules": []})
+
+        with self.assertRaises(CommandError):
+            call_command("scrape_daemon", "--config", path, "--once")
+
+        mock_session.assert_not_called()
+
+
+class ScrapeDaemonReloadTest(ConfigFileMixin, TestCase):
+    def setUp(self):
+        self.path = self.write_config(
+            {
+                "workers": 2,
+                "schedules": [
+                    {"name": "kept", "every_minutes": 5, "urls": ["u"]},
+                    {"name": "removed", "every_minutes": 5, "urls": ["v"]},
+                ],
+            }
+        )
+        self.command = Command()
+        self.command.options = {"config": self.path}
+        self.command.config, self.command.schedules = load_schedules(self.path)
+        self.command.schedules[0].next_run = 123.0
+
+    def test_should_reload_schedules_keeping_next_runs(self):
+        with open(self.path, "w") as f:
+            json.dump(
+                {
+                    "workers": 4,
+                    "full_text": True,
+                    "schedules": [
+                        {"name": "kept", "every_minutes": 1, "urls": ["u"]},
+                        {"name": "new", "every_minutes": 5, "urls": ["w"]},
+                    ],
+                },
+                f,
+            )
+
+        with self.assertLogs("articles.management.commands.scrape_daemon") as logs:
+            self.command.reload()
+
+        schedules = {s.name: s for s in self.command.schedules}
+        self.assertEqual(set(schedules), {"kept", "new"})
+        self.assertEqual(schedules["kept"].next_run, 123.0)
+        self.assertEqual(schedules["kept"].interval, 60)
+        self.assertEqual(schedules["new"].next_run, 0.0)
+        self.assertTrue(self.command.config["full_text"])
+        self.assertEqual(self.command.config["workers"], 2)
+        self.assertIn("take effect after a restart", "\n".join(logs.output))
+
+    def test_should_keep_configuration_when_reload_fails(self):
+        schedules = self.command.schedules
+        with open(self.path, "w") as f:
+            f.write("{not json")
+
+        with self.assertLogs("articles.management.commands.scrape_daemon", "ERROR"):
+            self.command.reload()
+
+        self.assertIs(self.command.schedules, schedules)
@@ -0,0 +1,120 @@
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+from django.test import SimpleTestCase
+
+from articles.extraction import extract_main_text, find_main_content
+from articles.scraper import extract_article_fields
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+
+
+def load_fixture(name):
+    html = (FIXTURES_DIR / name).read_text(encoding="utf-8")
+    return BeautifulSoup(html, "html.parser")
+
+
+class ExtractMainTextTest(SimpleTestCase):
+    def test_should_keep_article_body(self):
+        text = extract_main_text(load_fixture("news_article.html"))
+
+        self.assertIn("Ford C-Max to kompaktowy minivan", text)
+        self.assertIn("Najbardziej ekonomicznym wyborem jest silnik 1.0 EcoBoost", text)
+        self.assertIn("Na co zwrócić uwagę przy zakupie?", text)
+        self.assertIn("pasek rozrządu zanurzony w oleju", text)
+
+    def test_should_drop_page_boilerplate(self):
+        text = extract_main_text(load_fixture("news_article.html"))
+
+        for boilerplate in [
+            "Ta strona używa plików cookie",
+            "Dom i ogród",
+            "Strona główna",
+            "Udostępnij na Facebooku",
+            "Najczęściej czytane",
+            "Zobacz także",
+            "Zapisz się do naszego newslettera",
+            "Wszelkie prawa zastrzeżone",
+            "window.dataLayer",
+        ]:
+            self.assertNotIn(boilerplate, text)
+
+    def test_should_be_shorter_than_full_page_text(self):
+        main_text = extract_main_text(load_fixture("news_article.html"))
+        full_text = extract_main_text(load_fixture("news_article.html"), full_text=True)
+
+        self.assertIn("Zobacz także", full_text)
+        self.assertLess(len(main_text), len(full_text) * 0.7)
+
+    def test_should_pick_densest_block_without_article_tag(self):
+        soup = BeautifulSoup(
+            """
+            <div class="menu"><a href="/1">Home</a> <a href="/2">News</a></div>
+            <div id="story">
+                <p>First paragraph of the story, long enough to count as content.</p>
+                <p>Second paragraph, with commas, details, and more words to score.</p>
+            </div>
+            <div><a href="/x">A related article with a long linked headline here</a></div>
+            """,
+            "html.parser",
+        )
+
+        main = find_main_content(soup)
+
+        self.assertEqual(main.get("id"), "story")
+
+    def test_should_fall_back_to_page_text_without_content_blocks(self):
+        soup = BeautifulSoup(
+            "<html><body><nav>Menu</nav>Loose body text {}</body></html>".format(
+                "H" * 200
+            ),
+            "html.parser",
+        )
+
+        text = extract_main_text(soup)
+
+        self.assertIn("Loose body text", text)
+        self.assertNotIn("Menu", text)
+
+    def test_should_keep_blocks_whose_names_only_contain_hint_words(self):
+        soup = BeautifulSoup(
+            """
+            <div class="site-header">Portal name</div>
+            <div class="subheader">Lead paragraph of the story, with a summary.</div>
+            <div class="canvas"><p>Body paragraph, with commas, and words.</p></div>
+            """,
+            "html.parser",
+        )
+
+        text = extract_main_text(soup)
+
+        self.assertNotIn("Portal name", text)
+        self.assertIn("Lead paragraph", text)
+        self.assertIn("Body paragraph", text)
+
+
+class ExtractArticleFieldsTest(SimpleTestCase):
+    def test_should_keep_short_article_on_full_page(self):
+        html = """
+            <html><head><title>Brief</title></head><body>
+            <nav>{}</nav>
+            <article><p>A short brief, two sentences long. It is news.</p></article>
+            </body></html>
+        """.format(
+            " ".join(f'<a href="/{i}">Section {i}</a>' for i in range(30))
+        )
+
+        fields = extract_article_fields(html, "https://example.com/brief")
+
+        self.assertEqual(
+            fields["plain_text_content"],
+            "A short brief, two sentences long. It is news.",
+        )
+
+    def test_should_reject_page_with_little_text(self):
+        html = "<html><body><article><p>Loading...</p></article></body></html>"
+
+        with self.assertLogs("articles.scraper", "WARNING"):
+            fields = extract_article_fields(html, "https://example.com/empty")
+
+        self.assertIsNone(fields)
@@ -0,0 +1,63 @@
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from articles.head import json_ld_date, parse_head
+from articles.scraper import extract_article_fields
+
+BODY = "<p>{}</p>".format("Treść artykułu. " * 30)
+
+
+class ParseHeadTest(SimpleTestCase):
+    def test_should_read_title_canonical_and_meta_date(self):
+        html = """<!DOCTYPE html><html><head>
+            <title>Breaking &amp; news</title>
+            <link rel="Canonical" href="https://example.com/a">
+            <meta name="pubdate" content="2025-02-03">
+            </head><body>{}</body></html>""".format(BODY)
+
+        head = parse_head(html)
+
+        self.assertEqual(head.title, "Breaking & news")
+        self.assertEqual(head.canonical_url, "https://example.com/a")
+        self.assertEqual(head.date_text, "2025-02-03")
+
+    def test_should_prefer_meta_date_over_json_ld(self):
+        html = """<head>
+            <script type="application/ld+json">{"datePublished": "2025-01-01"}</script>
+            <meta property="article:published_time" content="2025-01-02">
+            </head>"""
+
+        head = parse_head(html)
+
+        self.assertEqual(head.json_ld_date, "2025-01-01")
+        self.assertEqual(head.date_text, "2025-01-02")
+
+    def test_should_stop_at_first_body_element(self):
+        html = """<html><head><title>T</title></head>
+            <body><meta name="date" content="2025-05-05"></body>"""
+        implicit_body = '<title>T</title><div></div><meta name="date" content="x">'
+
+        self.assertIsNone(parse_head(html).date_text)
+        self.assertIsNone(parse_head(implicit_body).date_text)
+
+    def test_should_read_json_ld_lists_and_graphs(self):
+        self.assertEqual(
+            json_ld_date('[{"@type": "Person"}, {"datePublished": "2025-04-04"}]'),
+            "2025-04-04",
+        )
+        self.assertEqual(
+            json_ld_date('{"@graph": [{"datePublished": " 2025-04-05 "}]}'),
+            "2025-04-05",
+        )
+        self.assertIsNone(json_ld_date("{not json"))
+
+    def test_should_skip_body_date_scan_when_head_has_date(self):
+        html = """<html><head><meta property="og:published_time" content="2025-06-07">
+            </head><body>{}</body></html>""".format(BODY)
+
+        with patch("articles.scraper.extract_date_text") as mock_extract_date:
+            fields = extract_article_fields(html, "https://example.com/a")
+
+        mock_extract_date.assert_not_called()
+        self.assertEqual(fields["published_at"].date().isoformat(), "2025-06-07")
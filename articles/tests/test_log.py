@@ -0,0 +1,105 @@
+import json
+import logging
+import tempfile
+from pathlib import Path
+
+from django.test import SimpleTestCase
+
+from articles.log import JsonFormatter, QueueListenerHandler, WorkerLogQueue
+from articles.phases import PhaseTimer
+
+
+def make_record(msg="Scrape finished", **extra):
+    record = logging.LogRecord(
+        "articles.scraper", logging.INFO, __file__, 1, msg, None, None
+    )
+    record.__dict__.update(extra)
+    return record
+
+
+class JsonFormatterTest(SimpleTestCase):
+    def test_should_include_structured_fields(self):
+        record = make_record(
+            url="https://example.com/a",
+            domain="example.com",
+            phases={"fetch": 1.5},
+        )
+
+        data = json.loads(JsonFormatter().format(record))
+
+        self.assertEqual(data["message"], "Scrape finished")
+        self.assertEqual(data["url"], "https://example.com/a")
+        self.assertEqual(data["domain"], "example.com")
+        self.assertEqual(data["phases"], {"fetch": 1.5})
+        self.assertEqual(data["worker"], f"{record.process}:{record.threadName}")
+        self.assertNotIn("status", data)
+
+
+class QueueListenerHandlerTest(SimpleTestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = Path(self.tmp.name) / "scraper.log"
+
+    def test_should_write_records_from_listener_thread(self):
+        handler = QueueListenerHandler(str(self.path))
+        handler.setFormatter(JsonFormatter())
+
+        handler.handle(make_record("one"))
+        handler.handle(make_record("two", url="https://example.com/b"))
+        handler.close()
+
+        lines = [json.loads(line) for line in self.path.read_text().splitlines()]
+        self.assertEqual([line["message"] for line in lines], ["one", "two"])
+        self.assertEqual(lines[1]["url"], "https://example.com/b")
+
+    def test_should_not_open_file_before_first_record(self):
+        handler = QueueListenerHandler(str(self.path))
+        handler.close()
+
+        self.assertFalse(self.path.exists())
+
+    def test_should_rotate_by_size(self):
+        handler = QueueListenerHandler(str(self.path), max_bytes=200, backup_count=2)
+        handler.setFormatter(JsonFormatter())
+
+        for i in range(20):
+            handler.handle(make_record(f"record {i}"))
+        handler.close()
+
+        self.assertTrue(Path(f"{self.path}.1").exists())
+        self.assertLessEqual(self.path.stat().st_size, 200)
+
+    def test_should_stop_worker_queue_listener_on_close(self):
+        handler = QueueListenerHandler(str(self.path))
+        handler.setFormatter(JsonFormatter())
+        self.addCleanup(handler.close)
+
+        log_queue = WorkerLogQueue(handler)
+        log_queue.queue.put(make_record("from worker"))
+        listener = log_queue.listener
+        log_queue.close()
+
+        self.assertEqual(len(handler.listeners), 1)
+        self.assertIsNone(listener._thread)
+        lines = [json.loads(line) for line in self.path.read_text().splitlines()]
+        self.assertEqual([line["message"] for line in lines], ["from worker"])
+
+    def test_should_reject_unknown_rotation(self):
+        with self.assertRaises(ValueError):
+            QueueListenerHandler(str(self.path), rotation="weekly")
+
+
+class PhaseTimerTest(SimpleTestCase):
+    def test_should_accumulate_phase_durations(self):
+        timer = PhaseTimer()
+
+        with timer.phase("fetch"):
+            pass
+        with timer.phase("fetch"):
+            pass
+        with timer.phase("save"):
+            pass
+
+        self.assertEqual(set(timer.as_dict()), {"fetch", "save"})
+        self.assertGreaterEqual(timer.durations["fetch"], 0)
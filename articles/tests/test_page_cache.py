@@ -0,0 +1,118 @@
+import os
+import tempfile
+import time
+from unittest.mock import MagicMock, patch
+
+from django.test import SimpleTestCase, TestCase
+
+from articles.models import Article
+from articles.page_cache import PageCache
+from articles.scraper import scrape_article_selenium
+
+PAGE = "<html><head><title>Cached</title></head><body><p>{}</p></body></html>".format(
+    "Cached article text. " * 20
+)
+
+
+class PageCacheTest(SimpleTestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.directory = tmp.name
+
+    def test_should_return_stored_page(self):
+        cache = PageCache(self.directory)
+        response = {"status": 200, "headers": {"ETag": '"v1"'}}
+
+        cache.put("https://example.com/a", PAGE, len(PAGE), response)
+        entry = cache.get("https://example.com/a")
+
+        self.assertEqual(entry["html"], PAGE)
+        self.assertEqual(entry["size"], len(PAGE))
+        self.assertEqual(entry["response"], response)
+        self.assertIsNone(cache.get("https://example.com/b"))
+        self.assertEqual(cache.stats["hits"], 1)
+        self.assertEqual(cache.stats["misses"], 1)
+        self.assertEqual(cache.stats["bytes_saved"], len(PAGE.encode()))
+
+    def test_should_expire_entries_after_ttl(self):
+        cache = PageCache(self.directory, ttl=60)
+        cache.put("https://example.com/a", PAGE)
+
+        with patch("articles.page_cache.time.time", return_value=time.time() + 61):
+            self.assertIsNone(cache.get("https://example.com/a"))
+
+        self.assertEqual(cache.stats["expired"], 1)
+        self.assertFalse(cache.path("https://example.com/a").exists())
+
+    def test_should_evict_least_recently_used_entries(self):
+        cache = PageCache(self.directory)
+        for i, url in enumerate(["https://example.com/a", "https://example.com/b"]):
+            cache.put(url, PAGE + str(i))
+            os.utime(cache.path(url), (1000 + i, 1000 + i))
+        # Using "a" makes "b" the least recently used entry
+        cache.get("https://example.com/a")
+        cache.max_bytes = cache.path("https://example.com/a").stat().st_size * 2.5
+
+        cache.put("https://example.com/c", PAGE + "2")
+
+        self.assertIsNotNone(cache.get("https://example.com/a"))
+        self.assertFalse(cache.path("https://example.com/b").exists())
+        self.assertIsNotNone(cache.get("https://example.com/c"))
+        self.assertEqual(cache.stats["evictions"], 1)
+
+    def test_should_drop_corrupted_entry(self):
+        cache = PageCache(self.directory)
+        path = cache.path("https://example.com/a")
+        path.parent.mkdir(parents=True)
+        path.write_bytes(b"not gzip")
+
+        self.assertIsNone(cache.get("https://example.com/a"))
+        self.assertFalse(path.exists())
+
+
+@patch("articles.browser.time.sleep")
+@patch("articles.scraper.get_selenium_driver")
+class ScrapeWithPageCacheTest(TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache = PageCache(tmp.name)
+
+    def test_should_reuse_render_after_failed_save(self, mock_get_driver, mock_sleep):
+        mock_driver = MagicMock()
+        mock_driver.page_source = PAGE
+        mock_get_driver.return_value = mock_driver
+        url = "https://example.com/a"
+
+        with patch(
+            "articles.scraper.Article.objects.create", side_effect=Exception("DB down")
+        ):
+            self.assertIsNone(scrape_article_selenium(url, cache=self.cache))
+        article = scrape_article_selenium(url, cache=self.cache)
+
+        self.assertEqual(article.title, "Cached")
+        mock_driver.get.assert_called_once_with(url)
+        self.assertEqual(self.cache.stats["hits"], 1)
+
+    def test_should_reuse_render_of_rejected_page(self, mock_get_driver, mock_sleep):
+        mock_get_driver.return_value = MagicMock(page_source="<html></html>")
+
+        scrape_article_selenium("https://example.com/short", cache=self.cache)
+        scrape_article_selenium("https://example.com/short", cache=self.cache)
+
+        self.assertEqual(mock_get_driver.call_count, 1)
+        self.assertEqual(Article.objects.count(), 0)
+
+    @patch("articles.scraper.get_document_response")
+    def test_should_not_cache_error_pages(
+        self, mock_response, mock_get_driver, mock_sleep
+    ):
+        mock_response.return_value = {"status": 500, "headers": {}}
+        mock_get_driver.return_value = MagicMock(page_source=PAGE)
+
+        scrape_article_selenium("https://example.com/error", cache=self.cache)
+        scrape_article_selenium("https://example.com/error", cache=self.cache)
+
+        self.assertEqual(mock_get_driver.call_count, 2)
+        self.assertEqual(self.cache.stats["stores"], 0)
@@ -0,0 +1,151 @@
+from datetime import date, datetime
+from io import StringIO
+from unittest import skipUnless
+from unittest.mock import MagicMock, patch
+
+from django.core.management import CommandError, call_command
+from django.db import IntegrityError, connection, transaction
+from django.db.migrations.loader import MigrationLoader
+from django.db.migrations.operations import SeparateDatabaseAndState
+from django.test import SimpleTestCase, TestCase
+
+from articles.models import Article, ArticleUrl
+from articles.partitions import (
+    MOVING_ROWS_SETTING,
+    add_months,
+    create_partition,
+    ensure_partitions,
+    is_partitioned,
+    list_partitions,
+    partition_month,
+    partition_name,
+)
+
+
+def mock_connections():
+    connection = MagicMock(vendor="postgresql")
+    connection.ops.quote_name = lambda name: f'"{name}"'
+    cursor = connection.cursor.return_value.__enter__.return_value
+    cursor.rowcount = 2
+    return {"default": connection}, cursor
+
+
+class PartitionNameTest(SimpleTestCase):
+    def test_should_add_months_across_years(self):
+        self.assertEqual(add_months(date(2025, 11, 1), 3), date(2026, 2, 1))
+        self.assertEqual(add_months(date(2025, 1, 1), -1), date(2024, 12, 1))
+
+    def test_should_map_names_to_months(self):
+        self.assertEqual(partition_name(date(2025, 3, 1)), "articles_article_p202503")
+        self.assertEqual(partition_month("articles_article_p202503"), date(2025, 3, 1))
+        self.assertIsNone(partition_month("articles_article_default"))
+
+
+class CreatePartitionTest(TestCase):
+    def test_should_move_default_rows_and_attach(self):
+        connections, cursor = mock_connections()
+
+        with patch("articles.partitions.connections", connections):
+            moved = create_partition(date(2025, 12, 15))
+
+        self.assertEqual(moved, 2)
+        statements = [c.args[0] for c in cursor.execute.call_args_list]
+        self.assertIn("set_config", statements[0])
+        self.assertEqual(
+            cursor.execute.call_args_list[0].args[1], [MOVING_ROWS_SETTING]
+        )
+        self.assertIn('CREATE TABLE "articles_article_p202512"', statements[1])
+        self.assertIn('DELETE FROM "articles_article_default"', statements[2])
+        self.assertIn("ATTACH PARTITION", statements[3])
+        self.assertEqual(
+            cursor.execute.call_args_list[3].args[1], ["2025-12-01", "2026-01-01"]
+        )
+        self.assertIn("'off'", statements[4])
+
+    @patch("articles.partitions.create_partition")
+    @patch("articles.partitions.list_partitions")
+    def test_should_create_only_missing_months(self, mock_list, mock_create):
+        mock_list.return_value = [date(2025, 11, 1), date(2025, 12, 1)]
+
+        created = ensure_partitions(2, today=date(2025, 11, 20))
+
+        self.assertEqual(created, [date(2026, 1, 1)])
+        mock_create.assert_called_once_with(date(2026, 1, 1), "default")
+
+
+def create_article(url, published_at):
+    return Article.objects.create(
+        title="Article",
+        html_content="<p>HTML</p>",
+        plain_text_content="Text",
+        source_url=url,
+        published_at=published_at,
+        source_domain="site1.com",
+    )
+
+
+class PartitionArticlesCommandTest(TestCase):
+    @patch("articles.partitions.connections", {"default": MagicMock(vendor="sqlite")})
+    def test_should_not_be_partitioned_outside_postgresql(self):
+        self.assertFalse(is_partitioned())
+
+    @patch(
+        "articles.management.commands.partition_articles.is_partitioned",
+        return_value=False,
+    )
+    def test_should_require_partitioned_table(self, mock_partitioned):
+        with self.assertRaises(CommandError):
+            call_command("partition_articles")
+
+    @patch("articles.management.commands.partition_articles.drop_partition")
+    @patch("articles.management.commands.partition_articles.list_partitions")
+    @patch("articles.management.commands.partition_articles.ensure_partitions")
+    @patch("articles.management.commands.partition_articles.is_partitioned")
+    def test_should_drop_months_before_retention(
+        self, mock_partitioned, mock_ensure, mock_list, mock_drop
+    ):
+        mock_partitioned.return_value = True
+        mock_ensure.return_value = []
+        mock_list.return_value = [date(2024, 12, 1), date(2025, 1, 1)]
+        mock_drop.return_value = 5
+
+        call_command(
+            "partition_articles", "--drop-before", "2025-01", stdout=StringIO()
+        )
+
+        mock_drop.assert_called_once_with(date(2024, 12, 1), "default")
+
+
+@skipUnless(connection.vendor == "postgresql", "Articles are partitioned on PostgreSQL")
+class PartitionedTableTest(TestCase):
+    def test_should_be_partitioned(self):
+        self.assertTrue(is_partitioned())
+
+    def test_should_reject_duplicate_source_url_across_partitions(self):
+        create_article("https://site1.com/a", datetime(2025, 1, 15))
+
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            create_article("https://site1.com/a", datetime(2019, 6, 1))
+
+    def test_should_keep_url_lookup_when_moving_default_rows(self):
+        article = create_article("https://site1.com/a", datetime(2019, 3, 10))
+
+        moved = create_partition(date(2019, 3, 1))
+
+        self.assertEqual(moved, 1)
+        self.assertIn(date(2019, 3, 1), list_partitions())
+        self.assertEqual(Article.objects.get().pk, article.pk)
+        self.assertEqual(ArticleUrl.objects.get().article_id, article.pk)
+
+
+class ArticleMigrationsTest(SimpleTestCase):
+    def test_should_write_later_article_schema_changes_by_hand(self):
+        loader = MigrationLoader(None, ignore_no_migrations=True)
+
+        for (app_label, name), migration in loader.disk_migrations.items():
+            if app_label != "articles" or name <= "0004":
+                continue
+            for operation in migration.operations:
+                model = getattr(operation, "model_name", getattr(operation, "name", ""))
+                if str(model).lower() == "article":
+                    self.assertIsInstance(operation, SeparateDatabaseAndState, name)
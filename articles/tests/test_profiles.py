@@ -0,0 +1,135 @@
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from bs4 import BeautifulSoup
+from django.test import SimpleTestCase, TestCase
+
+from articles import profiles
+from articles.models import ExtractionProfile
+from articles.profiles import CompiledProfile, get_profile, load_profiles
+from articles.scraper import parse_published_date, scrape_article_selenium
+
+PROFILE_HTML = """
+    <html>
+        <head><title>Portal | Generic title</title></head>
+        <body>
+            <h1 class="headline">Profile headline</h1>
+            <span class="pub-date" data-ts="17/10/2025">yesterday</span>
+            <div class="article-body"><p>Body from profile. {}</p></div>
+            <div class="comments">Comment text that should not be stored.</div>
+        </body>
+    </html>
+""".format(
+    "P" * 250
+)
+
+
+class CompiledProfileTest(SimpleTestCase):
+    def test_should_extract_fields_with_selectors(self):
+        profile = CompiledProfile(
+            pk=1,
+            source_domain="example.com",
+            title_selector="h1.headline",
+            body_selector=".article-body",
+            date_selector=".pub-date",
+            date_attribute="data-ts",
+        )
+
+        result = profile.extract(BeautifulSoup(PROFILE_HTML, "html.parser"))
+
+        self.assertEqual(result["title"], "Profile headline")
+        self.assertIn("Body from profile.", result["body"])
+        self.assertNotIn("Comment text", result["body"])
+        self.assertEqual(result["date_text"], "17/10/2025")
+        self.assertTrue(profile.is_hit(result))
+
+    def test_should_report_miss_when_configured_selector_matches_nothing(self):
+        profile = CompiledProfile(
+            pk=1, source_domain="example.com", date_selector="time.missing"
+        )
+
+        result = profile.extract(BeautifulSoup(PROFILE_HTML, "html.parser"))
+
+        self.assertIsNone(result["date_text"])
+        self.assertIsNone(result["title"])
+        self.assertFalse(profile.is_hit(result))
+
+    def test_should_parse_date_with_profile_format(self):
+        parsed = parse_published_date("17/10/2025", "%d/%m/%Y")
+
+        self.assertEqual(parsed, datetime(2025, 10, 17))
+
+
+class ProfileCacheTest(TestCase):
+    def setUp(self):
+        profiles._profiles = None
+
+    def test_should_load_profiles_once(self):
+        ExtractionProfile.objects.create(
+            source_domain="example.com", title_selector="h1"
+        )
+
+        with self.assertNumQueries(1):
+            load_profiles()
+            self.assertEqual(get_profile("example.com").title_selector, "h1")
+            self.assertIsNone(get_profile("other.com"))
+
+    def test_should_invalidate_cache_on_profile_change(self):
+        profile = ExtractionProfile.objects.create(source_domain="example.com")
+        load_profiles()
+
+        profile.title_selector = "h1.headline"
+        profile.save()
+
+        self.assertEqual(get_profile("example.com").title_selector, "h1.headline")
+
+
+class ScrapeWithProfileTest(TestCase):
+    def setUp(self):
+        profiles._profiles = None
+
+    def tearDown(self):
+        profiles._profiles = None
+
+    @patch("articles.browser.time.sleep")
+    @patch("selenium.webdriver.support.ui.WebDriverWait")
+    @patch("articles.scraper.get_selenium_driver")
+    def test_should_use_profile_fast_path(self, mock_get_driver, mock_wait, mock_sleep):
+        profile = ExtractionProfile.objects.create(
+            source_domain="example.com",
+            title_selector="h1.headline",
+            body_selector=".article-body",
+            date_selector=".pub-date",
+            date_attribute="data-ts",
+            date_format="%d/%m/%Y",
+            wait_selector=".article-body",
+        )
+        mock_driver = MagicMock()
+        mock_get_driver.return_value = mock_driver
+        mock_driver.page_source = PROFILE_HTML
+
+        article = scrape_article_selenium("https://example.com/article")
+
+        self.assertEqual(article.title, "Profile headline")
+        self.assertEqual(article.published_at, datetime(2025, 10, 17))
+        self.assertNotIn("Comment text", article.plain_text_content)
+        mock_wait.assert_called_once_with(mock_driver, 10)
+        mock_sleep.assert_not_called()
+        profile.refresh_from_db()
+        self.assertEqual((profile.hits, profile.misses), (1, 0))
+
+    @patch("articles.browser.time.sleep")
+    @patch("articles.scraper.get_selenium_driver")
+    def test_should_fall_back_to_heuristics_on_miss(self, mock_get_driver, mock_sleep):
+        profile = ExtractionProfile.objects.create(
+            source_domain="example.com", title_selector="h1.missing"
+        )
+        mock_driver = MagicMock()
+        mock_get_driver.return_value = mock_driver
+        mock_driver.page_source = PROFILE_HTML
+
+        article = scrape_article_selenium("https://example.com/article")
+
+        self.assertEqual(article.title, "Portal | Generic title")
+        profile.refresh_from_db()
+        self.assertEqual((profile.hits, profile.misses), (0, 1))
@@ -0,0 +1,113 @@
+import pstats
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from django.test import SimpleTestCase
+
+from articles.phases import (
+    PhaseTimer,
+    active_phases,
+    start_phase_tracking,
+    stop_phase_tracking,
+)
+from articles.profiling import SamplingProfiler
+
+
+def take_sample(profiler):
+    profiler.record(sys._getframe(), active_phases.get(threading.get_ident()))
+
+
+def parse_page(profiler):
+    take_sample(profiler)
+
+
+class PhaseTrackingTest(SimpleTestCase):
+    def test_should_not_track_phases_without_profiler(self):
+        timer = PhaseTimer()
+
+        with timer.phase("fetch"):
+            self.assertNotIn(threading.get_ident(), active_phases)
+
+        self.assertIn("fetch", timer.durations)
+
+    def test_should_track_current_phase_of_thread(self):
+        start_phase_tracking()
+        self.addCleanup(stop_phase_tracking)
+        timer = PhaseTimer()
+
+        with timer.phase("fetch"):
+            with timer.phase("extract"):
+                inner = active_phases[threading.get_ident()][0]
+            outer = active_phases[threading.get_ident()][0]
+
+        self.assertEqual((inner, outer), ("extract", "fetch"))
+        self.assertNotIn(threading.get_ident(), active_phases)
+
+
+class SamplingProfilerTest(SimpleTestCase):
+    def test_should_attribute_samples_to_phase(self):
+        start_phase_tracking()
+        self.addCleanup(stop_phase_tracking)
+        profiler = SamplingProfiler(interval=0.01)
+        timer = PhaseTimer()
+
+        with timer.phase("extract"):
+            parse_page(profiler)
+        take_sample(profiler)
+
+        top = profiler.top_functions()
+        self.assertEqual(set(top), {"extract", "other"})
+        seconds, functions = top["extract"]
+        self.assertEqual(seconds, 0.01)
+        self.assertEqual(
+            {name for name, _, _ in functions},
+            {"test_profiling:parse_page", "test_profiling:take_sample"},
+        )
+        # Stacks start at the code that opened the phase
+        self.assertIn(
+            "extract;test_profiling:SamplingProfilerTest."
+            "test_should_attribute_samples_to_phase;test_profiling:parse_page",
+            "\n".join(profiler.collapsed),
+        )
+
+    def test_should_write_pstats_and_collapsed_files(self):
+        profiler = SamplingProfiler(interval=0.01)
+        parse_page(profiler)
+        parse_page(profiler)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            profiler.write_pstats(Path(tmp) / "run.pstats")
+            profiler.write_collapsed(Path(tmp) / "run.collapsed")
+            stats = pstats.Stats(str(Path(tmp) / "run.pstats"))
+            lines = (Path(tmp) / "run.collapsed").read_text().splitlines()
+
+        entries = {key[2]: value for key, value in stats.stats.items()}
+        self.assertEqual(entries["parse_page"][:2], (2, 2))
+        self.assertAlmostEqual(entries["parse_page"][3], 0.02)
+        self.assertEqual(len(lines), 1)
+        self.assertTrue(lines[0].startswith("other;"))
+        self.assertTrue(lines[0].endswith("test_profiling:take_sample 2"))
+
+    def test_should_sample_registered_threads_only(self):
+        profiler = SamplingProfiler(interval=0.001)
+        stop = threading.Event()
+
+        def worker():
+            profiler.add_thread()
+            timer = PhaseTimer()
+            with timer.phase("fetch"):
+                stop.wait(1)
+
+        thread = threading.Thread(target=worker)
+        profiler.start()
+        thread.start()
+        time.sleep(0.1)
+        stop.set()
+        thread.join()
+        profiler.stop()
+
+        self.assertGreater(profiler.phase_samples["fetch"], 0)
+        self.assertTrue(all("<locals>.worker" in s for s in profiler.collapsed))
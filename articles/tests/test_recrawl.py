@@ -0,0 +1,187 @@
+import urllib.error
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+from django.test import TestCase, override_settings
+
+from articles.models import Article, ExtractionProfile
+from articles.profiles import CompiledProfile
+from articles.recrawl import content_hash, due_articles, is_due, revalidate
+from articles.scraper import scrape_article_selenium
+
+PAGE = """
+    <html>
+        <head>
+            <title>Recrawled article</title>
+            <meta property="article:published_time" content="2025-10-15T10:00:00Z">
+        </head>
+        <body><article><p>{}</p></article></body>
+    </html>
+"""
+TEXT = "Article text, long enough to be stored as content. " * 6
+
+
+def make_article(url="https://example.com/a", **fields):
+    defaults = {
+        "title": "Recrawled article",
+        "html_content": PAGE.format(TEXT),
+        "plain_text_content": TEXT.strip(),
+        "source_url": url,
+        "source_domain": "example.com",
+        "published_at": datetime(2025, 10, 15),
+    }
+    defaults.update(fields)
+    return Article.objects.create(**defaults)
+
+
+@override_settings(SCRAPER_RECRAWL_AFTER_HOURS=24)
+class RecrawlPolicyTest(TestCase):
+    def test_should_hash_extracted_content(self):
+        self.assertEqual(content_hash("Title", "Text"), content_hash("Title", "Text"))
+        self.assertNotEqual(
+            content_hash("Title", "Text"), content_hash("Title", "Text!")
+        )
+
+    def test_should_be_due_after_default_interval(self):
+        now = datetime(2025, 1, 2, 12)
+        article = Article(last_scraped_at=now - timedelta(hours=25))
+
+        recent = Article(last_scraped_at=now - timedelta(hours=1))
+
+        self.assertTrue(is_due(article, now=now))
+        self.assertFalse(is_due(recent, now=now))
+        self.assertTrue(is_due(Article(last_scraped_at=None), now=now))
+
+    def test_should_use_profile_interval(self):
+        now = datetime(2025, 1, 2, 12)
+        article = Article(last_scraped_at=now - timedelta(hours=2))
+        hourly = CompiledProfile(pk=1, source_domain="example.com", recrawl_hours=1)
+        never = CompiledProfile(pk=2, source_domain="example.com", recrawl_hours=0)
+
+        self.assertTrue(is_due(article, hourly, now=now))
+        self.assertFalse(is_due(Article(last_scraped_at=None), never, now=now))
+
+    def test_should_select_due_articles_oldest_first(self):
+        now = datetime.now()
+        ExtractionProfile.objects.create(source_domain="hourly.com", recrawl_hours=1)
+        stale = make_article(
+            "https://example.com/stale", last_scraped_at=now - timedelta(days=2)
+        )
+        make_article(
+            "https://example.com/fresh", last_scraped_at=now - timedelta(hours=2)
+        )
+        never = make_article("https://example.com/never")
+        hourly = make_article(
+            "https://hourly.com/a",
+            source_domain="hourly.com",
+            last_scraped_at=now - timedelta(hours=2),
+        )
+
+        self.assertEqual(list(due_articles(now)), [never, stale, hourly])
+
+
+class RevalidateTest(TestCase):
+    @patch("articles.recrawl.urllib.request.urlopen")
+    def test_should_send_validators_and_report_not_modified(self, mock_urlopen):
+        mock_urlopen.side_effect = urllib.error.HTTPError(
+            "https://example.com/a", 304, "Not Modified", {}, None
+        )
+        article = Article(
+            source_url="https://example.com/a",
+            etag='"v1"',
+            last_modified="Wed, 01 Oct 2025 10:00:00 GMT",
+        )
+        throttle = MagicMock()
+
+        status = revalidate(article, throttle)
+
+        self.assertEqual(status, 304)
+        request = mock_urlopen.call_args.args[0]
+        self.assertEqual(request.get_header("If-none-match"), '"v1"')
+        self.assertEqual(
+            request.get_header("If-modified-since"), "Wed, 01 Oct 2025 10:00:00 GMT"
+        )
+        throttle.acquire.assert_called_once_with("example.com")
+        self.assertEqual(throttle.release.call_args.kwargs["status"], 304)
+
+    @patch("articles.recrawl.urllib.request.urlopen")
+    def test_should_return_none_on_network_error(self, mock_urlopen):
+        mock_urlopen.side_effect = urllib.error.URLError("unreachable")
+
+        article = Article(source_url="https://example.com/a", etag='"v1"')
+
+        self.assertIsNone(revalidate(article))
+
+
+@override_settings(SCRAPER_RECRAWL_AFTER_HOURS=24)
+@patch("articles.browser.time.sleep")
+@patch("articles.scraper.get_selenium_driver")
+class RecrawlScrapeTest(TestCase):
+    def make_driver(self, mock_get_driver, text=TEXT):
+        driver = MagicMock()
+        driver.page_source = PAGE.format(text)
+        mock_get_driver.return_value = driver
+        return driver
+
+    def test_should_skip_fresh_article(self, mock_get_driver, mock_sleep):
+        make_article(last_scraped_at=datetime.now())
+
+        result = scrape_article_selenium("https://example.com/a", recrawl=True)
+
+        self.assertIsNone(result)
+        mock_get_driver.assert_not_called()
+
+    def test_should_skip_browser_when_not_modified(self, mock_get_driver, mock_sleep):
+        scraped_at = datetime.now() - timedelta(days=2)
+        article = make_article(last_scraped_at=scraped_at, etag='"v1"')
+
+        with patch("articles.scraper.revalidate", return_value=304) as mock_revalidate:
+            result = scrape_article_selenium("https://example.com/a", recrawl=True)
+
+        self.assertIsNone(result)
+        mock_revalidate.assert_called_once()
+        mock_get_driver.assert_not_called()
+        article.refresh_from_db()
+        self.assertGreater(article.last_scraped_at, scraped_at)
+
+    def test_should_not_rewrite_unchanged_article(self, mock_get_driver, mock_sleep):
+        article = make_article(
+            html_content="<html>old render</html>",
+            content_hash=content_hash("Recrawled article", TEXT.strip()),
+        )
+        self.make_driver(mock_get_driver)
+
+        result = scrape_article_selenium("https://example.com/a", recrawl=True)
+
+        self.assertIsNone(result)
+        article.refresh_from_db()
+        self.assertEqual(article.html_content, "<html>old render</html>")
+        self.assertIsNotNone(article.last_scraped_at)
+
+    def test_should_update_changed_article(self, mock_get_driver, mock_sleep):
+        article = make_article(content_hash=content_hash("Recrawled article", "old"))
+        self.make_driver(mock_get_driver, text="Corrected text, " + TEXT)
+
+        result = scrape_article_selenium("https://example.com/a", recrawl=True)
+
+        self.assertEqual(result.pk, article.pk)
+        article.refresh_from_db()
+        self.assertTrue(article.plain_text_content.startswith("Corrected text"))
+        self.assertEqual(
+            article.content_hash,
+            content_hash(article.title, article.plain_text_content),
+        )
+        self.assertEqual(Article.objects.count(), 1)
+
+    def test_should_store_hash_and_scrape_time_of_new_article(
+        self, mock_get_driver, mock_sleep
+    ):
+        self.make_driver(mock_get_driver)
+
+        article = scrape_article_selenium("https://example.com/new")
+
+        self.assertEqual(
+            article.content_hash,
+            content_hash(article.title, article.plain_text_content),
+        )
+        self.assertIsNotNone(article.last_scraped_at)
@@ -1,12 +1,24 @@
+import json
+import subprocess
+import sys
 from datetime import datetime, timedelta
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, PropertyMock, patch
 
 import dateparser
 from bs4 import BeautifulSoup
 from django.test import SimpleTestCase, TestCase
 
 from articles.models import Article
-from articles.scraper import extract_date_text, scrape_article_selenium
+from articles.browser import get_document_status
+from articles.scraper import (
+    extract_date_text,
+    looks_like_error_page,
+    scrape_article_selenium,
+)
+
+
+def performance_entry(method, **params):
+    return {"message": json.dumps({"message": {"method": method, "params": params}})}
 
 
 class ExtractDateTextTest(SimpleTestCase):
@@ -149,6 +161,19 @@ class ExtractDateTextTest(SimpleTestCase):
 
         self.assertEqual(result, "2024-12-12T10:00:00+01:00")
 
+    def test_should_extract_json_ld_date_published(self):
+        html = """
+            <script type="application/ld+json">
+                {"@graph": [{"@type": "NewsArticle", "datePublished": "2025-03-01"}]}
+            </script>
+            <time>04.04.2020</time>
+        """
+        soup = BeautifulSoup(html, "html.parser")
+
+        result = extract_date_text(soup)
+
+        self.assertEqual(result, "2025-03-01")
+
     def test_should_return_none_when_no_date_found(self):
         html = "<div>brak daty</div><p>just regular text</p>"
         soup = BeautifulSoup(html, "html.parser")
@@ -174,6 +199,73 @@ class ExtractDateTextTest(SimpleTestCase):
         self.assertEqual(result, "5 HOURS AGO")
 
 
+class ErrorPageDetectionTest(SimpleTestCase):
+    def test_should_read_main_document_status_from_performance_log(self):
+        driver = MagicMock()
+        driver.current_url = "https://example.com/missing"
+        driver.get_log.return_value = [
+            performance_entry("Network.requestWillBeSent", type="Document"),
+            performance_entry(
+                "Network.responseReceived",
+                type="Stylesheet",
+                response={"url": "https://example.com/a.css", "status": 200},
+            ),
+            performance_entry(
+                "Network.responseReceived",
+                type="Document",
+                response={"url": "https://example.com/missing", "status": 404},
+            ),
+        ]
+
+        self.assertEqual(get_document_status(driver), 404)
+        driver.get_log.assert_called_once_with("performance")
+
+    def test_should_return_none_when_performance_log_unavailable(self):
+        driver = MagicMock()
+        driver.get_log.side_effect = Exception("log type 'performance' not found")
+
+        self.assertIsNone(get_document_status(driver))
+
+    def test_should_detect_error_signature_in_title(self):
+        soup = BeautifulSoup("<title>404 - Not Found</title>", "html.parser")
+
+        self.assertTrue(looks_like_error_page(soup))
+
+    def test_should_detect_error_signature_in_heading(self):
+        soup = BeautifulSoup(
+            "<title>Portal</title><h1>Strona nie została znaleziona</h1>",
+            "html.parser",
+        )
+
+        self.assertTrue(looks_like_error_page(soup))
+
+    def test_should_ignore_error_signatures_in_body_text(self):
+        soup = BeautifulSoup(
+            "<title>Nowy silnik</title><h1>Test auta</h1>"
+            "<p>Silnik ma 500 Nm momentu, a błąd 404 to tylko żart.</p>",
+            "html.parser",
+        )
+
+        self.assertFalse(looks_like_error_page(soup))
+
+
+class LazyImportTest(SimpleTestCase):
+    def test_should_not_import_scraping_dependencies_at_module_load(self):
+        code = (
+            "import sys, django; django.setup(); "
+            "import ArticleScraper.urls, articles.scraper; "
+            "import articles.management.commands.scrape_articles; "
+            "print(sorted(m for m in ('selenium', 'dateparser', 'bs4') "
+            "if m in sys.modules))"
+        )
+
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        self.assertEqual(result.stdout.strip(), "[]")
+
+
 class DateParsingIntegrationTest(SimpleTestCase):
     def parse(self, raw, base=None, lang=["pl", "en"]):
         if raw is None:
@@ -378,7 +470,7 @@ class ScrapeArticleSeleniumTest(TestCase):
         scrape_article_selenium("https://example.com/error")
         mock_driver.quit.assert_called_once()
 
-    @patch("articles.scraper.time.sleep")
+    @patch("articles.browser.time.sleep")
     @patch("articles.scraper.get_selenium_driver")
     def test_should_wait_for_page_load(self, mock_get_driver, mock_sleep):
         mock_driver = MagicMock()
@@ -412,3 +504,69 @@ class ScrapeArticleSeleniumTest(TestCase):
         self.assertIn("<p>Paragraph 1</p>", article.html_content)
         self.assertIn("Paragraph 1", article.plain_text_content)
         self.assertIn("Paragraph 2", article.plain_text_content)
+
+    @patch("articles.scraper.get_selenium_driver")
+    def test_should_reject_error_status_before_parsing(self, mock_get_driver):
+        mock_driver = MagicMock()
+        mock_get_driver.return_value = mock_driver
+        mock_driver.current_url = "https://example.com/gone"
+        mock_driver.get_log.return_value = [
+            performance_entry(
+                "Network.responseReceived",
+                type="Document",
+                response={"url": "https://example.com/gone", "status": 500},
+            )
+        ]
+        page_source = PropertyMock(return_value="<html></html>")
+        type(mock_driver).page_source = page_source
+
+        article = scrape_article_selenium("https://example.com/gone")
+
+        self.assertIsNone(article)
+        page_source.assert_not_called()
+        mock_driver.quit.assert_called_once()
+
+    @patch("articles.scraper.get_selenium_driver")
+    def test_should_keep_article_mentioning_error_codes(self, mock_get_driver):
+        mock_driver = MagicMock()
+        mock_get_driver.return_value = mock_driver
+        mock_driver.current_url = "https://example.com/engine"
+        mock_driver.get_log.return_value = [
+            performance_entry(
+                "Network.responseReceived",
+                type="Document",
+                response={"url": "https://example.com/engine", "status": 200},
+            )
+        ]
+        mock_driver.page_source = """
+            <html>
+                <head><title>Engine review</title></head>
+                <body><p>The engine makes 500 Nm of torque. {}</p></body>
+            </html>
+        """.format(
+            "F" * 250
+        )
+
+        article = scrape_article_selenium("https://example.com/engine")
+
+        self.assertIsNotNone(article)
+        self.assertEqual(article.title, "Engine review")
+
+    @patch("articles.scraper.get_selenium_driver")
+    def test_should_fall_back_to_title_signatures_without_status(
+        self, mock_get_driver
+    ):
+        mock_driver = MagicMock()
+        mock_get_driver.return_value = mock_driver
+        mock_driver.page_source = """
+            <html>
+                <head><title>404 Not Found</title></head>
+                <body>{}</body>
+            </html>
+        """.format(
+            "G" * 250
+        )
+
+        article = scrape_article_selenium("https://example.com/soft404")
+
+        self.assertIsNone(article)
@@ -0,0 +1,198 @@
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from django.test import SimpleTestCase
+
+from articles.tabs import TabRenderer
+
+
+class FakeDriver:
+    """
+    Minimal multi-window driver: each tab "loads" its URL after a few polls.
+    """
+
+    def __init__(self, statuses=None, load_polls=2, never_load=()):
+        self.statuses = statuses or {}
+        self.load_polls = load_polls
+        self.never_load = never_load
+        self.handles = ["base"]
+        self.current_window_handle = "base"
+        self.urls = {}
+        self.polls = {}
+        self.closed = []
+        self.sources_read = []
+        self.max_open = 1
+        self.log = []
+        self.switch_to = SimpleNamespace(
+            new_window=self.new_window, window=self.switch_window
+        )
+        self.service = MagicMock(spec=[])
+        self.quit = MagicMock()
+
+    def new_window(self, kind):
+        handle = f"tab{len(self.urls) + len(self.closed) + 1}"
+        self.handles.append(handle)
+        self.max_open = max(self.max_open, len(self.handles))
+        self.current_window_handle = handle
+
+    def switch_window(self, handle):
+        self.current_window_handle = handle
+
+    def get(self, url):
+        self.urls[self.current_window_handle] = url
+        status = self.statuses.get(url, 200)
+        self.log.append({"url": url, "status": status})
+
+    def close(self):
+        self.handles.remove(self.current_window_handle)
+        self.closed.append(self.urls.pop(self.current_window_handle))
+
+    @property
+    def current_url(self):
+        return self.urls[self.current_window_handle]
+
+    @property
+    def page_source(self):
+        self.sources_read.append(self.current_url)
+        return f"<html><body>{self.current_url}</body></html>"
+
+    def execute_script(self, script, *args):
+        if "readyState" in script:
+            handle = self.current_window_handle
+            self.polls[handle] = self.polls.get(handle, 0) + 1
+            if self.current_url in self.never_load:
+                return "loading"
+            return "complete" if self.polls[handle] >= self.load_polls else "loading"
+        return True
+
+    def get_log(self, kind):
+        entries, self.log = self.log, []
+        return [
+            {
+                "message": (
+                    '{"message": {"method": "Network.responseReceived", '
+                    f'"params": {{"type": "Document", "response": '
+                    f'{{"url": "{entry["url"]}", "status": {entry["status"]}}}}}}}}}'
+                )
+            }
+            for entry in entries
+        ]
+
+
+def make_renderer(drivers, **kwargs):
+    kwargs.setdefault("render_delay", 0)
+    kwargs.setdefault("poll_interval", 0.001)
+    return TabRenderer(driver_factory=MagicMock(side_effect=drivers), **kwargs)
+
+
+class TabRendererTest(SimpleTestCase):
+    def render_all(self, renderer, urls):
+        results = {}
+
+        def render(url):
+            results[url] = renderer.render(url)
+
+        threads = [threading.Thread(target=render, args=(url,)) for url in urls]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+        return results
+
+    def test_should_render_concurrent_pages_in_tabs_of_one_browser(self):
+        driver = FakeDriver()
+        renderer = make_renderer([driver], max_tabs=3)
+        urls = [f"https://example.com/{i}" for i in range(6)]
+
+        try:
+            results = self.render_all(renderer, urls)
+        finally:
+            renderer.close()
+
+        self.assertEqual(set(results), set(urls))
+        for url, result in results.items():
+            self.assertIsNone(result.error)
+            self.assertIn(url, result.html)
+            self.assertEqual(result.response["status"], 200)
+        self.assertEqual(renderer.session.driver_factory.call_count, 1)
+        self.assertLessEqual(driver.max_open, 4)
+        self.assertEqual(sorted(driver.closed), sorted(urls))
+        driver.quit.assert_called_once()
+
+    def test_should_not_read_source_of_error_pages(self):
+        url = "https://example.com/missing"
+        driver = FakeDriver(statuses={url: 404})
+        renderer = make_renderer([driver])
+
+        try:
+            result = renderer.render(url)
+        finally:
+            renderer.close()
+
+        self.assertEqual(result.response["status"], 404)
+        self.assertIsNone(result.html)
+        self.assertEqual(driver.sources_read, [])
+
+    def test_should_time_out_pages_that_never_load(self):
+        url = "https://example.com/slow"
+        driver = FakeDriver(never_load=(url,))
+        renderer = make_renderer([driver], timeout=0.05)
+
+        try:
+            result = renderer.render(url)
+        finally:
+            renderer.close()
+
+        self.assertTrue(result.timed_out)
+        self.assertIsNone(result.html)
+        self.assertEqual(driver.closed, [url])
+
+    def test_should_recycle_browser_after_page_limit(self):
+        drivers = [FakeDriver(), FakeDriver()]
+        renderer = make_renderer(drivers, max_tabs=2, max_pages=2)
+        urls = [f"https://example.com/{i}" for i in range(4)]
+
+        try:
+            results = [renderer.render(url) for url in urls]
+        finally:
+            renderer.close()
+
+        self.assertTrue(all(result.html for result in results))
+        self.assertEqual(renderer.session.recycles, 2)
+        self.assertEqual(len(drivers[0].closed), 2)
+        self.assertEqual(len(drivers[1].closed), 2)
+        drivers[0].quit.assert_called_once()
+
+    def test_should_fail_tabs_when_browser_does_not_start(self):
+        driver = FakeDriver()
+        renderer = make_renderer(
+            [RuntimeError("chrome not found"), RuntimeError("chrome not found"), driver]
+        )
+        urls = [f"https://example.com/{i}" for i in range(3)]
+
+        try:
+            results = [renderer.render(url) for url in urls]
+        finally:
+            renderer.close()
+
+        self.assertEqual(
+            [result.error for result in results[:2]], ["chrome not found"] * 2
+        )
+        self.assertIn(urls[2], results[2].html)
+
+    def test_should_restart_renderer_thread_after_crash(self):
+        driver = FakeDriver()
+        renderer = make_renderer([driver, FakeDriver()])
+        url = "https://example.com/1"
+
+        try:
+            with patch.object(renderer, "_poll", side_effect=RuntimeError("boom")):
+                with self.assertLogs("articles.tabs", "ERROR"):
+                    crashed = renderer.render(url)
+            result = renderer.render(url)
+        finally:
+            renderer.close()
+
+        self.assertEqual(crashed.error, "boom")
+        self.assertIn(url, result.html)
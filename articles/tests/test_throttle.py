@@ -0,0 +1,113 @@
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+from django.test import SimpleTestCase
+
+from articles.throttle import AutoThrottle, parse_retry_after
+
+
+def make_throttle(**kwargs):
+    kwargs.setdefault("start_delay", 0.0)
+    kwargs.setdefault("crawl_delay_fetcher", lambda domain: None)
+    return AutoThrottle(**kwargs)
+
+
+class ParseRetryAfterTest(SimpleTestCase):
+    def test_should_parse_seconds(self):
+        self.assertEqual(parse_retry_after("120"), 120.0)
+
+    def test_should_parse_http_date(self):
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=60)
+
+        seconds = parse_retry_after(format_datetime(retry_at, usegmt=True))
+
+        self.assertAlmostEqual(seconds, 60, delta=2)
+
+    def test_should_ignore_invalid_value(self):
+        self.assertIsNone(parse_retry_after("soon"))
+        self.assertIsNone(parse_retry_after(None))
+
+
+class AutoThrottleTest(SimpleTestCase):
+    def test_should_increase_concurrency_on_fast_responses(self):
+        throttle = make_throttle(max_concurrency=3, target_latency=2.0)
+
+        for _ in range(5):
+            throttle.acquire("fast.com")
+            throttle.release("fast.com", latency=0.5, status=200)
+
+        state = throttle.snapshot()["fast.com"]
+        self.assertEqual(state["concurrency"], 3)
+        self.assertEqual(state["requests"], 5)
+
+    def test_should_decrease_concurrency_on_slow_responses(self):
+        throttle = make_throttle(target_latency=2.0)
+        for _ in range(2):
+            throttle.acquire("slow.com")
+            throttle.release("slow.com", latency=0.1)
+
+        throttle.acquire("slow.com")
+        throttle.release("slow.com", latency=5.0)
+
+        self.assertEqual(throttle.snapshot()["slow.com"]["concurrency"], 2)
+
+    def test_should_halve_concurrency_and_double_delay_on_errors(self):
+        throttle = make_throttle(max_concurrency=8)
+        for _ in range(7):
+            throttle.acquire("busy.com")
+            throttle.release("busy.com", latency=0.1)
+
+        throttle.acquire("busy.com")
+        throttle.release("busy.com", error=True, timeout=True)
+
+        state = throttle.snapshot()["busy.com"]
+        self.assertEqual(state["concurrency"], 4)
+        self.assertEqual(state["delay"], 1.0)
+        self.assertEqual((state["errors"], state["timeouts"]), (1, 1))
+
+    def test_should_back_off_on_429(self):
+        throttle = make_throttle(start_delay=1.0)
+
+        throttle.acquire("limited.com")
+        throttle.release("limited.com", latency=0.2, status=429)
+
+        self.assertEqual(throttle.snapshot()["limited.com"]["delay"], 2.0)
+
+    def test_should_honour_retry_after(self):
+        throttle = make_throttle()
+
+        throttle.acquire("limited.com")
+        throttle.release("limited.com", status=503, retry_after="30")
+
+        state = throttle.domains["limited.com"]
+        self.assertGreater(state.next_allowed - time.monotonic(), 25)
+
+    def test_should_not_go_below_robots_crawl_delay(self):
+        throttle = make_throttle(crawl_delay_fetcher=lambda domain: 5.0)
+
+        throttle.acquire("polite.com")
+        throttle.release("polite.com", latency=0.1, status=200)
+
+        state = throttle.snapshot()["polite.com"]
+        self.assertEqual(state["crawl_delay"], 5.0)
+        self.assertEqual(state["delay"], 5.0)
+
+    def test_should_block_when_domain_concurrency_is_used_up(self):
+        throttle = make_throttle(max_concurrency=1)
+        throttle.acquire("one.com")
+        acquired = threading.Event()
+
+        def second():
+            throttle.acquire("one.com")
+            acquired.set()
+
+        thread = threading.Thread(target=second)
+        thread.start()
+        self.assertFalse(acquired.wait(0.2))
+
+        throttle.release("one.com", latency=0.1)
+
+        self.assertTrue(acquired.wait(2))
+        thread.join()
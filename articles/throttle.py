@@ -0,0 +1,199 @@
+import logging
+import threading
+import time
+import urllib.request
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.robotparser import RobotFileParser
+
+logger = logging.getLogger(__name__)
+
+# Statuses that mean "slow down" rather than "this page is broken"
+BACKOFF_STATUSES = {429, 503}
+
+
+def parse_retry_after(value):
+    """
+    Parses a Retry-After header (seconds or HTTP date) to seconds from now.
+    """
+    if not value:
+        return None
+    value = str(value).strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def fetch_crawl_delay(domain, user_agent="*", timeout=10):
+    """
+    Returns the robots.txt Crawl-delay of a domain in seconds, or None.
+    """
+    parser = RobotFileParser()
+    url = f"https://{domain}/robots.txt"
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as f:
+            parser.parse(f.read().decode("utf-8", errors="replace").splitlines())
+    except Exception as e:
+        logger.info(f"No robots.txt for {domain}: {e}")
+        return None
+    delay = parser.crawl_delay(user_agent)
+    return float(delay) if delay is not None else None
+
+
+@dataclass
+class DomainState:
+    delay: float
+    concurrency: int = 1
+    in_flight: int = 0
+    latency: float = None
+    requests: int = 0
+    errors: int = 0
+    timeouts: int = 0
+    crawl_delay: float = None
+    next_allowed: float = field(default=0.0, repr=False)
+
+
+class AutoThrottle:
+    """
+    Adaptive per-domain rate control (AIMD).
+
+    Each domain has a concurrency limit and a minimal delay between request
+    starts. Fast, successful responses (latency at or below target_latency)
+    raise concurrency by one and shorten the delay by delay_step; slow ones
+    lower concurrency by one. Errors, timeouts and 429/503 responses halve
+    concurrency and double the delay. Retry-After headers and robots.txt
+    Crawl-delay set hard lower bounds.
+
+    Usage:
+        throttle.acquire(domain)          # blocks until a slot is free
+        try:
+            ...                           # fetch the page
+        finally:
+            throttle.release(domain, latency=1.2, status=200)
+    """
+
+    def __init__(
+        self,
+        target_latency=3.0,
+        start_delay=1.0,
+        min_delay=0.0,
+        max_delay=60.0,
+        delay_step=0.25,
+        max_concurrency=4,
+        respect_robots=True,
+        crawl_delay_fetcher=fetch_crawl_delay,
+    ):
+        self.target_latency = target_latency
+        self.start_delay = start_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.delay_step = delay_step
+        self.max_concurrency = max_concurrency
+        self.respect_robots = respect_robots
+        self.crawl_delay_fetcher = crawl_delay_fetcher
+        self.domains = {}
+        self._condition = threading.Condition()
+
+    def _state(self, domain):
+        if domain not in self.domains:
+            # Fetch robots.txt without holding the lock (network I/O)
+            crawl_delay = None
+            if self.respect_robots and self.crawl_delay_fetcher:
+                self._condition.release()
+                try:
+                    crawl_delay = self.crawl_delay_fetcher(domain)
+                finally:
+                    self._condition.acquire()
+            self.domains.setdefault(
+                domain,
+                DomainState(
+                    delay=max(self.start_delay, crawl_delay or 0.0),
+                    crawl_delay=crawl_delay,
+                ),
+            )
+        return self.domains[domain]
+
+    def _floor(self, state):
+        return max(self.min_delay, state.crawl_delay or 0.0)
+
+    def acquire(self, domain):
+        """
+        Blocks until domain has a free concurrency slot and its delay has passed.
+        """
+        with self._condition:
+            state = self._state(domain)
+            while True:
+                now = time.monotonic()
+                if state.in_flight < state.concurrency and now >= state.next_allowed:
+                    break
+                if state.in_flight >= state.concurrency:
+                    self._condition.wait()
+                else:
+                    self._condition.wait(state.next_allowed - now)
+            state.in_flight += 1
+            state.requests += 1
+            state.next_allowed = now + state.delay
+
+    def release(
+        self,
+        domain,
+        latency=None,
+        status=None,
+        error=False,
+        timeout=False,
+        retry_after=None,
+    ):
+        """
+        Frees the slot taken by acquire() and adapts the domain's rate.
+        """
+        with self._condition:
+            state = self._state(domain)
+            state.in_flight = max(0, state.in_flight - 1)
+            if latency is not None:
+                state.latency = (
+                    latency
+                    if state.latency is None
+                    else 0.7 * state.latency + 0.3 * latency
+                )
+
+            if error or timeout or status in BACKOFF_STATUSES:
+                state.errors += 1
+                state.timeouts += int(timeout)
+                state.concurrency = max(1, state.concurrency // 2)
+                state.delay = min(self.max_delay, max(state.delay * 2, 1.0))
+            elif latency is not None and latency > self.target_latency:
+                state.concurrency = max(1, state.concurrency - 1)
+            else:
+                state.concurrency = min(self.max_concurrency, state.concurrency + 1)
+                state.delay = max(self._floor(state), state.delay - self.delay_step)
+
+            retry_after = parse_retry_after(retry_after)
+            if retry_after:
+                state.next_allowed = max(
+                    state.next_allowed, time.monotonic() + retry_after
+                )
+            self._condition.notify_all()
+
+    def snapshot(self):
+        """
+        Returns the current per-domain state as plain dicts (for metrics).
+        """
+        with self._condition:
+            return {
+                domain: {
+                    key: round(value, 3) if isinstance(value, float) else value
+                    for key, value in asdict(state).items()
+                    if key != "next_allowed"
+                }
+                for domain, state in self.domains.items()
+            }
+
+    def log_state(self):
+        logger.info("Throttle state", extra={"throttle": self.snapshot()})
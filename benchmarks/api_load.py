@@ -0,0 +1,130 @@
+"""
+Concurrent load test for the REST API.
+
+Fires requests at one or more targets with a fixed number of concurrent clients
+and reports throughput, latency percentiles and the effective concurrency per
+server worker (Little's law: throughput * mean latency / workers).
+
+Compare the WSGI (runserver/DRF) and ASGI (uvicorn/async views) paths:
+
+    python benchmarks/api_load.py \\
+        --target wsgi=http://localhost:8000/api/articles/ \\
+        --target asgi=http://localhost:8001/api/async/articles/ \\
+        --concurrency 32 --requests 500 --workers 2
+
+Detail endpoints are hit with random primary keys when the URL contains {pk}
+(e.g. after seeding a corpus with `manage.py seed_articles --count 1000000`):
+
+    python benchmarks/api_load.py \\
+        --target list=http://localhost:8000/api/articles/ \\
+        --target detail=http://localhost:8000/api/articles/{pk}/ \\
+        --pk-range 1:1000000 --concurrency 32 --requests 2000
+
+Only the standard library is required.
+"""
+
+import argparse
+import random
+import statistics
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+
+def fetch(url, timeout):
+    started = time.perf_counter()
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            response.read()
+            ok = 200 <= response.status < 400
+    except (urllib.error.URLError, OSError):
+        ok = False
+    return time.perf_counter() - started, ok
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, round(pct / 100 * (len(sorted_values) - 1)))
+    return sorted_values[index]
+
+
+def parse_pk_range(value):
+    low, _, high = value.partition(":")
+    return int(low), int(high or low)
+
+
+def run_target(url, requests, concurrency, timeout, pk_range=(1, 1)):
+    def request(_):
+        # {pk} in the URL: sample a random object per request
+        target = url.replace("{pk}", str(random.randint(*pk_range)))
+        return fetch(target, timeout)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        # Warm up connections and caches
+        list(pool.map(request, range(concurrency)))
+        started = time.perf_counter()
+        results = list(pool.map(request, range(requests)))
+        elapsed = time.perf_counter() - started
+
+    latencies = sorted(latency for latency, ok in results if ok)
+    return {
+        "requests": requests,
+        "errors": sum(1 for _, ok in results if not ok),
+        "elapsed": elapsed,
+        "throughput": len(latencies) / elapsed if elapsed else 0.0,
+        "mean": statistics.fmean(latencies) if latencies else 0.0,
+        "p50": percentile(latencies, 50),
+        "p90": percentile(latencies, 90),
+        "p95": percentile(latencies, 95),
+        "p99": percentile(latencies, 99),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--target",
+        action="append",
+        required=True,
+        help="NAME=URL to load test (repeatable).",
+    )
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Server worker processes behind each target.",
+    )
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument(
+        "--pk-range",
+        type=parse_pk_range,
+        default=(1, 1000),
+        help="MIN:MAX primary keys substituted for {pk} in target URLs.",
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{'target':<10} {'req/s':>8} {'p50 ms':>8} {'p90 ms':>8} {'p95 ms':>8}"
+        f" {'p99 ms':>8}"
+        f" {'errors':>7} {'conc/worker':>12}"
+    )
+    for target in args.target:
+        name, _, url = target.partition("=")
+        stats = run_target(
+            url, args.requests, args.concurrency, args.timeout, args.pk_range
+        )
+        per_worker = stats["throughput"] * stats["mean"] / args.workers
+        print(
+            f"{name:<10} {stats['throughput']:>8.1f} {stats['p50'] * 1000:>8.1f}"
+            f" {stats['p90'] * 1000:>8.1f} {stats['p95'] * 1000:>8.1f}"
+            f" {stats['p99'] * 1000:>8.1f}"
+            f" {stats['errors']:>7} {per_worker:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Import-time benchmark for the app modules.
+
+Runs ``python -X importtime`` in a fresh interpreter per module (after
+django.setup()) and reports the cumulative import time of the module and
+whether heavy scraping dependencies got imported with it:
+
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --repeat 10 api.views articles.scraper
+
+Uses DJANGO_SETTINGS_MODULE from the environment (default ArticleScraper.settings).
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_MODULES = [
+    "ArticleScraper.urls",
+    "api.views",
+    "articles.scraper",
+    "articles.management.commands.scrape_articles",
+    "articles.management.commands.reextract_articles",
+]
+HEAVY_MODULES = ["selenium", "webdriver_manager", "dateparser", "bs4"]
+
+SNIPPET = """
+import sys
+import django
+django.setup()
+import {module}
+print(",".join(m for m in {heavy!r} if m in sys.modules))
+"""
+
+
+def measure(module):
+    env = {**os.environ}
+    env.setdefault("DJANGO_SETTINGS_MODULE", "ArticleScraper.settings")
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            SNIPPET.format(module=module, heavy=HEAVY_MODULES),
+        ],
+        cwd=BASE_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative_us = 0
+    for line in result.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        parts = [part.strip() for part in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            cumulative_us = int(parts[1])
+    heavy = [name for name in result.stdout.strip().split(",") if name]
+    return cumulative_us, heavy
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'module':<50} {'median ms':>10}  heavy deps imported")
+    for module in args.modules:
+        runs = [measure(module) for _ in range(args.repeat)]
+        median_ms = statistics.median(us for us, _ in runs) / 1000
+        heavy = ", ".join(runs[-1][1]) or "-"
+        print(f"{module:<50} {median_ms:>10.1f}  {heavy}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Logging overhead per scraped page.
+
+Emits the records of a simulated scrape (a few messages plus the structured
+"Scrape finished" summary) through the old synchronous FileHandler setup and
+through the queue-based QueueListenerHandler, and reports the time spent on
+the calling (scraping) thread per page, plus the time the listener needs to
+drain the queue:
+
+    python benchmarks/logging_overhead.py --pages 20000
+"""
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from articles.log import JsonFormatter, QueueListenerHandler  # noqa: E402
+
+PHASES = {
+    "dedupe": 0.0011,
+    "driver_start": 0.8,
+    "fetch": 3.2,
+    "page_source": 0.05,
+    "extract": 0.12,
+    "save": 0.004,
+    "driver_quit": 0.1,
+}
+
+
+def log_page(logger, i):
+    url = f"https://example.com/article-{i}"
+    logger.info(f"Article saved: Example article {i} (17.10.2025 00:00:00)")
+    logger.info(
+        f"Scrape finished (saved): {url}",
+        extra={
+            "url": url,
+            "domain": "example.com",
+            "outcome": "saved",
+            "phases": PHASES,
+        },
+    )
+
+
+def run(handler, pages):
+    logger = logging.getLogger(f"bench.{id(handler)}")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.addHandler(handler)
+
+    started = time.perf_counter()
+    for i in range(pages):
+        log_page(logger, i)
+    hot_path = time.perf_counter() - started
+    handler.close()
+    total = time.perf_counter() - started
+    logger.removeHandler(handler)
+    return hot_path, total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, default=10000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        file_handler = logging.FileHandler(Path(tmp) / "sync.log", encoding="utf-8")
+        file_handler.setFormatter(
+            logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+        )
+        queue_handler = QueueListenerHandler(str(Path(tmp) / "queued.log"))
+        queue_handler.setFormatter(JsonFormatter())
+
+        print(f"{'setup':<32} {'hot path us/page':>17} {'incl. drain us/page':>20}")
+        for name, handler in [
+            ("FileHandler (text, sync)", file_handler),
+            ("QueueListenerHandler (JSON)", queue_handler),
+        ]:
+            hot_path, total = run(handler, args.pages)
+            print(
+                f"{name:<32} {hot_path / args.pages * 1e6:>17.1f}"
+                f" {total / args.pages * 1e6:>20.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
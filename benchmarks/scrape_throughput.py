@@ -0,0 +1,500 @@
+"""
+End-to-end scraping throughput against a local fixture site.
+
+Serves a generated site from a local HTTP server (server-rendered and
+JavaScript-rendered articles, 404/500 error pages, slow responses), runs the
+real `scrape_articles` command against it (browser, extraction, database
+writes) in a throwaway database, and reports pages per minute, per-phase
+latency percentiles and peak memory:
+
+    python benchmarks/scrape_throughput.py --pages 200 --workers 4 \\
+        --output benchmarks/baseline.json
+
+Compare a change against the stored baseline (exit status 1 when throughput
+or p90 latency regress by more than --max-regression percent):
+
+    python benchmarks/scrape_throughput.py --pages 200 --workers 8 --tabs 4 \\
+        --baseline benchmarks/baseline.json
+
+--database sqlite (default) uses a temporary SQLite file; --database postgres
+creates a test database next to the configured DB_NAME (the user needs
+CREATEDB) and drops it afterwards. A local Chrome is used unless
+REMOTE_SELENIUM=true; a remote browser must reach the fixture server, see
+--bind and --public-host.
+"""
+
+import argparse
+import io
+import json
+import logging
+import os
+import random
+import resource
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlparse
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+KINDS = ["ssr", "js", "slow", "missing", "error"]
+DEFAULT_MIX = "ssr=60,js=25,slow=5,missing=5,error=5"
+WORDS = (
+    "scraper browser article content extraction render network latency queue "
+    "worker database partition throttle domain cache memory profile archive "
+    "headline paragraph metadata schedule replica benchmark fixture"
+).split()
+POLISH_MONTHS = [
+    "stycznia",
+    "lutego",
+    "marca",
+    "kwietnia",
+    "maja",
+    "czerwca",
+    "lipca",
+    "sierpnia",
+    "września",
+    "października",
+    "listopada",
+    "grudnia",
+]
+MB = 1024 * 1024
+
+
+def parse_mix(value):
+    weights = {}
+    for part in value.split(","):
+        kind, _, weight = part.partition("=")
+        if kind not in KINDS:
+            raise argparse.ArgumentTypeError(f"Unknown page kind {kind!r}")
+        weights[kind] = float(weight)
+    if not any(weights.values()):
+        raise argparse.ArgumentTypeError("The page mix is empty.")
+    return weights
+
+
+class FixtureSite:
+    """
+    Deterministic pages of the benchmark site, generated from a seed.
+    """
+
+    def __init__(self, seed, slow_delay, js_delay):
+        self.seed = seed
+        self.slow_delay = slow_delay
+        self.js_delay = js_delay
+
+    def article(self, index):
+        rng = random.Random(f"{self.seed}-{index}")
+        published = datetime(2024, 1, 1) + timedelta(days=rng.randrange(600))
+        paragraphs = [
+            " ".join(rng.choice(WORDS) for _ in range(rng.randint(40, 90))).capitalize()
+            + ", with commas, details, and more."
+            for _ in range(rng.randint(4, 12))
+        ]
+        title = " ".join(rng.choice(WORDS) for _ in range(6)).capitalize()
+        return title, published, paragraphs
+
+    def ssr_page(self, index):
+        title, published, paragraphs = self.article(index)
+        # Alternate between the date sources the scraper understands
+        if index % 2:
+            date_head = (
+                '<meta property="article:published_time" '
+                f'content="{published:%Y-%m-%dT08:00:00Z}">'
+            )
+            date_body = ""
+        else:
+            date_head = ""
+            date_body = (
+                f"<p class='date'>{published.day} "
+                f"{POLISH_MONTHS[published.month - 1]} {published.year}</p>"
+            )
+        body = "".join(f"<p>{paragraph}</p>" for paragraph in paragraphs)
+        nav = "".join(f'<a href="/ssr/{i}">Related {i}</a> ' for i in range(20))
+        return (
+            f"<!DOCTYPE html><html><head><title>{title}</title>{date_head}</head>"
+            f"<body><nav>{nav}</nav><article><h1>{title}</h1>{date_body}{body}"
+            "</article><footer>Footer, all rights reserved.</footer></body></html>"
+        )
+
+    def js_page(self, index):
+        title, published, paragraphs = self.article(index)
+        data = json.dumps(
+            {
+                "title": title,
+                "date": published.strftime("%Y-%m-%d"),
+                "paragraphs": paragraphs,
+            }
+        )
+        return (
+            f"<!DOCTYPE html><html><head><title>{title}</title></head><body>"
+            "<div id='root'>Loading...</div><script>"
+            f"const data = {data};"
+            "setTimeout(() => {"
+            "const article = document.createElement('article');"
+            "const h1 = document.createElement('h1');"
+            "h1.textContent = data.title; article.appendChild(h1);"
+            "const time = document.createElement('time');"
+            "time.setAttribute('datetime', data.date);"
+            "time.textContent = data.date; article.appendChild(time);"
+            "for (const text of data.paragraphs) {"
+            "const p = document.createElement('p');"
+            "p.textContent = text; article.appendChild(p); }"
+            "document.getElementById('root').replaceWith(article);"
+            f"}}, {int(self.js_delay * 1000)});"
+            "</script></body></html>"
+        )
+
+    def error_page(self, status):
+        return (
+            f"<!DOCTYPE html><html><head><title>Error {status}</title></head>"
+            f"<body><main class='error'><h1>Error {status}</h1></main>"
+            "</body></html>"
+        )
+
+    def respond(self, path):
+        """
+        Returns (status, html) for a request path /<kind>/<index>.
+        """
+        if path == "/robots.txt":
+            return 200, "User-agent: *\nAllow: /\n"
+        parts = path.strip("/").split("/")
+        if len(parts) != 2 or parts[0] not in KINDS or not parts[1].isdigit():
+            return 404, self.error_page(404)
+        kind, index = parts[0], int(parts[1])
+        if kind == "ssr":
+            return 200, self.ssr_page(index)
+        if kind == "js":
+            return 200, self.js_page(index)
+        if kind == "slow":
+            time.sleep(self.slow_delay)
+            return 200, self.ssr_page(index)
+        status = 404 if kind == "missing" else 500
+        return status, self.error_page(status)
+
+
+def start_server(site, bind):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            status, body = site.respond(urlparse(self.path).path)
+            data = body.encode("utf-8")
+            content_type = "text/plain" if self.path == "/robots.txt" else "text/html"
+            self.send_response(status)
+            self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((bind, 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def page_urls(base_url, pages, mix, seed):
+    rng = random.Random(seed)
+    kinds = rng.choices(list(mix), weights=list(mix.values()), k=pages)
+    return [f"{base_url}/{kind}/{index}" for index, kind in enumerate(kinds)]
+
+
+def setup_django(database, tmp_dir):
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "ArticleScraper.settings")
+    if database == "sqlite":
+        # The project settings require these even when they are unused
+        for name in ["SECRET_KEY", "DB_NAME", "DB_USER", "DB_PASSWORD", "DB_HOST"]:
+            os.environ.setdefault(name, "benchmark")
+        os.environ.setdefault("DB_PORT", "5432")
+
+    import django
+    from django.conf import settings
+
+    if database == "sqlite":
+        settings.DATABASES["default"] = {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": str(Path(tmp_dir) / "benchmark.sqlite3"),
+            "TEST": {"NAME": str(Path(tmp_dir) / "benchmark-test.sqlite3")},
+            "OPTIONS": {"timeout": 30},
+        }
+    django.setup()
+
+    from django.db import connection
+
+    old_name = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+    return old_name
+
+
+class ScrapeRecords(logging.Handler):
+    """
+    Collects the final "Scrape finished" record of every scraped page.
+    """
+
+    def __init__(self):
+        super().__init__(logging.INFO)
+        self.records = []
+
+    def emit(self, record):
+        # Called under the handler lock, so worker threads don't interleave
+        if getattr(record, "phases", None) is not None and hasattr(record, "outcome"):
+            self.records.append(
+                {"outcome": record.outcome, "phases": dict(record.phases)}
+            )
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, round(pct / 100 * (len(sorted_values) - 1)))
+    return sorted_values[index]
+
+
+def latency_stats(values):
+    values = sorted(values)
+    return {
+        "count": len(values),
+        "mean": statistics.fmean(values) if values else 0.0,
+        "p50": percentile(values, 50),
+        "p90": percentile(values, 90),
+        "p99": percentile(values, 99),
+    }
+
+
+def summarize(records, elapsed, command):
+    outcomes = {}
+    phases = {}
+    totals = []
+    for record in records:
+        outcomes[record["outcome"]] = outcomes.get(record["outcome"], 0) + 1
+        for name, seconds in record["phases"].items():
+            phases.setdefault(name, []).append(seconds)
+        totals.append(sum(record["phases"].values()))
+
+    browser_rss = [s.last_rss for s in command.sessions if s.last_rss]
+    return {
+        "elapsed": elapsed,
+        "pages": len(records),
+        "pages_per_minute": len(records) / elapsed * 60 if elapsed else 0.0,
+        "outcomes": outcomes,
+        "total": latency_stats(totals),
+        "phases": {name: latency_stats(values) for name, values in phases.items()},
+        "memory": {
+            # ru_maxrss is in kilobytes on Linux
+            "python_max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            / 1024,
+            "python_peak_traced_mb": max(command.peaks) / MB if command.peaks else None,
+            "browser_rss_mb": max(browser_rss) / MB if browser_rss else None,
+        },
+    }
+
+
+def run(args):
+    from django.core.management import call_command
+
+    from articles.management.commands.scrape_articles import Command
+    from articles.models import ExtractionProfile
+
+    site = FixtureSite(args.seed, args.slow_delay, args.js_delay)
+    server = start_server(site, args.bind)
+    port = server.server_address[1]
+    base_url = f"http://{args.public_host}:{port}"
+    urls = page_urls(base_url, args.pages, args.mix, args.seed)
+    # Wait for the rendered article (or error page) instead of the fixed delay
+    ExtractionProfile.objects.create(
+        source_domain=f"{args.public_host}:{port}",
+        wait_selector="article, main.error",
+    )
+
+    collector = ScrapeRecords()
+    scraper_logger = logging.getLogger("articles.scraper")
+    scraper_logger.addHandler(collector)
+    if not scraper_logger.isEnabledFor(logging.INFO):
+        scraper_logger.setLevel(logging.INFO)
+
+    workers = max(args.workers, args.tabs)
+    options = [
+        "--workers",
+        str(args.workers),
+        "--tabs",
+        str(args.tabs),
+        "--max-domain-concurrency",
+        str(args.max_domain_concurrency or workers),
+    ]
+    if args.in_browser:
+        options.append("--in-browser")
+    if args.track_memory:
+        options.append("--track-memory")
+
+    command = Command()
+    out = sys.stdout if args.verbose else io.StringIO()
+    print(f"Scraping {len(urls)} page(s) from {base_url} with {workers} worker(s)...")
+    started = time.perf_counter()
+    try:
+        call_command(command, *urls, *options, stdout=out)
+    finally:
+        elapsed = time.perf_counter() - started
+        scraper_logger.removeHandler(collector)
+        server.shutdown()
+
+    results = summarize(collector.records, elapsed, command)
+    results["created"] = datetime.now().isoformat(timespec="seconds")
+    results["config"] = {
+        "pages": args.pages,
+        "workers": args.workers,
+        "tabs": args.tabs,
+        "in_browser": args.in_browser,
+        "database": args.database,
+        "mix": args.mix,
+        "slow_delay": args.slow_delay,
+        "js_delay": args.js_delay,
+        "seed": args.seed,
+    }
+    return results
+
+
+def print_results(results):
+    print(
+        f"\n{results['pages']} page(s) in {results['elapsed']:.1f}s: "
+        f"{results['pages_per_minute']:.1f} pages/min"
+    )
+    print(
+        "Outcomes: "
+        + ", ".join(f"{k} {v}" for k, v in sorted(results["outcomes"].items()))
+    )
+    print(f"\n{'phase':<14} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'count':>7}")
+    rows = sorted(results["phases"].items()) + [("total", results["total"])]
+    for name, stats in rows:
+        print(
+            f"{name:<14} {stats['p50'] * 1000:>9.1f} {stats['p90'] * 1000:>9.1f}"
+            f" {stats['p99'] * 1000:>9.1f} {stats['count']:>7}"
+        )
+    memory = results["memory"]
+    print(f"\nPython max RSS: {memory['python_max_rss_mb']:.1f} MB")
+    if memory["python_peak_traced_mb"] is not None:
+        print(
+            f"Peak Python memory per scrape: {memory['python_peak_traced_mb']:.1f} MB"
+        )
+    if memory["browser_rss_mb"] is not None:
+        print(f"Browser RSS: {memory['browser_rss_mb']:.1f} MB")
+
+
+def compare(results, baseline, max_regression):
+    """
+    Prints the change of the key metrics against a baseline.
+
+    Returns:
+        list: Names of the metrics that regressed by more than max_regression %.
+    """
+    metrics = [
+        ("pages/min", lambda r: r["pages_per_minute"], True),
+        ("total p50", lambda r: r["total"]["p50"], False),
+        ("total p90", lambda r: r["total"]["p90"], False),
+        ("fetch p90", lambda r: r["phases"].get("fetch", {}).get("p90"), False),
+        ("extract p90", lambda r: r["phases"].get("extract", {}).get("p90"), False),
+        ("python RSS MB", lambda r: r["memory"]["python_max_rss_mb"], False),
+    ]
+    if baseline.get("config") != results["config"]:
+        print("\nNote: the baseline was recorded with a different configuration.")
+    print(f"\n{'metric':<14} {'baseline':>10} {'current':>10} {'change':>8}")
+    regressions = []
+    for name, value, higher_is_better in metrics:
+        old, new = value(baseline), value(results)
+        if not old or new is None:
+            continue
+        change = (new - old) / old * 100
+        print(f"{name:<14} {old:>10.3f} {new:>10.3f} {change:>+7.1f}%")
+        worse = -change if higher_is_better else change
+        if name in ("pages/min", "total p90") and worse > max_regression:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--tabs", type=int, default=1)
+    parser.add_argument("--in-browser", action="store_true")
+    parser.add_argument(
+        "--max-domain-concurrency",
+        type=int,
+        help="Throttle limit for the fixture site (default: the worker count).",
+    )
+    parser.add_argument(
+        "--track-memory",
+        action="store_true",
+        help="Also measure peak Python memory per scrape (tracemalloc, slower); "
+        "needs --workers 1 and --tabs 1.",
+    )
+    parser.add_argument("--database", choices=["sqlite", "postgres"], default="sqlite")
+    parser.add_argument(
+        "--mix",
+        type=parse_mix,
+        default=parse_mix(DEFAULT_MIX),
+        help=f"Page kind weights (default: {DEFAULT_MIX}).",
+    )
+    parser.add_argument(
+        "--slow-delay", type=float, default=2.0, help="Seconds before slow pages."
+    )
+    parser.add_argument(
+        "--js-delay", type=float, default=0.3, help="Render delay of JS pages (s)."
+    )
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument(
+        "--bind", default="127.0.0.1", help="Fixture server address (default: local)."
+    )
+    parser.add_argument(
+        "--public-host",
+        default="127.0.0.1",
+        help="Host name the browser uses for the fixture server "
+        "(e.g. host.docker.internal for a remote Selenium).",
+    )
+    parser.add_argument("--output", help="Write the results to this JSON file.")
+    parser.add_argument("--baseline", help="Compare with results from this JSON file.")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=10.0,
+        help="Percent drop of pages/min or rise of total p90 that fails "
+        "--baseline (default: 10).",
+    )
+    parser.add_argument(
+        "--verbose", action="store_true", help="Show the scrape_articles output."
+    )
+    args = parser.parse_args()
+    if args.track_memory and (args.workers > 1 or args.tabs > 1):
+        parser.error("--track-memory needs --workers 1 and --tabs 1.")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        old_name = setup_django(args.database, tmp)
+        from django.db import connection
+
+        try:
+            results = run(args)
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+    print_results(results)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.output}")
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.max_regression)
+        if regressions:
+            print(
+                f"\nRegressed beyond {args.max_regression}%: {', '.join(regressions)}"
+            )
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()